@@ -22,6 +22,7 @@ class OMIConfig:
     BASE_URL = os.getenv("OMI_BASE_URL", "https://api.omi.me")
     USER_UID = os.getenv("OMI_USER_UID")
     MCP_SERVER_URL = os.getenv("MCP_SERVER_URL")
+    REQUEST_TIMEOUT = float(os.getenv("OMI_REQUEST_TIMEOUT", "20.0"))  # seconds
 
     @classmethod
     def validate(cls):
@@ -46,6 +47,9 @@ class GeminiConfig:
     FALLBACK_MODEL = os.getenv("GEMINI_FALLBACK_MODEL", "gemini-2.5-flash")
     LITE_MODEL = os.getenv("GEMINI_LITE_MODEL", "gemini-2.5-flash-lite")
 
+    # Seconds a psychological analysis call may run before the next model is started alongside it
+    ANALYSIS_HEDGE_DELAY = float(os.getenv("GEMINI_ANALYSIS_HEDGE_DELAY", "20.0"))
+
     # Rate limiting settings
     RATE_LIMIT_REQUESTS_PER_MINUTE = int(os.getenv("GEMINI_RATE_LIMIT_RPM", "60"))
     RATE_LIMIT_REQUESTS_PER_HOUR = int(os.getenv("GEMINI_RATE_LIMIT_RPH", "1000"))
@@ -79,6 +83,8 @@ class WebhookConfig:
     # Use PORT environment variable for Railway deployment, default to 8000
     PORT = int(os.getenv("PORT", "8000"))
     BASE_URL = os.getenv("WEBHOOK_BASE_URL", f"http://localhost:{PORT}")
+    # Threads available to asyncio.to_thread for blocking Gemini / OMI calls
+    WORKER_THREADS = int(os.getenv("WEBHOOK_WORKER_THREADS", "32"))
 
 # Security Settings
 class SecurityConfig:
@@ -153,6 +159,13 @@ class AppSettings:
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR = BASE_DIR / "logs"
 
+    # Analyses whose ADHD and anxiety scores are below this, with a neutral or
+    # unknown tone, skip the memory save and workspace automation
+    ANALYSIS_THRESHOLD = int(os.getenv("ANALYSIS_THRESHOLD", "3"))
+
+    # Sample process RSS around each webhook step (adds procfs reads per step)
+    PROFILE_MEMORY = os.getenv("PROFILE_MEMORY", "false").lower() == "true"
+
     # Ensure logs directory exists
     LOG_DIR.mkdir(exist_ok=True)
 
@@ -3,10 +3,11 @@ API Utilities for Rate Limiting and Retry Logic
 Provides rate limiting and exponential backoff for external API calls
 """
 import time
+import random
 import threading
 import logging
 from typing import Callable, Any, Optional
-from functools import wraps
+from functools import partial, wraps, lru_cache
 from config.settings import GeminiConfig, AppSettings
 
 # Setup logging if not already configured
@@ -30,6 +31,9 @@ class RateLimiter:
         self.last_minute_refill = time.time()
         self.last_hour_refill = time.time()
 
+        # No tokens are handed out before this time, set when the API reports a 429
+        self.paused_until = 0.0
+
         # Thread safety
         self.lock = threading.Lock()
 
@@ -62,6 +66,9 @@ class RateLimiter:
         with self.lock:
             self._refill_tokens()
 
+            if self.paused_until > self.last_minute_refill:
+                return False
+
             if self.minute_tokens >= tokens and self.hour_tokens >= tokens:
                 self.minute_tokens -= tokens
                 self.hour_tokens -= tokens
@@ -69,28 +76,54 @@ class RateLimiter:
 
             return False
 
-    def wait_for_tokens(self, tokens: int = 1, timeout: float = 300.0) -> bool:
+    def pause(self, seconds: float):
+        """
+        Hand out no tokens for the given time, e.g. after the API rejected a call
+
+        Args:
+            seconds: Time to hold back callers; an existing longer pause is kept
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.time() + seconds)
+
+    def wait_for_tokens(self, tokens: int = 1, timeout: float = 300.0,
+                        cancel_event: Optional[threading.Event] = None) -> bool:
         """
         Wait until tokens are available or timeout
 
         Args:
             tokens: Number of tokens to acquire
             timeout: Maximum time to wait in seconds
+            cancel_event: Once set, stop waiting without taking tokens
 
         Returns:
-            True if tokens acquired, False if timeout
+            True if tokens acquired, False if timeout or cancelled
         """
         start_time = time.time()
 
         while time.time() - start_time < timeout:
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+
             if self.acquire(tokens):
                 return True
 
             # Wait a bit before checking again
-            time.sleep(0.1)
+            if cancel_event is not None:
+                cancel_event.wait(0.1)
+            else:
+                time.sleep(0.1)
 
         return False
 
+class RetryCancelled(Exception):
+    """Raised when a retried call is cancelled before its next attempt"""
+
+
+class RateLimitTimeout(Exception):
+    """Raised when no rate limit token became available in time; not retried"""
+
+
 class ExponentialBackoff:
     """Exponential backoff retry logic"""
 
@@ -101,38 +134,51 @@ class ExponentialBackoff:
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
 
-    def retry(self, func: Callable, *args, **kwargs) -> Any:
+    def retry(self, func: Callable, *args,
+              cancel_event: Optional[threading.Event] = None, **kwargs) -> Any:
         """
         Execute function with exponential backoff retry
 
         Args:
             func: Function to retry
             *args: Positional arguments for function
+            cancel_event: Once set, no further attempts are made
             **kwargs: Keyword arguments for function
 
         Returns:
             Function result
 
         Raises:
+            RetryCancelled if cancel_event is set before an attempt
+            RateLimitTimeout at once, since the limiter already waited its full timeout
             Last exception if all retries fail
         """
         last_exception = None
 
         for attempt in range(self.max_retries + 1):  # +1 for initial attempt
+            if cancel_event is not None and cancel_event.is_set():
+                raise RetryCancelled(f"Cancelled before attempt {attempt + 1}")
+
             try:
                 return func(*args, **kwargs)
+            except (RetryCancelled, RateLimitTimeout):
+                raise
             except Exception as e:
                 last_exception = e
 
                 if attempt < self.max_retries:
                     delay = min(self.initial_delay * (self.backoff_factor ** attempt), self.max_delay)
                     logger.warning(f"Attempt {attempt + 1} failed, retrying in {delay:.2f}s: {str(e)}")
-                    time.sleep(delay)
+                    if cancel_event is not None:
+                        # Wake early if the call is cancelled during the backoff
+                        cancel_event.wait(delay)
+                    else:
+                        time.sleep(delay)
                 else:
                     logger.error(f"All {self.max_retries + 1} attempts failed: {str(e)}")
                     raise last_exception
 
-# Global rate limiter instance for Gemini API
+# Global rate limiter instance for Gemini API, shared by every client in the process
 _gemini_rate_limiter = RateLimiter(
     requests_per_minute=GeminiConfig.RATE_LIMIT_REQUESTS_PER_MINUTE,
     requests_per_hour=GeminiConfig.RATE_LIMIT_REQUESTS_PER_HOUR
@@ -145,6 +191,9 @@ _gemini_backoff = ExponentialBackoff(
     max_delay=GeminiConfig.MAX_RETRY_DELAY
 )
 
+# Seconds all Gemini calls wait after the API answers 429 RESOURCE_EXHAUSTED
+GEMINI_QUOTA_PAUSE_SECONDS = 10.0
+
 def with_gemini_rate_limit(func: Callable) -> Callable:
     """
     Decorator to apply Gemini API rate limiting
@@ -153,15 +202,33 @@ def with_gemini_rate_limit(func: Callable) -> Callable:
         func: Function to decorate
 
     Returns:
-        Decorated function with rate limiting
+        Decorated function with rate limiting; pass cancel_event to give up
+        once the result is no longer needed, and on_acquire to be called
+        when a token is held and the request is about to be sent
     """
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        if not _gemini_rate_limiter.wait_for_tokens(tokens=1, timeout=300.0):
-            raise Exception("Rate limit timeout exceeded")
+    def wrapper(*args, cancel_event: Optional[threading.Event] = None,
+                on_acquire: Optional[Callable[[], None]] = None, **kwargs):
+        if not _gemini_rate_limiter.wait_for_tokens(tokens=1, timeout=300.0, cancel_event=cancel_event):
+            if cancel_event is not None and cancel_event.is_set():
+                raise RetryCancelled("Cancelled while waiting for a rate limit token")
+            raise RateLimitTimeout("Rate limit timeout exceeded")
+
+        # Cancelled while the token was being taken: don't send a request nobody wants
+        if cancel_event is not None and cancel_event.is_set():
+            raise RetryCancelled("Cancelled before the request was sent")
 
         logger.debug("Rate limit acquired for Gemini API call")
-        return func(*args, **kwargs)
+        if on_acquire is not None:
+            on_acquire()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            # The quota is per project, so every caller backs off, not just this one
+            if getattr(e, 'code', None) == 429:
+                logger.warning(f"Gemini quota exhausted, pausing calls for {GEMINI_QUOTA_PAUSE_SECONDS:.0f}s")
+                _gemini_rate_limiter.pause(GEMINI_QUOTA_PAUSE_SECONDS)
+            raise
 
     return wrapper
 
@@ -173,11 +240,12 @@ def with_gemini_retry(func: Callable) -> Callable:
         func: Function to decorate
 
     Returns:
-        Decorated function with retry logic
+        Decorated function with retry logic; pass cancel_event to stop
+        retrying once the result is no longer needed
     """
     @wraps(func)
-    def wrapper(*args, **kwargs):
-        return _gemini_backoff.retry(func, *args, **kwargs)
+    def wrapper(*args, cancel_event: Optional[threading.Event] = None, **kwargs):
+        return _gemini_backoff.retry(func, *args, cancel_event=cancel_event, **kwargs)
 
     return wrapper
 
@@ -189,9 +257,19 @@ def with_gemini_rate_limit_and_retry(func: Callable) -> Callable:
         func: Function to decorate
 
     Returns:
-        Decorated function with rate limiting and retry
+        Decorated function with rate limiting and retry; accepts the
+        cancel_event and on_acquire keywords of both decorators
     """
-    return with_gemini_rate_limit(with_gemini_retry(func))
+    limited = with_gemini_rate_limit(func)
+
+    @wraps(func)
+    def wrapper(*args, cancel_event: Optional[threading.Event] = None,
+                on_acquire: Optional[Callable[[], None]] = None, **kwargs):
+        # Each attempt takes a token, so retries also wait out a quota pause
+        attempt = partial(limited, cancel_event=cancel_event, on_acquire=on_acquire)
+        return _gemini_backoff.retry(attempt, *args, cancel_event=cancel_event, **kwargs)
+
+    return wrapper
 
 # Utility functions for manual use
 def wait_for_gemini_rate_limit(tokens: int = 1, timeout: float = 300.0) -> bool:
@@ -202,19 +280,88 @@ def retry_gemini_call(func: Callable, *args, **kwargs) -> Any:
     """Retry a Gemini API call with exponential backoff"""
     return _gemini_backoff.retry(func, *args, **kwargs)
 
+# Idle seconds a pooled Gemini connection stays open; httpx's 5s default
+# closes it between webhooks, so the next call pays a new TLS handshake
+GEMINI_KEEPALIVE_EXPIRY_SECONDS = 90.0
+
+@lru_cache(maxsize=None)
+def get_gemini_client(api_key: str) -> Any:
+    """
+    Shared Gemini client for an API key
+
+    All analyzers reuse one client, and with it one HTTP connection pool,
+    instead of each opening its own TLS connections. google.genai is
+    imported here so OMI-only users of this module skip its ~1.6s import.
+    """
+    import httpx
+    from google import genai
+    from google.genai import types
+
+    limits = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=GEMINI_KEEPALIVE_EXPIRY_SECONDS
+    )
+    return genai.Client(api_key=api_key, http_options=types.HttpOptions(client_args={"limits": limits}))
+
 # HTTP retry utilities for OMI API
 class HTTPRetry:
-    """HTTP retry logic with exponential backoff"""
+    """HTTP retry logic with jittered exponential backoff and a shared retry budget"""
 
     def __init__(self, max_retries: int = 3, initial_delay: float = 1.0,
                  max_delay: float = 30.0, backoff_factor: float = 2.0,
-                 retry_status_codes: Optional[set] = None):
+                 retry_status_codes: Optional[set] = None,
+                 retry_budget_per_minute: int = 30):
         self.max_retries = max_retries
         self.initial_delay = initial_delay
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
         self.retry_status_codes = retry_status_codes or {429, 500, 502, 503, 504}
 
+        # Token bucket of retries shared by all callers, so an outage
+        # can't be amplified into a retry storm
+        self.retry_budget_per_minute = retry_budget_per_minute
+        self._budget_tokens = float(retry_budget_per_minute)
+        self._budget_refill = time.monotonic()
+        self._budget_lock = threading.Lock()
+
+    def _take_retry_token(self) -> bool:
+        """Spend one retry from the shared budget; False when it is exhausted"""
+        with self._budget_lock:
+            now = time.monotonic()
+            self._budget_tokens = min(
+                float(self.retry_budget_per_minute),
+                self._budget_tokens + (now - self._budget_refill) * self.retry_budget_per_minute / 60
+            )
+            self._budget_refill = now
+
+            if self._budget_tokens < 1:
+                return False
+            self._budget_tokens -= 1
+            return True
+
+    def _get_delay(self, attempt: int, response: Any = None) -> float:
+        """
+        Delay before the next attempt
+
+        Honors a numeric Retry-After header, otherwise uses full jitter over
+        the exponential backoff window.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            response: Response that triggered the retry, if any
+
+        Returns:
+            Delay in seconds, capped at max_delay
+        """
+        if response is not None:
+            retry_after = getattr(response, 'headers', {}).get('Retry-After')
+            if isinstance(retry_after, str) and retry_after.strip().isdigit():
+                return min(float(retry_after), self.max_delay)
+
+        window = min(self.initial_delay * (self.backoff_factor ** attempt), self.max_delay)
+        return random.uniform(0, window)
+
     def retry(self, func: Callable, *args, **kwargs) -> Any:
         """
         Execute HTTP function with exponential backoff retry
@@ -239,7 +386,11 @@ class HTTPRetry:
                 # Check if we should retry based on status code
                 if response.status_code in self.retry_status_codes:
                     if attempt < self.max_retries:
-                        delay = min(self.initial_delay * (self.backoff_factor ** attempt), self.max_delay)
+                        if not self._take_retry_token():
+                            logger.warning(f"HTTP {response.status_code} on attempt {attempt + 1}, retry budget exhausted")
+                            return response
+
+                        delay = self._get_delay(attempt, response)
                         logger.warning(f"HTTP {response.status_code} on attempt {attempt + 1}, retrying in {delay:.2f}s")
                         time.sleep(delay)
                         continue
@@ -250,15 +401,18 @@ class HTTPRetry:
             except Exception as e:
                 last_exception = e
 
-                if attempt < self.max_retries:
-                    delay = min(self.initial_delay * (self.backoff_factor ** attempt), self.max_delay)
-                    logger.warning(f"HTTP request failed on attempt {attempt + 1}, retrying in {delay:.2f}s: {str(e)}")
-                    time.sleep(delay)
-                    continue
-                else:
+                if attempt >= self.max_retries:
                     logger.error(f"All {self.max_retries + 1} HTTP attempts failed: {str(e)}")
                     raise last_exception
 
+                if not self._take_retry_token():
+                    logger.error(f"HTTP request failed on attempt {attempt + 1}, retry budget exhausted: {str(e)}")
+                    raise last_exception
+
+                delay = self._get_delay(attempt)
+                logger.warning(f"HTTP request failed on attempt {attempt + 1}, retrying in {delay:.2f}s: {str(e)}")
+                time.sleep(delay)
+
 # Global HTTP retry instance for OMI API
 _omi_http_retry = HTTPRetry()
 
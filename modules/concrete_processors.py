@@ -27,7 +27,7 @@ class GeminiTextProcessor(TextProcessor, LanguageProcessor):
 
     def process(self, input_data: str, **kwargs) -> ProcessingResult:
         """Process text with optional language detection/translation"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Language detection if enabled
@@ -43,7 +43,7 @@ class GeminiTextProcessor(TextProcessor, LanguageProcessor):
                     "language_info": lang_info,
                     "input_length": len(input_data)
                 },
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 model_used="placeholder"  # Would be actual Gemini model
             )
 
@@ -56,7 +56,7 @@ class GeminiTextProcessor(TextProcessor, LanguageProcessor):
                 success=False,
                 modality=self.modality_type,
                 error=str(e),
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
 
 class GeminiAudioProcessor(AudioProcessor, LanguageProcessor):
@@ -68,7 +68,7 @@ class GeminiAudioProcessor(AudioProcessor, LanguageProcessor):
 
     def process(self, input_data: Union[bytes, BinaryIO], **kwargs) -> ProcessingResult:
         """Process audio input"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Validate input
@@ -94,7 +94,7 @@ class GeminiAudioProcessor(AudioProcessor, LanguageProcessor):
                     "sample_rate": self.sample_rate,
                     "channels": self.channels
                 },
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 model_used=MultimodalConfig.AUDIO_MODEL
             )
 
@@ -107,7 +107,7 @@ class GeminiAudioProcessor(AudioProcessor, LanguageProcessor):
                 success=False,
                 modality=self.modality_type,
                 error=str(e),
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
 
 class GeminiImageProcessor(ImageProcessor, LanguageProcessor):
@@ -119,7 +119,7 @@ class GeminiImageProcessor(ImageProcessor, LanguageProcessor):
 
     def process(self, input_data: Union[bytes, BinaryIO], **kwargs) -> ProcessingResult:
         """Process image input"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Validate input
@@ -144,7 +144,7 @@ class GeminiImageProcessor(ImageProcessor, LanguageProcessor):
                     "input_size": len(input_data) if isinstance(input_data, bytes) else "unknown",
                     "supported_formats": self.supported_formats
                 },
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 model_used=MultimodalConfig.IMAGE_MODEL
             )
 
@@ -157,7 +157,7 @@ class GeminiImageProcessor(ImageProcessor, LanguageProcessor):
                 success=False,
                 modality=self.modality_type,
                 error=str(e),
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
 
 # Factory functions for easy instantiation
@@ -6,7 +6,7 @@ import google.genai as genai
 from google.genai import types
 from typing import List, Dict, Any, Optional
 from config.settings import GeminiConfig, AppSettings
-from modules.api_utils import with_gemini_rate_limit_and_retry
+from modules.api_utils import get_gemini_client, with_gemini_rate_limit_and_retry
 import logging
 import numpy as np
 
@@ -31,7 +31,7 @@ class MemoryEmbedder:
         """
         try:
             GeminiConfig.validate()
-            self.client = genai.Client(api_key=GeminiConfig.API_KEY)
+            self.client = get_gemini_client(GeminiConfig.API_KEY)
             logger.debug("Gemini client initialized for embeddings")
         except Exception as e:
             logger.error("Failed to initialize Gemini client", exc_info=True, extra={
@@ -24,19 +24,20 @@ class ModalityType(Enum):
     IMAGE = "image"
     VIDEO = "video"  # Future extension
 
+@dataclass(slots=True)
 class ProcessingResult:
     """Standardized result structure for all processors"""
-
-    def __init__(self, success: bool, modality: ModalityType, content: Any = None,
-                 metadata: Optional[Dict[str, Any]] = None, error: Optional[str] = None,
-                 processing_time: Optional[float] = None, model_used: Optional[str] = None):
-        self.success = success
-        self.modality = modality
-        self.content = content  # Processed content (text, features, etc.)
-        self.metadata = metadata or {}
-        self.error = error
-        self.processing_time = processing_time
-        self.model_used = model_used
+    success: bool
+    modality: ModalityType
+    content: Any = None  # Processed content (text, features, etc.)
+    metadata: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    processing_time: Optional[float] = None
+    model_used: Optional[str] = None
+
+    def __post_init__(self):
+        if self.metadata is None:
+            self.metadata = {}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
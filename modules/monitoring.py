@@ -8,34 +8,67 @@ Provides comprehensive monitoring including:
 - System resource monitoring
 """
 
+import sys
 import time
+import functools
+import operator
 import psutil
 import logging
-from typing import Dict, Any, List, Optional, DefaultDict, Deque
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional, DefaultDict, Deque, Tuple
+from datetime import datetime, timezone
+from collections import defaultdict, deque, Counter
 import asyncio
 import json
 import os
-from dataclasses import dataclass, asdict
-from enum import Enum
+from dataclasses import dataclass
+from enum import StrEnum
 
 logger = logging.getLogger(__name__)
 
-class AlertLevel(Enum):
+NS_PER_MINUTE = 60 * 1_000_000_000
+
+def format_timestamp_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as an ISO 8601 UTC string"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
+
+def ttl_cached(seconds: float):
+    """Cache a method's default-argument result per instance for `seconds`
+
+    Calls with explicit arguments always bypass the cache.
+    """
+    def decorator(method):
+        attr = f'_{method.__name__}_cached'
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if args or kwargs:
+                return method(self, *args, **kwargs)
+
+            now = time.monotonic()
+            cached = self.__dict__.get(attr)
+            if cached is not None and now - cached[0] < seconds:
+                return cached[1]
+
+            result = method(self)
+            self.__dict__[attr] = (now, result)
+            return result
+        return wrapper
+    return decorator
+
+class AlertLevel(StrEnum):
     INFO = "info"
     WARNING = "warning"
     ERROR = "error"
     CRITICAL = "critical"
 
-class AlertType(Enum):
+class AlertType(StrEnum):
     PERFORMANCE = "performance"
     ERROR_RATE = "error_rate"
     SYSTEM_RESOURCE = "system_resource"
     SERVICE_UNAVAILABLE = "service_unavailable"
     API_FAILURE = "api_failure"
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """Alert data structure"""
     id: str
@@ -43,18 +76,23 @@ class Alert:
     level: AlertLevel
     message: str
     details: Dict[str, Any]
-    timestamp: datetime
+    timestamp: int  # time.time_ns()
     resolved: bool = False
-    resolved_at: Optional[datetime] = None
+    resolved_at: Optional[int] = None  # time.time_ns()
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data['type'] = self.type.value
-        data['level'] = self.level.value
-        data['timestamp'] = self.timestamp.isoformat()
-        if self.resolved_at:
-            data['resolved_at'] = self.resolved_at.isoformat()
-        return data
+        # Built explicitly: asdict() deep-copies details on every call.
+        # details is treated as immutable once the alert is created.
+        return {
+            'id': self.id,
+            'type': self.type,
+            'level': self.level,
+            'message': self.message,
+            'details': self.details,
+            'timestamp': format_timestamp_ns(self.timestamp),
+            'resolved': self.resolved,
+            'resolved_at': format_timestamp_ns(self.resolved_at) if self.resolved_at else None
+        }
 
 class MetricsCollector:
     """Collects and aggregates performance metrics"""
@@ -69,10 +107,28 @@ class MetricsCollector:
         self.error_count = 0
         self.last_reset = datetime.now()
 
+        # Running sums over the default window so the alert loop and /metrics
+        # don't rescan history; entries are dropped as they age out
+        self.window_minutes = 5
+        self._proc_window: Deque[Tuple[int, float, bool, int, int, int, int]] = deque()
+        self._proc_count = 0
+        self._proc_time_sum = 0.0
+        self._proc_success_count = 0
+        self._proc_steps_sum = 0
+        self._proc_errors_sum = 0
+        self._proc_warnings_sum = 0
+        self._proc_critical_sum = 0
+        self._error_window: Deque[Tuple[int, str]] = deque()
+        self._errors_by_type: Counter = Counter()
+
+        # Interned per-endpoint/status metric keys, built once per distinct value
+        self._rt_key_cache: Dict[str, str] = {}
+        self._status_key_cache: Dict[int, str] = {}
+
     def record_request(self, method: str, endpoint: str, status_code: int, response_time: float,
                       user_id: Optional[str] = None):
         """Record HTTP request metrics"""
-        timestamp = datetime.now()
+        timestamp = time.time_ns()
 
         self.metrics['requests_total'].append({
             'timestamp': timestamp,
@@ -86,15 +142,21 @@ class MetricsCollector:
         self.request_count += 1
 
         # Track response time by endpoint
-        self.metrics[f'response_time_{endpoint}'].append(response_time)
+        rt_key = self._rt_key_cache.get(endpoint)
+        if rt_key is None:
+            rt_key = self._rt_key_cache[endpoint] = sys.intern(f'response_time_{endpoint}')
+        self.metrics[rt_key].append(response_time)
 
         # Track status codes
-        self.metrics[f'status_{status_code}'].append(1)
+        status_key = self._status_key_cache.get(status_code)
+        if status_key is None:
+            status_key = self._status_key_cache[status_code] = sys.intern(f'status_{status_code}')
+        self.metrics[status_key].append(1)
 
     def record_error(self, error_type: str, error_message: str, endpoint: Optional[str] = None,
                     user_id: Optional[str] = None):
         """Record error metrics"""
-        timestamp = datetime.now()
+        timestamp = time.time_ns()
 
         self.metrics['errors'].append({
             'timestamp': timestamp,
@@ -106,22 +168,70 @@ class MetricsCollector:
 
         self.error_count += 1
 
+        self._error_window.append((timestamp, error_type))
+        self._errors_by_type[error_type] += 1
+        self._expire_errors(timestamp - self.window_minutes * NS_PER_MINUTE)
+
     def record_processing_metrics(self, processing_result: Dict[str, Any]):
         """Record webhook processing metrics"""
-        timestamp = datetime.now()
+        timestamp = time.time_ns()
+        success = processing_result.get('success', False)
+        processing_time = processing_result.get('processing_time_seconds', 0)
+        steps = len(processing_result.get('steps_completed', []))
+        errors = len(processing_result.get('errors', []))
+        warnings = len(processing_result.get('warnings', []))
+        critical = len(processing_result.get('critical_errors', []))
 
         self.metrics['processing_results'].append({
             'timestamp': timestamp,
-            'success': processing_result.get('success', False),
-            'processing_time': processing_result.get('processing_time_seconds', 0),
-            'steps_completed': len(processing_result.get('steps_completed', [])),
-            'errors': len(processing_result.get('errors', [])),
-            'warnings': len(processing_result.get('warnings', [])),
-            'critical_errors': len(processing_result.get('critical_errors', []))
+            'success': success,
+            'processing_time': processing_time,
+            'steps_completed': steps,
+            'errors': errors,
+            'warnings': warnings,
+            'critical_errors': critical
         })
 
+        self._proc_window.append((timestamp, processing_time, success, steps, errors, warnings, critical))
+        self._proc_count += 1
+        self._proc_time_sum += processing_time
+        self._proc_success_count += int(bool(success))
+        self._proc_steps_sum += steps
+        self._proc_errors_sum += errors
+        self._proc_warnings_sum += warnings
+        self._proc_critical_sum += critical
+        self._expire_processing(timestamp - self.window_minutes * NS_PER_MINUTE)
+
+    def _expire_processing(self, cutoff_time: int):
+        """Drop processing samples at or before cutoff_time from the running sums"""
+        window = self._proc_window
+        while window and window[0][0] <= cutoff_time:
+            _, processing_time, success, steps, errors, warnings, critical = window.popleft()
+            self._proc_count -= 1
+            self._proc_time_sum -= processing_time
+            self._proc_success_count -= int(bool(success))
+            self._proc_steps_sum -= steps
+            self._proc_errors_sum -= errors
+            self._proc_warnings_sum -= warnings
+            self._proc_critical_sum -= critical
+
+        if not window:
+            # Reset so float subtraction error can't accumulate
+            self._proc_time_sum = 0.0
+
+    def _expire_errors(self, cutoff_time: int):
+        """Drop errors at or before cutoff_time from the per-type counts"""
+        window = self._error_window
+        counts = self._errors_by_type
+        while window and window[0][0] <= cutoff_time:
+            _, error_type = window.popleft()
+            counts[error_type] -= 1
+            if counts[error_type] <= 0:
+                del counts[error_type]
+
+    @ttl_cached(2)
     def get_system_metrics(self) -> Dict[str, Any]:
-        """Get current system resource metrics"""
+        """Get current system resource metrics (cpu_percent blocks for 1s, so bursts share a sample)"""
         process = psutil.Process(os.getpid())
 
         return {
@@ -135,9 +245,10 @@ class MetricsCollector:
             'uptime_seconds': time.time() - self.system_start_time
         }
 
+    @ttl_cached(5)
     def get_request_metrics(self, time_window_minutes: int = 5) -> Dict[str, Any]:
         """Get request metrics for the specified time window"""
-        cutoff_time = datetime.now() - timedelta(minutes=time_window_minutes)
+        cutoff_time = time.time_ns() - time_window_minutes * NS_PER_MINUTE
 
         # Filter requests in time window
         recent_requests = [
@@ -173,7 +284,28 @@ class MetricsCollector:
 
     def get_processing_metrics(self, time_window_minutes: int = 5) -> Dict[str, Any]:
         """Get processing performance metrics"""
-        cutoff_time = datetime.now() - timedelta(minutes=time_window_minutes)
+        cutoff_time = time.time_ns() - time_window_minutes * NS_PER_MINUTE
+
+        if time_window_minutes == self.window_minutes:
+            self._expire_processing(cutoff_time)
+            count = self._proc_count
+            if not count:
+                return {
+                    'total_processed': 0,
+                    'success_rate': 0,
+                    'avg_processing_time': 0,
+                    'avg_steps_completed': 0
+                }
+
+            return {
+                'total_processed': count,
+                'success_rate': self._proc_success_count / count,
+                'avg_processing_time': self._proc_time_sum / count,
+                'avg_steps_completed': self._proc_steps_sum / count,
+                'total_errors': self._proc_errors_sum,
+                'total_warnings': self._proc_warnings_sum,
+                'total_critical_errors': self._proc_critical_sum
+            }
 
         recent_processing = [
             proc for proc in self.metrics['processing_results']
@@ -203,16 +335,22 @@ class MetricsCollector:
 
     def get_error_metrics(self, time_window_minutes: int = 5) -> Dict[str, Any]:
         """Get error metrics for the specified time window"""
-        cutoff_time = datetime.now() - timedelta(minutes=time_window_minutes)
+        cutoff_time = time.time_ns() - time_window_minutes * NS_PER_MINUTE
+
+        if time_window_minutes == self.window_minutes:
+            self._expire_errors(cutoff_time)
+            return {
+                'total_errors': len(self._error_window),
+                'errors_per_minute': len(self._error_window) / time_window_minutes,
+                'error_types': dict(self._errors_by_type)
+            }
 
         recent_errors = [
             err for err in self.metrics['errors']
             if err['timestamp'] > cutoff_time
         ]
 
-        error_types: DefaultDict[str, int] = defaultdict(int)
-        for error in recent_errors:
-            error_types[error['type']] += 1
+        error_types = Counter(error['type'] for error in recent_errors)
 
         return {
             'total_errors': len(recent_errors),
@@ -225,7 +363,9 @@ class AlertManager:
 
     def __init__(self, metrics_collector: MetricsCollector):
         self.metrics = metrics_collector
-        self.alerts: List[Alert] = []
+        # Bounded alert history plus an id index of unresolved alerts
+        self.alerts: Deque[Alert] = deque(maxlen=1000)
+        self._active: Dict[str, Alert] = {}
         self.alert_thresholds = {
             'response_time_p95': 2.0,  # 2 seconds
             'error_rate': 0.1,  # 10%
@@ -235,111 +375,99 @@ class AlertManager:
         }
         self.check_interval = 60  # Check every 60 seconds
 
+        # Minimum time between two alerts of the same kind
+        self.cooldown_seconds = 300
+        self._last_fired: Dict[Tuple[str, str], float] = {}
+
     def check_alerts(self) -> List[Alert]:
         """Check for alert conditions and return new alerts"""
         new_alerts = []
+        now = time.monotonic()
 
         # Get current metrics
         request_metrics = self.metrics.get_request_metrics()
         processing_metrics = self.metrics.get_processing_metrics()
         system_metrics = self.metrics.get_system_metrics()
 
-        # Check response time alert
-        if request_metrics['p95_response_time'] > self.alert_thresholds['response_time_p95']:
-            alert = Alert(
-                id=f"response_time_{int(time.time())}",
-                type=AlertType.PERFORMANCE,
-                level=AlertLevel.WARNING,
-                message=f"High response time: P95 = {request_metrics['p95_response_time']:.2f}s",
-                details={
-                    'p95_response_time': request_metrics['p95_response_time'],
-                    'avg_response_time': request_metrics['avg_response_time'],
-                    'threshold': self.alert_thresholds['response_time_p95']
-                },
-                timestamp=datetime.now()
-            )
-            new_alerts.append(alert)
-
-        # Check error rate alert
-        if request_metrics['error_rate'] > self.alert_thresholds['error_rate']:
-            alert = Alert(
-                id=f"error_rate_{int(time.time())}",
-                type=AlertType.ERROR_RATE,
-                level=AlertLevel.ERROR,
-                message=f"High error rate: {request_metrics['error_rate']:.1%}",
-                details={
-                    'error_rate': request_metrics['error_rate'],
-                    'threshold': self.alert_thresholds['error_rate']
-                },
-                timestamp=datetime.now()
-            )
-            new_alerts.append(alert)
-
-        # Check processing success rate
-        if processing_metrics['success_rate'] < self.alert_thresholds['processing_success_rate']:
-            alert = Alert(
-                id=f"processing_success_{int(time.time())}",
-                type=AlertType.PERFORMANCE,
-                level=AlertLevel.WARNING,
-                message=f"Low processing success rate: {processing_metrics['success_rate']:.1%}",
-                details={
-                    'success_rate': processing_metrics['success_rate'],
-                    'threshold': self.alert_thresholds['processing_success_rate']
-                },
-                timestamp=datetime.now()
-            )
-            new_alerts.append(alert)
-
-        # Check system resource alerts
-        if system_metrics['memory_percent'] > self.alert_thresholds['memory_usage_percent']:
-            alert = Alert(
-                id=f"memory_usage_{int(time.time())}",
-                type=AlertType.SYSTEM_RESOURCE,
-                level=AlertLevel.WARNING,
-                message=f"High memory usage: {system_metrics['memory_percent']:.1f}%",
-                details={
-                    'memory_percent': system_metrics['memory_percent'],
-                    'threshold': self.alert_thresholds['memory_usage_percent']
-                },
-                timestamp=datetime.now()
-            )
-            new_alerts.append(alert)
-
-        if system_metrics['cpu_percent'] > self.alert_thresholds['cpu_usage_percent']:
-            alert = Alert(
-                id=f"cpu_usage_{int(time.time())}",
-                type=AlertType.SYSTEM_RESOURCE,
-                level=AlertLevel.WARNING,
-                message=f"High CPU usage: {system_metrics['cpu_percent']:.1f}%",
-                details={
-                    'cpu_percent': system_metrics['cpu_percent'],
-                    'threshold': self.alert_thresholds['cpu_usage_percent']
-                },
-                timestamp=datetime.now()
-            )
-            new_alerts.append(alert)
-
-        # Add new alerts to the list
-        self.alerts.extend(new_alerts)
-
-        # Keep only recent alerts (last 1000)
-        if len(self.alerts) > 1000:
-            self.alerts = self.alerts[-1000:]
+        # Rate-based checks are meaningless without samples in the window
+        has_requests = request_metrics['total_requests'] > 0
+        has_processing = processing_metrics['total_processed'] > 0
+
+        # (threshold name, alert id prefix, enabled, metrics, metric key, comparison,
+        #  type, level, message format, extra metric keys in details)
+        checks = [
+            ('response_time_p95', 'response_time', has_requests, request_metrics, 'p95_response_time', operator.gt,
+             AlertType.PERFORMANCE, AlertLevel.WARNING, "High response time: P95 = {value:.2f}s",
+             ('avg_response_time',)),
+            ('error_rate', 'error_rate', has_requests, request_metrics, 'error_rate', operator.gt,
+             AlertType.ERROR_RATE, AlertLevel.ERROR, "High error rate: {value:.1%}", ()),
+            ('processing_success_rate', 'processing_success', has_processing, processing_metrics, 'success_rate', operator.lt,
+             AlertType.PERFORMANCE, AlertLevel.WARNING, "Low processing success rate: {value:.1%}", ()),
+            ('memory_usage_percent', 'memory_usage', True, system_metrics, 'memory_percent', operator.gt,
+             AlertType.SYSTEM_RESOURCE, AlertLevel.WARNING, "High memory usage: {value:.1f}%", ()),
+            ('cpu_usage_percent', 'cpu_usage', True, system_metrics, 'cpu_percent', operator.gt,
+             AlertType.SYSTEM_RESOURCE, AlertLevel.WARNING, "High CPU usage: {value:.1f}%", ()),
+        ]
+
+        for name, id_prefix, enabled, metrics, key, compare, alert_type, level, message, extra_keys in checks:
+            value = metrics[key]
+            threshold = self.alert_thresholds[name]
+            if not (enabled and compare(value, threshold)):
+                continue
+            if not self._cooldown_elapsed(alert_type, name, now):
+                continue
+
+            # Details keep the metric key names consumers of /alerts read
+            details = {key: value}
+            for extra_key in extra_keys:
+                details[extra_key] = metrics[extra_key]
+            details['threshold'] = threshold
+
+            new_alerts.append(Alert(
+                id=f"{id_prefix}_{int(time.time())}",
+                type=alert_type,
+                level=level,
+                message=message.format(value=value),
+                details=details,
+                timestamp=time.time_ns()
+            ))
+
+        # Add new alerts to the history
+        for alert in new_alerts:
+            self._store_alert(alert)
 
         return new_alerts
 
+    def _cooldown_elapsed(self, alert_type: AlertType, signature: str, now: float) -> bool:
+        """Check the per-alert cooldown and re-arm it when the alert may fire"""
+        key = (alert_type.value, signature)
+        if now - self._last_fired.get(key, float('-inf')) < self.cooldown_seconds:
+            return False
+        self._last_fired[key] = now
+        return True
+
+    def _store_alert(self, alert: Alert):
+        """Append an alert, dropping the evicted oldest alert from the indexes"""
+        if len(self.alerts) == self.alerts.maxlen:
+            evicted = self.alerts[0]
+            if self._active.get(evicted.id) is evicted:
+                del self._active[evicted.id]
+
+        self.alerts.append(alert)
+        if not alert.resolved:
+            self._active[alert.id] = alert
+
     def get_active_alerts(self) -> List[Alert]:
         """Get currently active (unresolved) alerts"""
-        return [alert for alert in self.alerts if not alert.resolved]
+        return list(self._active.values())
 
     def resolve_alert(self, alert_id: str):
         """Mark an alert as resolved"""
-        for alert in self.alerts:
-            if alert.id == alert_id and not alert.resolved:
-                alert.resolved = True
-                alert.resolved_at = datetime.now()
-                logger.info(f"Alert resolved: {alert.message}")
-                break
+        alert = self._active.pop(alert_id, None)
+        if alert:
+            alert.resolved = True
+            alert.resolved_at = time.time_ns()
+            logger.info(f"Alert resolved: {alert.message}")
 
 class HealthChecker:
     """Performs health checks on system components"""
@@ -349,8 +477,36 @@ class HealthChecker:
         self.last_health_check = None
         self.health_status = {}
 
+        # Burst health checks share one sample; disk usage changes slowly
+        self.cache_ttl = 5
+        self.disk_cache_ttl = 30
+        self._cache_ts = 0.0
+        self._disk_usage = None
+        self._disk_usage_ts = 0.0
+
     async def check_health(self) -> Dict[str, Any]:
         """Perform comprehensive health check"""
+        now = time.monotonic()
+        if self.last_health_check is not None and now - self._cache_ts < self.cache_ttl:
+            return self.last_health_check
+
+        # psutil and stats collection are blocking, keep them off the event loop
+        health_status = await asyncio.to_thread(self._collect_sync)
+
+        self.last_health_check = health_status
+        self._cache_ts = now
+        return health_status
+
+    def _get_disk_usage(self):
+        """Return disk usage for '/', sampled at most every disk_cache_ttl seconds"""
+        now = time.monotonic()
+        if self._disk_usage is None or now - self._disk_usage_ts >= self.disk_cache_ttl:
+            self._disk_usage = psutil.disk_usage('/')
+            self._disk_usage_ts = now
+        return self._disk_usage
+
+    def _collect_sync(self) -> Dict[str, Any]:
+        """Collect all health check data synchronously"""
         health_status: Dict[str, Any] = {
             'timestamp': datetime.now().isoformat(),
             'overall_status': 'healthy',
@@ -368,7 +524,7 @@ class HealthChecker:
         }
 
         # Disk space check
-        disk_metrics = psutil.disk_usage('/')
+        disk_metrics = self._get_disk_usage()
         health_status['checks']['disk_space'] = {
             'status': 'healthy' if disk_metrics.percent < 90 else 'warning',
             'details': {
@@ -399,7 +555,6 @@ class HealthChecker:
         elif 'warning' in statuses:
             health_status['overall_status'] = 'warning'
 
-        self.last_health_check = health_status
         return health_status
 
 class MonitoringSystem:
@@ -476,27 +631,36 @@ class MonitoringSystem:
             self._monitoring_task = None
 
     async def _monitoring_loop(self):
-        """Background monitoring loop"""
+        """Background monitoring loop, run at a fixed rate so slow checks don't drift the schedule"""
+        interval = self.alert_manager.check_interval
+        next_check = time.monotonic() + interval
         while True:
             try:
                 # Check for alerts
                 new_alerts = self.alert_manager.check_alerts()
 
-                # Log new alerts
-                for alert in new_alerts:
-                    logger.warning(f"Alert triggered: {alert.message}", extra={
-                        'alert_id': alert.id,
-                        'alert_type': alert.type.value,
-                        'alert_level': alert.level.value,
-                        'alert_details': alert.details
-                    })
-
-                # Wait before next check
-                await asyncio.sleep(self.alert_manager.check_interval)
+                # Log new alerts; skip building structured records when WARNING is filtered
+                if new_alerts and logger.isEnabledFor(logging.WARNING):
+                    for alert in new_alerts:
+                        logger.warning("Alert triggered: %s", alert.message, extra={
+                            'alert_id': alert.id,
+                            'alert_type': alert.type.value,
+                            'alert_level': alert.level.value,
+                            'alert_details': alert.details
+                        })
 
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {str(e)}")
-                await asyncio.sleep(60)  # Wait a minute before retrying
+
+            # Wait until the next deadline; after an overrun skip the missed ticks
+            now = time.monotonic()
+            delay = next_check - now
+            if delay < 0:
+                next_check = now + interval
+                delay = interval
+            else:
+                next_check += interval
+            await asyncio.sleep(delay)
 
 # Global monitoring instance
 monitoring = MonitoringSystem()
\ No newline at end of file
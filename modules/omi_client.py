@@ -2,8 +2,14 @@
 OMI Integration API Client
 Handles communication with OMI Import API and Notifications
 """
+import socket
+import threading
+import orjson
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
 from config.settings import OMIConfig, AppSettings
 from modules.api_utils import with_omi_retry
@@ -15,6 +21,39 @@ if not logging.getLogger().hasHandlers():
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of pages fetched in parallel by the read_all_* helpers
+MAX_CONCURRENT_PAGES = 8
+
+# Keep-alive connections held per host; requests beyond this wait for a free connection
+MAX_POOL_CONNECTIONS = 64
+
+# Number of GET responses kept for conditional (ETag / Last-Modified) revalidation
+RESPONSE_CACHE_SIZE = 128
+
+# Seconds a pooled connection may sit idle before TCP keep-alive probes start
+TCP_KEEPALIVE_IDLE = 60
+
+# Largest explicit memory list sent in one create_memories request
+MAX_MEMORIES_PER_REQUEST = 100
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets send TCP keep-alive probes
+
+    Keeps idle pooled connections from being silently dropped by NATs and
+    load balancers, so later calls reuse them instead of paying a new
+    TCP + TLS handshake.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        socket_options = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE))
+        kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
 class OMIClient:
     """Client for OMI Import API and Notifications"""
 
@@ -24,17 +63,81 @@ class OMIClient:
         self.app_secret = OMIConfig.APP_SECRET
         self.base_url = OMIConfig.BASE_URL
         self.user_uid = OMIConfig.USER_UID
+        self.timeout = OMIConfig.REQUEST_TIMEOUT
+
+        # Endpoint URLs and the shared uid query are fixed for the client's lifetime
+        integration_url = f"{self.base_url}/v2/integrations/{self.app_id}"
+        self._conversations_url = f"{integration_url}/conversations"
+        self._create_conversation_url = f"{integration_url}/user/conversations"
+        self._create_memories_url = f"{integration_url}/user/memories"
+        self._memories_url = f"{integration_url}/memories"
+        self._notification_url = f"{integration_url}/notification"
+        self._uid_params = {"uid": self.user_uid}  # shared; never mutated
 
         self.session = requests.Session()
+        # Calls are made from worker threads, so size the pool for concurrent use
+        # and block rather than open throwaway connections when it is exhausted
+        adapter = KeepAliveHTTPAdapter(pool_connections=MAX_POOL_CONNECTIONS,
+                                       pool_maxsize=MAX_POOL_CONNECTIONS, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Authorization": f"Bearer {self.app_secret}",
             "Content-Type": "application/json"
         })
 
+        # (url, params) -> (validator headers, raw JSON body) for conditional GETs; raw bytes
+        # are immutable, so each hit parses its own copy that callers are free to mutate
+        self._response_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[Dict[str, str], bytes]] = {}
+        # Paged reads and asyncio.to_thread callers use the cache from worker threads
+        self._response_cache_lock = threading.Lock()
+
     @with_omi_retry
-    def _get_conversations_request(self, url: str, params: Dict[str, Any]) -> requests.Response:
+    def _get_conversations_request(self, url: str, params: Dict[str, Any],
+                                   headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """Make HTTP GET request for conversations with retry logic"""
-        return self.session.get(url, params=params)
+        return self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+
+    def _conditional_get(self, request: Callable[..., requests.Response], url: str,
+                         params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GET a JSON body, revalidating a previous response with its ETag / Last-Modified
+
+        Args:
+            request: Retrying GET request method
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Parsed response body, reused from the cache when the server answers 304
+        """
+        key = (url, tuple(sorted(params.items())))
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+
+        response = request(url, params, cached[0] if cached else None)
+        if cached and response.status_code == 304:
+            return orjson.loads(cached[1])
+
+        response.raise_for_status()
+        content = response.content
+        data = orjson.loads(content)
+
+        validators = {}
+        etag = response.headers.get("ETag")
+        if etag:
+            validators["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+
+        if validators:
+            with self._response_cache_lock:
+                if key not in self._response_cache and len(self._response_cache) >= RESPONSE_CACHE_SIZE:
+                    self._response_cache.pop(next(iter(self._response_cache)), None)
+                self._response_cache[key] = (validators, content)
+
+        return data
 
     def read_conversations(self, limit: int = 100, offset: int = 0,
                            include_discarded: bool = False) -> List[Dict[str, Any]]:
@@ -49,26 +152,41 @@ class OMIClient:
         Returns:
             List of conversation objects
         """
-        url = f"{self.base_url}/v2/integrations/{self.app_id}/conversations"
-        params = {
-            "uid": self.user_uid,
-            "limit": limit,
-            "offset": offset
-        }
+        url = self._conversations_url
+        params = {**self._uid_params, "limit": limit, "offset": offset}
 
         if include_discarded:
             params["include_discarded"] = "true"
 
-        response = self._get_conversations_request(url, params)
-        response.raise_for_status()
-        data = response.json()
-        logger.info(f"Retrieved {len(data.get('conversations', []))} conversations from OMI")
-        return data.get('conversations', [])
+        data = self._conditional_get(self._get_conversations_request, url, params)
+        conversations = data.get('conversations', [])
+        logger.info("Retrieved %d conversations from OMI", len(conversations))
+        return conversations
+
+    def read_all_conversations(self, total: int, page_size: int = 1000,
+                               include_discarded: bool = False) -> List[Dict[str, Any]]:
+        """
+        Read up to `total` conversations, fetching all pages concurrently
+
+        Args:
+            total: Number of conversations to read
+            page_size: Conversations per request (max 1000)
+            include_discarded: Include discarded conversations
+
+        Returns:
+            List of conversation objects, in offset order
+        """
+        return self._read_pages(
+            lambda limit, offset: self.read_conversations(
+                limit=limit, offset=offset, include_discarded=include_discarded
+            ),
+            total, page_size
+        )
 
     @with_omi_retry
     def _post_conversation_request(self, url: str, params: Dict[str, Any], data: Dict[str, Any]) -> requests.Response:
         """Make HTTP POST request for conversation creation with retry logic"""
-        return self.session.post(url, params=params, json=data)
+        return self.session.post(url, params=params, data=orjson.dumps(data), timeout=self.timeout)
 
     def create_conversation(self, text: str, started_at: str, finished_at: str,
                             language: str = "en", text_source: str = "other",
@@ -89,8 +207,8 @@ class OMIClient:
         Returns:
             Created conversation object
         """
-        url = f"{self.base_url}/v2/integrations/{self.app_id}/user/conversations"
-        params = {"uid": self.user_uid}
+        url = self._create_conversation_url
+        params = self._uid_params
 
         data: Dict[str, Any] = {
             "text": text,
@@ -107,14 +225,14 @@ class OMIClient:
 
         response = self._post_conversation_request(url, params, data)
         response.raise_for_status()
-        result = response.json()
-        logger.info(f"Created conversation in OMI: {result.get('id', 'unknown')}")
+        result = orjson.loads(response.content)
+        logger.info("Created conversation in OMI: %s", result.get('id', 'unknown'))
         return result
 
     @with_omi_retry
     def _post_memories_request(self, url: str, params: Dict[str, Any], data: Dict[str, Any]) -> requests.Response:
         """Make HTTP POST request for memory creation with retry logic"""
-        return self.session.post(url, params=params, json=data)
+        return self.session.post(url, params=params, data=orjson.dumps(data), timeout=self.timeout)
 
     def create_memories(self, memories: Optional[List[Dict[str, Any]]] = None,
                         text: Optional[str] = None,
@@ -123,6 +241,9 @@ class OMIClient:
         """
         Create memories in OMI
 
+        Memory lists longer than MAX_MEMORIES_PER_REQUEST are sent in chunks,
+        one request per chunk, so callers can save a whole batch in one call.
+
         Args:
             memories: List of explicit memory objects with "content" and optional "tags"
             text: Text content (required by OMI API, even with explicit memories)
@@ -130,39 +251,47 @@ class OMIClient:
             text_source_spec: Additional source specification
 
         Returns:
-            Response with created memories
+            Response with created memories (merged across chunks)
         """
-        url = f"{self.base_url}/v2/integrations/{self.app_id}/user/memories"
-        params = {"uid": self.user_uid}
+        # OMI API requires 'text' field even when passing explicit memories
+        if text is None:
+            raise ValueError("'text' field is required by OMI API")
 
-        data: Dict[str, Any] = {
-            "text_source": text_source
-        }
+        url = self._create_memories_url
+        params = self._uid_params
 
+        data: Dict[str, Any] = {"text_source": text_source, "text": text}
         if text_source_spec:
             data["text_source_spec"] = text_source_spec
 
-        # OMI API requires 'text' field even when passing explicit memories
-        if text is not None:
-            data["text"] = text
+        if memories is None:
+            chunks: List[Optional[List[Dict[str, Any]]]] = [None]
+        else:
+            chunks = [memories[i:i + MAX_MEMORIES_PER_REQUEST]
+                      for i in range(0, len(memories), MAX_MEMORIES_PER_REQUEST)] or [memories]
 
-        if memories is not None:
-            data["memories"] = memories
+        result: Dict[str, Any] = {}
+        created: List[Dict[str, Any]] = []
+        for chunk in chunks:
+            if chunk is not None:
+                data["memories"] = chunk
 
-        # At least text must be provided (OMI API requirement)
-        if "text" not in data:
-            raise ValueError("'text' field is required by OMI API")
+            response = self._post_memories_request(url, params, data)
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            created.extend(result.get('memories', []))
 
-        response = self._post_memories_request(url, params, data)
-        response.raise_for_status()
-        result = response.json()
-        logger.info(f"Created {len(result.get('memories', []))} memories in OMI")
+        if len(chunks) > 1:
+            result["memories"] = created
+
+        logger.info("Created %d memories in OMI", len(created))
         return result
 
     @with_omi_retry
-    def _get_memories_request(self, url: str, params: Dict[str, Any]) -> requests.Response:
+    def _get_memories_request(self, url: str, params: Dict[str, Any],
+                              headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """Make HTTP GET request for memories with retry logic"""
-        return self.session.get(url, params=params)
+        return self.session.get(url, params=params, headers=headers, timeout=self.timeout)
 
     def read_memories(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """
@@ -175,23 +304,70 @@ class OMIClient:
         Returns:
             List of memory objects
         """
-        url = f"{self.base_url}/v2/integrations/{self.app_id}/memories"
-        params = {
-            "uid": self.user_uid,
-            "limit": limit,
-            "offset": offset
+        url = self._memories_url
+        params = {**self._uid_params, "limit": limit, "offset": offset}
+
+        data = self._conditional_get(self._get_memories_request, url, params)
+        memories = data.get('memories', [])
+        logger.info("Retrieved %d memories from OMI", len(memories))
+        return memories
+
+    def read_all_memories(self, total: int, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Read up to `total` memories, fetching all pages concurrently
+
+        Args:
+            total: Number of memories to read
+            page_size: Memories per request (max 1000)
+
+        Returns:
+            List of memory objects, in offset order
+        """
+        return self._read_pages(self.read_memories, total, page_size)
+
+    def read_user_bundle(self, limit: int = 100) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Read recent conversations and memories in parallel
+
+        Args:
+            limit: Maximum number of conversations and of memories (max 1000)
+
+        Returns:
+            Dict with "conversations" and "memories" lists
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            conversations = executor.submit(self.read_conversations, limit=limit)
+            memories = executor.submit(self.read_memories, limit=limit)
+
+        return {
+            "conversations": conversations.result(),
+            "memories": memories.result()
         }
 
-        response = self._get_memories_request(url, params)
-        response.raise_for_status()
-        data = response.json()
-        logger.info(f"Retrieved {len(data.get('memories', []))} memories from OMI")
-        return data.get('memories', [])
+    def _read_pages(self, fetch_page: Callable[..., List[Dict[str, Any]]],
+                    total: int, page_size: int) -> List[Dict[str, Any]]:
+        """Issue one request per page in a thread pool and flatten the results"""
+        if total <= 0:
+            return []
+
+        limits = [(min(page_size, total - offset), offset) for offset in range(0, total, page_size)]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_PAGES, len(limits))) as executor:
+            futures = [executor.submit(fetch_page, limit, offset) for limit, offset in limits]
+
+        items: List[Dict[str, Any]] = []
+        for (limit, offset), future in zip(limits, futures):
+            try:
+                items.extend(future.result())
+            except Exception as e:
+                logger.warning("Failed to read page at offset %d: %s", offset, e)
+
+        return items
 
     @with_omi_retry
     def _post_notification_request(self, url: str, params: Dict[str, Any]) -> requests.Response:
         """Make HTTP POST request for notifications with retry logic"""
-        return self.session.post(url, params=params, headers={"Content-Length": "0"})
+        return self.session.post(url, params=params, headers={"Content-Length": "0"}, timeout=self.timeout)
 
     def send_notification(self, message: str, user_uid: Optional[str] = None) -> bool:
         """
@@ -202,10 +378,10 @@ class OMIClient:
             user_uid: Optional user UID (defaults to configured user)
 
         Returns:
-            True if successful
+            True if successful; failures are logged and return False
         """
         uid = user_uid or self.user_uid
-        url = f"{self.base_url}/v2/integrations/{self.app_id}/notification"
+        url = self._notification_url
         params = {
             "uid": uid,
             "message": message
@@ -213,13 +389,18 @@ class OMIClient:
 
         try:
             response = self._post_notification_request(url, params)
-            response.raise_for_status()
-            logger.info(f"Sent notification to user {uid}")
-            return True
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to send notification: {e}")
+            logger.error("Failed to send notification: %s", e)
+            return False
+
+        # Checked directly rather than via raise_for_status so HTTP errors cost no exception
+        if response.status_code >= 400:
+            logger.error("Failed to send notification: HTTP %s", response.status_code)
             return False
 
+        logger.info("Sent notification to user %s", uid)
+        return True
+
     def close(self):
         """Close the session"""
         self.session.close()
@@ -1,18 +1,21 @@
 """
 Main Orchestrator - Coordinates all components
 """
-from typing import Dict, Any, Optional, List, TypedDict, cast
+from typing import Dict, Any, Optional, List, Mapping, Set, Tuple, TypedDict, DefaultDict, Deque, Coroutine, cast
+from collections import defaultdict, deque
 from datetime import datetime, timezone, timedelta
 import logging
 import asyncio
 from functools import lru_cache
+from types import MappingProxyType
 import time
 import psutil
 import os
 from contextlib import contextmanager
+from operator import itemgetter
 
 from .transcript_processor import TranscriptProcessor
-from .psychological_analyzer import PsychologicalAnalyzer
+from .psychological_analyzer import ANALYSIS_BATCH_SIZE, PsychologicalAnalyzer
 from .workspace_automation import WorkspaceAutomation
 from .omi_client import OMIClient
 from .security import InputValidator
@@ -49,30 +52,222 @@ if not logging.getLogger().hasHandlers():
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of conversations analyzed in parallel by manual_conversation_analysis
+MAX_CONCURRENT_ANALYSES = 8
+
+# Pending notifications held for the coalescing flusher, and how many it takes per flush
+NOTIFY_QUEUE_SIZE = 1024
+NOTIFY_BATCH_SIZE = 32
+
+# Transcript characters included in slide prompts, and maximum characters of generated slide text
+SLIDE_TRANSCRIPT_CHARS = 2000
+SLIDE_CONTENT_CHARS = 500
+
+# Slide section Gemini calls in flight at once, across all presentations being built
+MAX_CONCURRENT_SLIDE_CALLS = 4
+
+# (epoch second, UTC ISO-8601, local "YYYY-MM-DD HH:MM") for the last second a stamp was built
+_timestamp_cache: Tuple[int, str, str] = (-1, "", "")
+
+def cached_timestamps() -> Tuple[str, str]:
+    """Return the current UTC ISO-8601 and local minute stamps, rebuilt at most once per second"""
+    global _timestamp_cache
+    second = int(time.time())
+    cache = _timestamp_cache
+    if cache[0] != second:
+        now = datetime.now(timezone.utc)
+        cache = (second, now.isoformat(timespec='seconds'), now.astimezone().strftime('%Y-%m-%d %H:%M'))
+        _timestamp_cache = cache
+    return cache[1], cache[2]
+
+_get_segment_text = itemgetter("text")
+
+# Transcripts shorter than this after stripping whitespace skip full processing
+SHORT_TRANSCRIPT_CHARS = 20
+
+# Largest single chunk accepted by process_audio_stream
+MAX_AUDIO_CHUNK_BYTES = 10 * 1024 * 1024
+
+def is_short_transcript(transcript: str) -> bool:
+    """Return True if the stripped transcript is shorter than SHORT_TRANSCRIPT_CHARS
+
+    Only strips (and copies) the string when it has surrounding whitespace.
+    """
+    if len(transcript) < SHORT_TRANSCRIPT_CHARS:
+        return True
+    if not (transcript[0].isspace() or transcript[-1].isspace()):
+        return False
+    return len(transcript.strip()) < SHORT_TRANSCRIPT_CHARS
+
+def join_segment_text(segments: List[Dict[str, Any]]) -> str:
+    """Join the non-empty text of transcript segments with single spaces"""
+    try:
+        # map/filter keep the per-segment loop in C
+        return " ".join(filter(None, map(_get_segment_text, segments)))
+    except KeyError:
+        # Some segment has no text key
+        return " ".join(seg["text"] for seg in segments if seg.get("text"))
+
+# Transcript keyword categories for the calendar and presentation heuristics, as bit flags
+FOLLOW_UP_KEYWORD = 1
+PROFESSIONAL_KEYWORD = 2
+ALL_KEYWORD_FLAGS = FOLLOW_UP_KEYWORD | PROFESSIONAL_KEYWORD
+# "meeting" comes first since it settles both categories at once
+_KEYWORD_FLAGS = {
+    "meeting": FOLLOW_UP_KEYWORD | PROFESSIONAL_KEYWORD,
+    "follow up": FOLLOW_UP_KEYWORD,
+    "follow-up": FOLLOW_UP_KEYWORD,
+    "schedule": FOLLOW_UP_KEYWORD,
+    "appointment": FOLLOW_UP_KEYWORD,
+    "discuss later": FOLLOW_UP_KEYWORD,
+    "presentation": PROFESSIONAL_KEYWORD,
+    "project": PROFESSIONAL_KEYWORD,
+    "business": PROFESSIONAL_KEYWORD,
+    "work": PROFESSIONAL_KEYWORD,
+    "professional": PROFESSIONAL_KEYWORD,
+}
+
+def analysis_scores(analysis: Dict[str, Any]) -> Tuple[int, int]:
+    """Return the (ADHD, anxiety) scores of an analysis, 0 where missing"""
+    adhd = analysis.get("adhd_indicators")
+    anxiety = analysis.get("anxiety_patterns")
+    return (adhd.get("score", 0) if adhd else 0), (anxiety.get("score", 0) if anxiety else 0)
+
+def classify_transcript_keywords(transcript: str) -> int:
+    """Return the keyword category flags found in transcript
+
+    Lowercases once and uses substring search per keyword, which is far
+    faster than a case-insensitive regex alternation over the transcript;
+    keywords whose categories are already found are skipped.
+    """
+    text = transcript.lower()
+    mask = 0
+    for keyword, flags in _KEYWORD_FLAGS.items():
+        if flags & ~mask and keyword in text:
+            mask |= flags
+            if mask == ALL_KEYWORD_FLAGS:
+                break
+    return mask
+
+# Primary emotions treated as no signal when deciding to skip heavy webhook steps
+LOW_SIGNAL_EMOTIONS = frozenset({"neutral", "unknown"})
+
+# Memory body written for each analysis by _format_analysis_for_memory
+ANALYSIS_MEMORY_TEMPLATE = """Gemini AI Analysis (Model: {model})
+
+{summary}
+
+Generated: {generated_at}
+
+This analysis is generated automatically and should not replace professional evaluation."""
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_statm_fd: Optional[int] = None
+_statm_pid: Optional[int] = None
+_psutil_process: Optional[psutil.Process] = None
+
+def read_rss_mb() -> float:
+    """
+    Resident set size of the current process in MB
+
+    Reads /proc/self/statm through a cached descriptor (reopened after a
+    fork); falls back to a cached psutil handle where procfs is unavailable.
+    """
+    global _statm_fd, _statm_pid, _psutil_process
+    try:
+        pid = os.getpid()
+        if _statm_pid != pid:
+            _statm_fd = os.open("/proc/self/statm", os.O_RDONLY)
+            _statm_pid = pid
+        return int(os.pread(_statm_fd, 128, 0).split()[1]) * _PAGE_SIZE / 1048576
+    except (OSError, AttributeError, ValueError, IndexError):
+        if _psutil_process is None or _psutil_process.pid != os.getpid():
+            _psutil_process = psutil.Process()
+        return _psutil_process.memory_info().rss / 1048576
+
 @contextmanager
-def profile_step(step_name: str, result_dict: Dict[str, Any]):
-    """Context manager for profiling individual processing steps"""
-    process = psutil.Process(os.getpid())
-    start_time = time.time()
-    start_memory = process.memory_info().rss / 1024 / 1024  # MB
+def profile_step(step_name: str, result_dict: Dict[str, Any], sample_memory: Optional[bool] = None,
+                 time_log: Optional[List[Tuple[str, float]]] = None):
+    """
+    Context manager for profiling individual processing steps
+
+    Records `<step>_time`, plus `<step>_memory_mb` when memory sampling is
+    enabled (AppSettings.PROFILE_MEMORY unless overridden). If time_log is
+    given, `(<step>_time, duration)` is also appended to it.
+    """
+    if sample_memory is None:
+        sample_memory = AppSettings.PROFILE_MEMORY
+
+    start_time = time.perf_counter()
+    start_memory = read_rss_mb() if sample_memory else 0.0
 
     try:
         yield
     finally:
-        end_time = time.time()
-        end_memory = process.memory_info().rss / 1024 / 1024  # MB
-
-        duration = end_time - start_time
-        memory_delta = end_memory - start_memory
+        duration = time.perf_counter() - start_time
+        time_key = f"{step_name}_time"
+        result_dict[time_key] = duration
+        if time_log is not None:
+            time_log.append((time_key, duration))
+
+        if sample_memory:
+            memory_delta = read_rss_mb() - start_memory
+            result_dict[f"{step_name}_memory_mb"] = memory_delta
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Step '%s' completed in %.3fs, memory delta: %.2fMB", step_name, duration, memory_delta)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Step '%s' completed in %.3fs", step_name, duration)
+
+# Recent timings kept per step for the performance history
+STEP_HISTORY_SIZE = 100
+
+class StepTimings:
+    """
+    Last STEP_HISTORY_SIZE timings of one processing step
+
+    The window sum is kept up to date as samples arrive and leave, so the
+    average is O(1) to read; min and max scan at most STEP_HISTORY_SIZE
+    samples in C.
+    """
+
+    __slots__ = ("recent", "total")
 
-        result_dict[f"{step_name}_time"] = duration
-        result_dict[f"{step_name}_memory_mb"] = memory_delta
+    def __init__(self):
+        self.recent: Deque[float] = deque(maxlen=STEP_HISTORY_SIZE)
+        self.total = 0.0
 
-        logger.debug(f"Step '{step_name}' completed in {duration:.3f}s, memory delta: {memory_delta:.2f}MB")
+    def append(self, duration: float):
+        """Record one step duration, dropping the oldest once the window is full"""
+        if len(self.recent) == STEP_HISTORY_SIZE:
+            self.total -= self.recent[0]
+        self.recent.append(duration)
+        self.total += duration
 
 class OMIGeminiOrchestrator:
     """Main orchestrator coordinating OMI, Gemini, and Google Workspace"""
 
+    # Default fields of a ProcessingResult, copied at the start of each webhook (read-only)
+    _RESULT_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+        "success": False,
+        "memory_id": None,
+        "uid": "",
+        "steps_completed": None,
+        "errors": None,
+        "warnings": None,
+        "critical_errors": None,
+        "performance_profile": None,
+        "status": None,
+        "processing_time_seconds": None,
+        "model_used": None,
+        "analysis": None,
+        "email_queued": False,
+        "calendar_queued": False,
+        "presentation_queued": False,
+        "workspace_automation_queued": False,
+        "notification_queued": False,
+        "created_memories_count": 0
+    })
+
     def __init__(self):
         # Validate configurations
         try:
@@ -144,6 +339,8 @@ class OMIGeminiOrchestrator:
             if MultimodalConfig.ENABLE_IMAGE_ANALYSIS:
                 self.processor_registry.register_processor(ModalityType.IMAGE, create_image_processor())
 
+            # Bound once; looked up for every multimodal input
+            self._get_processor = self.processor_registry.get_processor
             logger.debug("Modality processors registered")
         except Exception as e:
             logger.error("Failed to initialize modality processors", exc_info=True, extra={
@@ -153,12 +350,24 @@ class OMIGeminiOrchestrator:
             raise
 
         # Performance tracking
-        self.processing_stats = {
+        self.processing_stats: Dict[str, Any] = {
             "total_processed": 0,
             "average_processing_time": 0,
-            "success_rate": 0
+            "success_rate": 0,
+            "performance_profile": defaultdict(StepTimings)
         }
 
+        # Strong references to fire-and-forget tasks so they are not collected mid-flight
+        self._bg_tasks: Set[asyncio.Task] = set()
+
+        # Google API clients are not thread-safe, so each service is used by one thread at a time
+        self._workspace_locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._slide_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SLIDE_CALLS)
+
+        # Notification queue and its flusher, created on first use inside the event loop
+        self._notify_queue: Optional[asyncio.Queue] = None
+        self._notify_task: Optional[asyncio.Task] = None
+
         logger.info("OMI-Gemini Orchestrator initialized successfully", extra={
             "components": ["transcript_processor", "psychological_analyzer", "workspace_automation", "omi_client", "modality_processors"],
             "supported_modalities": [m.value for m in self.processor_registry.list_modalities()]
@@ -177,7 +386,7 @@ class OMIGeminiOrchestrator:
         Returns:
             Processing result dictionary
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Input validation and sanitization
         if not InputValidator.validate_uid(uid):
@@ -200,63 +409,56 @@ class OMIGeminiOrchestrator:
             "uid": uid,
             "memory_id": memory_data.get('id'),
             "memory_keys": list(memory_data.keys()),
-            "processing_start_time": start_time
+            "processing_start_time": time.time()
         })
 
-        result: ProcessingResult = {
-            "success": False,
-            "memory_id": memory_data.get("id"),
-            "uid": uid,
-            "steps_completed": [],
-            "errors": [],
-            "warnings": [],
-            "critical_errors": [],
-            "performance_profile": {},
-            "status": None,
-            "processing_time_seconds": None,
-            "model_used": None,
-            "analysis": None,
-            "email_queued": False,
-            "calendar_queued": False,
-            "presentation_queued": False,
-            "workspace_automation_queued": False,
-            "notification_queued": False,
-            "created_memories_count": 0
-        }
+        # Scalar defaults come from the template; containers must be fresh per call
+        result = cast(ProcessingResult, self._RESULT_TEMPLATE.copy())
+        result["memory_id"] = memory_data.get("id")
+        result["uid"] = uid
+        result["steps_completed"] = []
+        result["errors"] = []
+        result["warnings"] = []
+        result["critical_errors"] = []
+        result["performance_profile"] = {}
+        # Step timings in completion order, for the rolling step history
+        step_times: List[Tuple[str, float]] = []
 
         try:
             # Step 1: Extract transcript from memory
-            with profile_step("transcript_extraction", result["performance_profile"]):
+            with profile_step("transcript_extraction", result["performance_profile"], time_log=step_times):
                 transcript_raw = self._extract_transcript(memory_data)
-                if not transcript_raw:
-                    logger.warning("No transcript found in memory data", extra={
-                        "uid": uid,
-                        "memory_id": memory_data.get('id'),
-                        "memory_keys": list(memory_data.keys())
-                    })
-                    result["errors"].append("No transcript available")
-                    return result
 
-                result["steps_completed"].append("transcript_extracted")
+            if not transcript_raw:
+                logger.warning("No transcript found in memory data", extra={
+                    "uid": uid,
+                    "memory_id": memory_data.get('id'),
+                    "memory_keys": list(memory_data.keys())
+                })
+                result["errors"].append("No transcript available")
+                return result
+
+            result["steps_completed"].append("transcript_extracted")
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Transcript extracted successfully", extra={
                     "uid": uid,
                     "transcript_length": len(transcript_raw)
                 })
 
-                # Early return for very short transcripts (optimize for <1s response)
-                if len(transcript_raw.strip()) < 20:
-                    logger.info("Very short transcript detected, skipping full processing for speed", extra={
-                        "uid": uid,
-                        "transcript_length": len(transcript_raw)
-                    })
-                    result["success"] = True
-                    result["status"] = "success"
-                    result["processing_time_seconds"] = time.time() - start_time
-                    return result
+            # Early return for very short transcripts (optimize for <1s response)
+            if is_short_transcript(transcript_raw):
+                logger.info("Very short transcript detected, skipping full processing for speed", extra={
+                    "uid": uid,
+                    "transcript_length": len(transcript_raw)
+                })
+                result["success"] = True
+                result["status"] = "success"
+                result["processing_time_seconds"] = time.perf_counter() - start_time
+                return result
 
             # Step 2: Clean transcript with Gemini
-            with profile_step("transcript_cleaning", result["performance_profile"]):
-                cleaned_result = self.transcript_processor.process_transcript(transcript_raw)
+            with profile_step("transcript_cleaning", result["performance_profile"], time_log=step_times):
+                cleaned_result = await asyncio.to_thread(self.transcript_processor.process_transcript, transcript_raw)
 
                 if not cleaned_result["success"]:
                     logger.error("Transcript cleaning failed", extra={
@@ -273,16 +475,17 @@ class OMIGeminiOrchestrator:
                 result["model_used"] = cleaned_result.get("model_used")
                 result["steps_completed"].append("transcript_cleaned")
 
-                logger.debug("Transcript cleaned successfully", extra={
-                    "uid": uid,
-                    "model_used": cleaned_result.get("model_used"),
-                    "processing_time": cleaned_result.get("processing_time"),
-                    "cleaned_length": len(cleaned_transcript)
-                })
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Transcript cleaned successfully", extra={
+                        "uid": uid,
+                        "model_used": cleaned_result.get("model_used"),
+                        "processing_time": cleaned_result.get("processing_time"),
+                        "cleaned_length": len(cleaned_transcript)
+                    })
 
             # Step 3: Psychological analysis
-            with profile_step("psychological_analysis", result["performance_profile"]):
-                analysis = self.psychological_analyzer.analyze(cleaned_transcript, include_details=True)
+            with profile_step("psychological_analysis", result["performance_profile"], time_log=step_times):
+                analysis = await asyncio.to_thread(self.psychological_analyzer.analyze, cleaned_transcript, include_details=True)
 
                 if "error" in analysis:
                     error_msg = f"Psychological analysis failed: {analysis['error']}"
@@ -293,61 +496,84 @@ class OMIGeminiOrchestrator:
                 else:
                     result["steps_completed"].append("psychological_analysis")
 
+            adhd_score, anxiety_score = analysis_scores(analysis)
             result["analysis"] = {
-                "adhd_score": analysis.get("adhd_indicators", {}).get("score", 0),
-                "anxiety_score": analysis.get("anxiety_patterns", {}).get("score", 0),
+                "adhd_score": adhd_score,
+                "anxiety_score": anxiety_score,
                 "bias_score": analysis.get("cognitive_biases", {}).get("score", 0),
                 "emotional_tone": analysis.get("emotional_tone", {}).get("primary_emotion", "unknown")
             }
 
-            # Step 4: Save analysis as memory in OMI
-            with profile_step("memory_save", result["performance_profile"]):
-                memory_content = self._format_analysis_for_memory(analysis, cleaned_result)
-
-                # Use direct OMI client API for memory creation
-                memory_result = self.omi_client.create_memories(
-                    text=memory_content,
-                    memories=[{
-                        "content": memory_content,
-                        "tags": ["gemini_analysis", "psychological_insight"]
-                    }],
-                    text_source="other"
-                )
-
-                result["steps_completed"].append("memory_saved")
-                result["created_memories_count"] = len(memory_result.get("memories", []))
-
-            # Step 5: Workspace automation (run in background for performance)
-            # Check what should be created but don't wait for completion
-            email_created = False
-            calendar_created = False
-            slides_created = False
-
-            if self.workspace_automation.credentials:
-                # Quick checks for what should be automated
-                should_email = self.workspace_automation.should_create_email(
-                    analysis, cleaned_transcript
-                )
-                should_schedule = self._should_schedule_meeting(analysis, cleaned_transcript)
-                should_present = self._should_create_presentation(analysis, cleaned_transcript)
-
-                # Schedule background tasks
-                if should_email or should_schedule or should_present:
-                    # Create background task for workspace automation
-                    memory_id = memory_data.get("id")
-                    if memory_id:
-                        asyncio.create_task(self._run_workspace_automation_background(
-                            analysis, cleaned_transcript, str(memory_id), uid
-                        ))
-
-                    # Mark as queued (not completed yet)
-                    result["workspace_automation_queued"] = True
-                    if should_email:
-                        result["email_queued"] = True
-                    if should_schedule:
-                        result["calendar_queued"] = True
-                    if should_present:
-                        result["presentation_queued"] = True
+            # Low-signal analyses skip the memory save and workspace automation
+            skip_heavy = (
+                max(adhd_score or 0, anxiety_score or 0) < AppSettings.ANALYSIS_THRESHOLD
+                and result["analysis"]["emotional_tone"] in LOW_SIGNAL_EMOTIONS
+            )
+            if skip_heavy:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Low-signal analysis, skipping memory save and automation", extra={
+                        "uid": uid,
+                        "memory_id": memory_data.get('id')
+                    })
+            else:
+                # Generated once and shared with memory formatting and automation
+                summary = self.psychological_analyzer.generate_summary(analysis)
+
+                # Step 4: Save analysis as memory in OMI
+                async def save_memory():
+                    with profile_step("memory_save", result["performance_profile"], time_log=step_times):
+                        memory_content = self._format_analysis_for_memory(analysis, cleaned_result, summary)
+
+                        # Use direct OMI client API for memory creation
+                        memory_result = await asyncio.to_thread(
+                            self.omi_client.create_memories,
+                            text=memory_content,
+                            memories=[{
+                                "content": memory_content,
+                                "tags": ["gemini_analysis", "psychological_insight"]
+                            }],
+                            text_source="other"
+                        )
+
+                        result["steps_completed"].append("memory_saved")
+                        result["created_memories_count"] = len(memory_result.get("memories", []))
+
+                # The Gemini email decision for step 5 doesn't depend on the save, so overlap them
+                async def decide_email() -> bool:
+                    if not self.workspace_automation.credentials:
+                        return False
+                    return await asyncio.to_thread(
+                        self.workspace_automation.should_create_email, analysis, cleaned_transcript
+                    )
+
+                _, should_email = await asyncio.gather(save_memory(), decide_email())
+
+                # Step 5: Workspace automation (run in background for performance)
+                # Check what should be created but don't wait for completion
+                if self.workspace_automation.credentials:
+                    # Quick checks for what should be automated
+                    keyword_mask = classify_transcript_keywords(cleaned_transcript)
+                    should_schedule = self._should_schedule_meeting(adhd_score, anxiety_score, cleaned_transcript, keyword_mask)
+                    should_present = self._should_create_presentation(adhd_score, anxiety_score, cleaned_transcript, keyword_mask)
+
+                    # Schedule background tasks
+                    if should_email or should_schedule or should_present:
+                        # Create background task for workspace automation
+                        memory_id = memory_data.get("id")
+                        if memory_id:
+                            self._spawn_bg(self._run_workspace_automation_background(
+                                analysis, cleaned_transcript, str(memory_id), uid, summary,
+                                should_email, should_schedule, should_present
+                            ))
+
+                        # Mark as queued (not completed yet)
+                        result["workspace_automation_queued"] = True
+                        if should_email:
+                            result["email_queued"] = True
+                        if should_schedule:
+                            result["calendar_queued"] = True
+                        if should_present:
+                            result["presentation_queued"] = True
 
             # Step 6: Send notification to OMI app (background for performance)
             notification_msg = self._build_notification_message(
@@ -359,7 +585,7 @@ class OMIGeminiOrchestrator:
             )
 
             # Send notification asynchronously to not block response
-            asyncio.create_task(self._send_notification_background(notification_msg, uid))
+            self._enqueue_notification(notification_msg, uid)
             result["notification_queued"] = True
 
             # Mark as successful if core steps completed (transcript cleaning is essential)
@@ -377,43 +603,36 @@ class OMIGeminiOrchestrator:
                 result["status"] = "success"
 
             # Performance tracking
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             result["processing_time_seconds"] = processing_time
 
             # Add overall memory usage to profile
-            process = psutil.Process(os.getpid())
-            result["performance_profile"]["total_memory_mb"] = process.memory_info().rss / 1024 / 1024
+            if AppSettings.PROFILE_MEMORY:
+                result["performance_profile"]["total_memory_mb"] = read_rss_mb()
 
             # Update stats
-            self.processing_stats["total_processed"] += 1
-            self.processing_stats["average_processing_time"] = (
-                (self.processing_stats["average_processing_time"] * (self.processing_stats["total_processed"] - 1)) + processing_time
-            ) / self.processing_stats["total_processed"]
-
-            success_count = 1 if result["success"] else 0
-            self.processing_stats["success_rate"] = (
-                (self.processing_stats["success_rate"] * (self.processing_stats["total_processed"] - 1)) + success_count
-            ) / self.processing_stats["total_processed"]
+            # Incremental means avoid the precision loss of re-multiplying by n - 1
+            stats = self.processing_stats
+            stats["total_processed"] += 1
+            n = stats["total_processed"]
+            stats["average_processing_time"] += (processing_time - stats["average_processing_time"]) / n
+            stats["success_rate"] += ((1.0 if result["success"] else 0.0) - stats["success_rate"]) / n
 
             # Track step performance for optimization insights
-            if "performance_profile" not in self.processing_stats:
-                self.processing_stats["performance_profile"] = {}
-
-            for step_name, step_time in result["performance_profile"].items():
-                if step_name.endswith("_time"):
-                    if step_name not in self.processing_stats["performance_profile"]:
-                        self.processing_stats["performance_profile"][step_name] = []
-                    self.processing_stats["performance_profile"][step_name].append(step_time)
-                    # Keep only last 100 measurements for rolling average
-                    if len(self.processing_stats["performance_profile"][step_name]) > 100:
-                        self.processing_stats["performance_profile"][step_name] = self.processing_stats["performance_profile"][step_name][-100:]
-
-            logger.info(f"Memory processing completed in {processing_time:.2f}s. Status: {result['status']}, Steps: {len(result['steps_completed'])}, Warnings: {len(result['warnings'])}, Errors: {len(result['errors'])}, Critical: {len(result['critical_errors'])}")
+            step_history = self.processing_stats["performance_profile"]
+            for step_name, step_time in step_times:
+                step_history[step_name].append(step_time)
+
+            logger.info(
+                "Memory processing completed in %.2fs. Status: %s, Steps: %d, Warnings: %d, Errors: %d, Critical: %d",
+                processing_time, result['status'], len(result['steps_completed']), len(result['warnings']),
+                len(result['errors']), len(result['critical_errors'])
+            )
 
             return result
 
         except Exception as e:
-            logger.error(f"Unexpected error in memory processing: {str(e)}", exc_info=True)
+            logger.error("Unexpected error in memory processing: %s", e, exc_info=True)
             result["errors"].append(f"Unexpected error: {str(e)}")
             return result
 
@@ -440,12 +659,12 @@ class OMIGeminiOrchestrator:
         except ValueError as e:
             raise ValueError(f"Invalid segments: {str(e)}")
 
-        logger.info(f"Processing realtime transcript, session: {session_id}, segments: {len(segments)}")
+        logger.info("Processing realtime transcript, session: %s, segments: %d", session_id, len(segments))
 
-        # Combine segments into full text
-        full_text = " ".join([seg.get("text", "") for seg in segments])
+        # Combine non-empty segments into full text
+        full_text = join_segment_text(segments)
 
-        if not full_text.strip():
+        if not full_text or full_text.isspace():
             return {"success": False, "error": "Empty transcript"}
 
         # For real-time, we might do lightweight processing
@@ -471,100 +690,153 @@ class OMIGeminiOrchestrator:
         if not isinstance(limit, int) or limit < 1 or limit > 50:
             raise ValueError("limit must be an integer between 1 and 50")
 
-        logger.info(f"Manual analysis of {limit} recent conversations")
+        logger.info("Manual analysis of %d recent conversations", limit)
 
         try:
             # Use direct OMI client to get conversations
-            conversations = self.omi_client.read_conversations(limit=limit)
+            conversations = await asyncio.to_thread(self.omi_client.read_conversations, limit=limit)
 
-            results = []
-            for conv in conversations:
-                logger.info(f"Analyzing conversation {conv.get('id')}")
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
 
+            async def clean_one(conv: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 # Extract text
                 text = conv.get("text", "")
                 if not text:
-                    continue
+                    return None
 
-                # Process
-                cleaned = self.transcript_processor.process_transcript(text)
-                if not cleaned["success"]:
-                    continue
+                async with semaphore:
+                    logger.info("Analyzing conversation %s", conv.get('id'))
 
-                analysis = self.psychological_analyzer.analyze(cleaned["cleaned_text"])
+                    # Process
+                    cleaned = await asyncio.to_thread(self.transcript_processor.process_transcript, text)
+                    if not cleaned["success"]:
+                        return None
 
-                results.append({
-                    "conversation_id": conv.get("id"),
-                    "analysis": analysis,
-                    "cleaned_transcript": cleaned["cleaned_text"],
-                    "model_used": cleaned["model_used"]
-                })
+                return cleaned
+
+            # Clean concurrently; gather keeps conversation order
+            outcomes = await asyncio.gather(
+                *(clean_one(conv) for conv in conversations), return_exceptions=True
+            )
 
-            logger.info(f"Completed analysis of {len(results)} conversations")
+            cleaned_conversations = []
+            for conv, outcome in zip(conversations, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error("Analysis of conversation %s failed: %s", conv.get('id'), outcome)
+                elif outcome is not None:
+                    cleaned_conversations.append((conv, outcome))
+
+            chunks = [
+                cleaned_conversations[start:start + ANALYSIS_BATCH_SIZE]
+                for start in range(0, len(cleaned_conversations), ANALYSIS_BATCH_SIZE)
+            ]
+
+            async def analyze_chunk(chunk: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    analyses = await asyncio.to_thread(
+                        self.psychological_analyzer.analyze_batch,
+                        [cleaned["cleaned_text"] for _, cleaned in chunk]
+                    )
+                if len(analyses) != len(chunk):
+                    raise ValueError(f"Expected {len(chunk)} analyses, got {len(analyses)}")
+                return analyses
+
+            # Each chunk shares one Gemini request; chunks run concurrently
+            chunk_outcomes = await asyncio.gather(
+                *(analyze_chunk(chunk) for chunk in chunks), return_exceptions=True
+            )
+
+            results = []
+            for chunk, outcome in zip(chunks, chunk_outcomes):
+                if isinstance(outcome, Exception):
+                    for conv, _ in chunk:
+                        logger.error("Analysis of conversation %s failed: %s", conv.get('id'), outcome)
+                    continue
+
+                results.extend(
+                    {
+                        "conversation_id": conv.get("id"),
+                        "analysis": analysis,
+                        "cleaned_transcript": cleaned["cleaned_text"],
+                        "model_used": cleaned["model_used"]
+                    }
+                    for (conv, cleaned), analysis in zip(chunk, outcome)
+                )
+
+            logger.info("Completed analysis of %d conversations", len(results))
             return results
 
         except Exception as e:
-            logger.error(f"Manual analysis failed: {str(e)}")
+            logger.error("Manual analysis failed: %s", e)
             return []
 
     def _extract_transcript(self, memory_data: Dict[str, Any]) -> Optional[str]:
         """Extract transcript text from memory data"""
 
-        # Try multiple possible locations
-        if "transcript_segments" in memory_data:
-            segments = memory_data["transcript_segments"]
-            return " ".join([seg.get("text", "") for seg in segments])
+        # Try multiple possible locations, one lookup each
+        segments = memory_data.get("transcript_segments")
+        if segments is not None:
+            return join_segment_text(segments)
 
-        if "text" in memory_data:
-            return memory_data["text"]
+        text = memory_data.get("text")
+        if text is not None:
+            return text
 
-        if "structured" in memory_data and "overview" in memory_data["structured"]:
-            return memory_data["structured"]["overview"]
+        structured = memory_data.get("structured")
+        if structured:
+            return structured.get("overview")
 
         return None
 
-    def _format_analysis_for_memory(self, analysis: Dict[str, Any], cleaned_result: Dict[str, Any]) -> str:
-        """Format analysis results as memory content"""
-
-        summary = self.psychological_analyzer.generate_summary(analysis)
-
-        memory_text = f"""Gemini AI Analysis (Model: {cleaned_result.get('model_used', 'unknown')})
-
-{summary}
-
-Generated: {datetime.now(timezone.utc).isoformat()}
+    def _format_analysis_for_memory(self, analysis: Dict[str, Any], cleaned_result: Dict[str, Any],
+                                    summary: Optional[str] = None) -> str:
+        """Format analysis results as memory content, reusing `summary` if already generated"""
 
-This analysis is generated automatically and should not replace professional evaluation."""
+        if summary is None:
+            summary = self.psychological_analyzer.generate_summary(analysis)
 
-        return memory_text
+        return ANALYSIS_MEMORY_TEMPLATE.format(
+            model=cleaned_result.get('model_used', 'unknown'),
+            summary=summary,
+            generated_at=cached_timestamps()[0]
+        )
 
-    def _should_schedule_meeting(self, analysis: Dict[str, Any], transcript: str) -> bool:
-        """Determine if a calendar meeting should be scheduled based on analysis"""
+    def _should_schedule_meeting(self, adhd_score: int, anxiety_score: int, transcript: str,
+                                 keyword_mask: Optional[int] = None) -> bool:
+        """Determine if a calendar meeting should be scheduled based on analysis scores"""
         # Simple heuristic: schedule if high anxiety or ADHD scores, or if transcript mentions follow-up
-        adhd_score = analysis.get("adhd_indicators", {}).get("score", 0)
-        anxiety_score = analysis.get("anxiety_patterns", {}).get("score", 0)
-
-        follow_up_keywords = ["follow up", "follow-up", "meeting", "schedule", "appointment", "discuss later"]
-        has_follow_up = any(keyword in transcript.lower() for keyword in follow_up_keywords)
+        if adhd_score >= 6 or anxiety_score >= 6:
+            return True
 
-        return (adhd_score >= 6 or anxiety_score >= 6 or has_follow_up)
+        # Only scan the transcript when the scores alone don't decide
+        if keyword_mask is None:
+            keyword_mask = classify_transcript_keywords(transcript)
+        return bool(keyword_mask & FOLLOW_UP_KEYWORD)
 
-    def _should_create_presentation(self, analysis: Dict[str, Any], transcript: str) -> bool:
-        """Determine if a presentation should be created based on analysis"""
+    def _should_create_presentation(self, adhd_score: int, anxiety_score: int, transcript: str,
+                                    keyword_mask: Optional[int] = None) -> bool:
+        """Determine if a presentation should be created based on analysis scores"""
         # Create presentation for important professional discussions or high-scoring analyses
-        adhd_score = analysis.get("adhd_indicators", {}).get("score", 0)
-        anxiety_score = analysis.get("anxiety_patterns", {}).get("score", 0)
-
-        professional_keywords = ["meeting", "presentation", "project", "business", "work", "professional"]
-        is_professional = any(keyword in transcript.lower() for keyword in professional_keywords)
+        if adhd_score < 4 and anxiety_score < 4:
+            return False
 
-        return is_professional and (adhd_score >= 4 or anxiety_score >= 4)
+        # Only scan the transcript when the scores qualify
+        if keyword_mask is None:
+            keyword_mask = classify_transcript_keywords(transcript)
+        return bool(keyword_mask & PROFESSIONAL_KEYWORD)
 
-    def _generate_slide_content(self, section_type: str, analysis: Dict[str, Any], transcript: str, prompt_instruction: str) -> str:
+    def _generate_slide_content(self, section_type: str, analysis: Dict[str, Any], transcript: str, prompt_instruction: str,
+                                analysis_summary: Optional[str] = None) -> str:
         """Generate content for a specific slide section using Gemini"""
         try:
             # Create context from analysis
-            analysis_summary = self.psychological_analyzer.generate_summary(analysis)
+            if analysis_summary is None:
+                analysis_summary = self.psychological_analyzer.generate_summary(analysis)
+
+            if len(transcript) > SLIDE_TRANSCRIPT_CHARS:
+                transcript_context = transcript[:SLIDE_TRANSCRIPT_CHARS] + "... (truncated for brevity)"
+            else:
+                transcript_context = transcript
 
             full_prompt = f"""You are creating content for a presentation slide about a conversation analysis.
 
@@ -572,7 +844,7 @@ Section: {section_type.replace('_', ' ').title()}
 Instructions: {prompt_instruction}
 
 Conversation Transcript:
-{transcript[:2000]}... (truncated for brevity)
+{transcript_context}
 
 Psychological Analysis Summary:
 {analysis_summary}
@@ -590,17 +862,23 @@ Format your response as clean text that will look good on a slide."""
             content = response.text.strip()
 
             # Ensure content isn't too long for a slide
-            if len(content) > 500:
-                content = content[:497] + "..."
+            if len(content) > SLIDE_CONTENT_CHARS:
+                content = content[:SLIDE_CONTENT_CHARS - 3] + "..."
 
             return content
 
         except Exception as e:
-            logger.error(f"Error generating slide content for {section_type}: {str(e)}")
+            logger.error("Error generating slide content for %s: %s", section_type, e)
             return f"Error generating content for {section_type.replace('_', ' ').title()}"
 
-    def _generate_slides_content(self, analysis: Dict[str, Any], transcript: str) -> List[Dict[str, Any]]:
+    async def _generate_slides_content(self, analysis: Dict[str, Any], transcript: str,
+                                       summary: Optional[str] = None) -> List[Dict[str, Any]]:
         """Generate template-based slides content for presentation with structured sections"""
+        if summary is None:
+            summary = self.psychological_analyzer.generate_summary(analysis)
+
+        adhd_score, anxiety_score = analysis_scores(analysis)
+
         try:
             # Generate content for each section using Gemini
             slides_data = []
@@ -609,79 +887,53 @@ Format your response as clean text that will look good on a slide."""
             slides_data.append({
                 "layout": "TITLE",
                 "title": "Meeting Analysis & Insights",
-                "body": f"Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\nPowered by Gemini AI"
-            })
-
-            # Key Points slide
-            key_points_content = self._generate_slide_content(
-                "key_points",
-                analysis,
-                transcript,
-                "Extract and summarize the 3-5 most important key points from this conversation. Focus on main topics, decisions made, and critical information discussed."
-            )
-            slides_data.append({
-                "layout": "TITLE_AND_BODY",
-                "title": "Key Points",
-                "body": key_points_content
-            })
-
-            # Action Items slide
-            action_items_content = self._generate_slide_content(
-                "action_items",
-                analysis,
-                transcript,
-                "Identify all action items, tasks, follow-ups, or commitments mentioned in the conversation. List them clearly with responsible parties if mentioned."
-            )
-            slides_data.append({
-                "layout": "TITLE_AND_BODY",
-                "title": "Action Items",
-                "body": action_items_content
-            })
-
-            # Psychological Insights slide
-            psychological_insights = self._generate_slide_content(
-                "psychological_insights",
-                analysis,
-                transcript,
-                f"Based on the psychological analysis (ADHD: {analysis.get('adhd_indicators', {}).get('score', 0)}/10, Anxiety: {analysis.get('anxiety_patterns', {}).get('score', 0)}/10), provide insights about communication patterns, emotional dynamics, and recommendations for future interactions."
-            )
-            slides_data.append({
-                "layout": "TITLE_AND_BODY",
-                "title": "Psychological Insights",
-                "body": psychological_insights
+                "body": f"Generated on {cached_timestamps()[1]}\n\nPowered by Gemini AI"
             })
 
-            # Conclusions slide
-            conclusions_content = self._generate_slide_content(
-                "conclusions",
-                analysis,
-                transcript,
-                "Provide overall conclusions about the conversation, including outcomes achieved, areas for improvement, and recommendations for follow-up actions."
-            )
-            slides_data.append({
-                "layout": "TITLE_AND_BODY",
-                "title": "Conclusions",
-                "body": conclusions_content
-            })
+            # Section slides are independent Gemini calls, so generate them concurrently
+            sections = [
+                ("key_points", "Key Points",
+                 "Extract and summarize the 3-5 most important key points from this conversation. Focus on main topics, decisions made, and critical information discussed."),
+                ("action_items", "Action Items",
+                 "Identify all action items, tasks, follow-ups, or commitments mentioned in the conversation. List them clearly with responsible parties if mentioned."),
+                ("psychological_insights", "Psychological Insights",
+                 f"Based on the psychological analysis (ADHD: {adhd_score}/10, Anxiety: {anxiety_score}/10), provide insights about communication patterns, emotional dynamics, and recommendations for future interactions."),
+                ("conclusions", "Conclusions",
+                 "Provide overall conclusions about the conversation, including outcomes achieved, areas for improvement, and recommendations for follow-up actions."),
+            ]
+            async def generate_section(section_type: str, instruction: str) -> str:
+                async with self._slide_semaphore:
+                    return await asyncio.to_thread(
+                        self._generate_slide_content, section_type, analysis, transcript, instruction, summary
+                    )
+
+            contents = await asyncio.gather(*(
+                generate_section(section_type, instruction) for section_type, _, instruction in sections
+            ))
+            for (_, title, _), content in zip(sections, contents):
+                slides_data.append({
+                    "layout": "TITLE_AND_BODY",
+                    "title": title,
+                    "body": content
+                })
 
-            logger.info(f"Generated {len(slides_data)} slides for presentation")
+            logger.info("Generated %d slides for presentation", len(slides_data))
             return slides_data
 
         except Exception as e:
-            logger.error(f"Error generating slides content: {str(e)}")
+            logger.error("Error generating slides content: %s", e)
             # Fallback to basic slides
-            summary = self.psychological_analyzer.generate_summary(analysis)
             return [
                 {
                     "layout": "TITLE_AND_BODY",
                     "title": "Conversation Analysis Summary",
-                    "body": f"Analysis generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n{summary}"
+                    "body": f"Analysis generated on {cached_timestamps()[1]}\n\n{summary}"
                 },
                 {
                     "layout": "TITLE_AND_BODY",
                     "title": "Key Findings",
-                    "body": f"ADHD Indicators: {analysis.get('adhd_indicators', {}).get('score', 0)}/10\n"
-                           f"Anxiety Patterns: {analysis.get('anxiety_patterns', {}).get('score', 0)}/10\n"
+                    "body": f"ADHD Indicators: {adhd_score}/10\n"
+                           f"Anxiety Patterns: {anxiety_score}/10\n"
                            f"Cognitive Biases: {analysis.get('cognitive_biases', {}).get('score', 0)}/10\n"
                            f"Emotional Tone: {analysis.get('emotional_tone', {}).get('primary_emotion', 'unknown')}"
                 },
@@ -693,93 +945,168 @@ Format your response as clean text that will look good on a slide."""
             ]
 
     async def _run_workspace_automation_background(self, analysis: Dict[str, Any], cleaned_transcript: str,
-                                                  memory_id: str, uid: str):
-        """Run workspace automation in background after webhook response"""
+                                                  memory_id: str, uid: str, summary: Optional[str] = None,
+                                                  should_email: Optional[bool] = None,
+                                                  should_schedule: Optional[bool] = None,
+                                                  should_present: Optional[bool] = None):
+        """Run workspace automation in background after webhook response
+
+        Decisions already made by the caller are passed in so the transcript
+        is not rescanned; any left as None are computed here.
+        """
 
         try:
-            logger.info(f"Starting background workspace automation for memory {memory_id}, uid {uid}")
+            if summary is None:
+                summary = self.psychological_analyzer.generate_summary(analysis)
 
-            email_created = False
-            calendar_created = False
-            slides_created = False
+            logger.info("Starting background workspace automation for memory %s, uid %s", memory_id, uid)
 
-            # Email automation
-            should_email = self.workspace_automation.should_create_email(analysis, cleaned_transcript)
-            if should_email:
-                draft_id = self.workspace_automation.create_email_draft(
-                    context=f"Analysis Summary:\n{self.psychological_analyzer.generate_summary(analysis)}\n\nTranscript:\n{cleaned_transcript}"
+            if should_email is None:
+                should_email = await asyncio.to_thread(
+                    self.workspace_automation.should_create_email, analysis, cleaned_transcript
                 )
-                if draft_id:
-                    email_created = True
-                    logger.info(f"Background email draft created for memory {memory_id}")
-
-            # Calendar integration
-            should_schedule = self._should_schedule_meeting(analysis, cleaned_transcript)
+            keyword_mask = None
+            if should_schedule is None or should_present is None:
+                keyword_mask = classify_transcript_keywords(cleaned_transcript)
+            if should_schedule is None:
+                should_schedule = self._should_schedule_meeting(*analysis_scores(analysis), cleaned_transcript, keyword_mask)
+            if should_present is None:
+                should_present = self._should_create_presentation(*analysis_scores(analysis), cleaned_transcript, keyword_mask)
+
+            # Gmail, Calendar and Slides are separate APIs, so run them concurrently
+            actions = []
+            if should_email:
+                actions.append(("email", self._create_email_background(summary, cleaned_transcript, memory_id)))
             if should_schedule:
-                event_id = self.workspace_automation.create_calendar_event(
-                    summary=f"Follow-up: {analysis.get('overall_assessment', 'Discussion')[:50]}",
-                    start_time=(datetime.now(timezone.utc) + timedelta(days=1)).isoformat(),
-                    end_time=(datetime.now(timezone.utc) + timedelta(days=1, hours=1)).isoformat(),
-                    description=f"Analysis: {self.psychological_analyzer.generate_summary(analysis)}"
-                )
-                if event_id:
-                    calendar_created = True
-                    logger.info(f"Background calendar event created for memory {memory_id}")
-
-            # Slides integration
-            should_present = self._should_create_presentation(analysis, cleaned_transcript)
+                actions.append(("calendar", self._create_calendar_event_background(analysis, summary, memory_id)))
             if should_present:
-                slides_content = self._generate_slides_content(analysis, cleaned_transcript)
-                presentation_id = self.workspace_automation.create_presentation(
-                    title=f"Analysis: {datetime.now().strftime('%Y-%m-%d')}",
-                    slides_content=slides_content
-                )
-                if presentation_id:
-                    slides_created = True
-                    logger.info(f"Background presentation created for memory {memory_id}")
+                actions.append(("slides", self._create_presentation_background(analysis, cleaned_transcript, summary, memory_id)))
+
+            outcomes = await asyncio.gather(*(action for _, action in actions), return_exceptions=True)
+            created = {name: outcome is True for (name, _), outcome in zip(actions, outcomes)}
+            errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+
+            email_created = created.get("email", False)
+            calendar_created = created.get("calendar", False)
+            slides_created = created.get("slides", False)
 
             # Send completion notification
             if email_created or calendar_created or slides_created:
                 notification_msg = f"Workspace automation completed - Email: {email_created}, Calendar: {calendar_created}, Slides: {slides_created}"
-                self.omi_client.send_notification(notification_msg, uid)
-                logger.info(f"Background automation completed for memory {memory_id}")
+                self._enqueue_notification(notification_msg, uid)
+                logger.info("Background automation completed for memory %s", memory_id)
+
+            if errors:
+                raise errors[0]
 
         except Exception as e:
             error_msg = str(e)
-            logger.error(f"Background workspace automation failed for memory {memory_id}: {error_msg}")
+            logger.error("Background workspace automation failed for memory %s: %s", memory_id, error_msg)
             # Send error notification
-            try:
-                self.omi_client.send_notification(f"Workspace automation failed: {error_msg}", uid)
-            except:
-                pass  # Don't let notification failure crash the background task
+            self._enqueue_notification(f"Workspace automation failed: {error_msg}", uid)
+
+    async def _create_email_background(self, summary: str, cleaned_transcript: str, memory_id: str) -> bool:
+        """Create the Gmail draft for a memory, returning True on success"""
+        async with self._workspace_locks["gmail"]:
+            draft_id = await asyncio.to_thread(
+                self.workspace_automation.create_email_draft,
+                context=f"Analysis Summary:\n{summary}\n\nTranscript:\n{cleaned_transcript}"
+            )
+        if draft_id:
+            logger.info("Background email draft created for memory %s", memory_id)
+        return bool(draft_id)
+
+    async def _create_calendar_event_background(self, analysis: Dict[str, Any], summary: str, memory_id: str) -> bool:
+        """Create the follow-up Calendar event for a memory, returning True on success"""
+        start = datetime.now(timezone.utc) + timedelta(days=1)
+        async with self._workspace_locks["calendar"]:
+            event_id = await asyncio.to_thread(
+                self.workspace_automation.create_calendar_event,
+                summary=f"Follow-up: {analysis.get('overall_assessment', 'Discussion')[:50]}",
+                start_time=start.isoformat(),
+                end_time=(start + timedelta(hours=1)).isoformat(),
+                description=f"Analysis: {summary}"
+            )
+        if event_id:
+            logger.info("Background calendar event created for memory %s", memory_id)
+        return bool(event_id)
+
+    async def _create_presentation_background(self, analysis: Dict[str, Any], cleaned_transcript: str,
+                                              summary: str, memory_id: str) -> bool:
+        """Generate slides and create the Slides presentation for a memory, returning True on success"""
+        slides_content = await self._generate_slides_content(analysis, cleaned_transcript, summary)
+        async with self._workspace_locks["slides"]:
+            presentation_id = await asyncio.to_thread(
+                self.workspace_automation.create_presentation,
+                title=f"Analysis: {cached_timestamps()[1][:10]}",
+                slides_content=slides_content
+            )
+        if presentation_id:
+            logger.info("Background presentation created for memory %s", memory_id)
+        return bool(presentation_id)
 
     async def _send_notification_background(self, message: str, uid: str):
         """Send notification asynchronously"""
         try:
-            notification_sent = self.omi_client.send_notification(message, uid)
+            notification_sent = await asyncio.to_thread(self.omi_client.send_notification, message, uid)
             if not notification_sent:
-                logger.warning(f"Background notification failed to send for uid {uid}")
+                logger.warning("Background notification failed to send for uid %s", uid)
         except Exception as e:
-            logger.error(f"Background notification error for uid {uid}: {str(e)}")
+            logger.error("Background notification error for uid %s: %s", uid, e)
+
+    def _enqueue_notification(self, message: str, uid: str):
+        """Queue a notification for the coalescing flusher"""
+        if self._notify_task is None or self._notify_task.done():
+            self._notify_queue = asyncio.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+            self._notify_task = asyncio.create_task(self._notify_flusher())
+
+        try:
+            self._notify_queue.put_nowait((message, uid))
+        except asyncio.QueueFull:
+            logger.warning("Notification queue full, sending directly for uid %s", uid)
+            self._spawn_bg(self._send_notification_background(message, uid))
+
+    async def _notify_flusher(self):
+        """Send queued notifications, merging messages for the same user into one request"""
+        queue = self._notify_queue
+        while True:
+            batch = [await queue.get()]
+            try:
+                while len(batch) < NOTIFY_BATCH_SIZE:
+                    batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+
+            messages_by_uid: DefaultDict[str, List[str]] = defaultdict(list)
+            for message, uid in batch:
+                messages_by_uid[uid].append(message)
+
+            try:
+                await asyncio.gather(*(
+                    self._send_notification_background("\n\n".join(messages), uid)
+                    for uid, messages in messages_by_uid.items()
+                ))
+            finally:
+                for _ in batch:
+                    queue.task_done()
 
     def _build_notification_message(self, analysis: Dict[str, Any], email_created: bool, calendar_created: bool, slides_created: bool, steps_count: int) -> str:
         """Build notification message for OMI app"""
 
-        adhd_score = analysis.get("adhd_indicators", {}).get("score", 0)
-        anxiety_score = analysis.get("anxiety_patterns", {}).get("score", 0)
+        adhd_score, anxiety_score = analysis_scores(analysis)
         bias_score = analysis.get("cognitive_biases", {}).get("score", 0)
 
-        msg = f"Gemini analysis complete ({steps_count} steps)"
+        parts = [f"Gemini analysis complete ({steps_count} steps)"]
 
-        if adhd_score >= 5 or anxiety_score >= 5 or bias_score >= 5:
-            scores = []
-            if adhd_score >= 5:
-                scores.append(f"ADHD:{adhd_score}")
-            if anxiety_score >= 5:
-                scores.append(f"Anxiety:{anxiety_score}")
-            if bias_score >= 5:
-                scores.append(f"Biases:{bias_score}")
-            msg += f" - Patterns detected ({'/'.join(scores)}/10)"
+        scores = []
+        if adhd_score >= 5:
+            scores.append(f"ADHD:{adhd_score}")
+        if anxiety_score >= 5:
+            scores.append(f"Anxiety:{anxiety_score}")
+        if bias_score >= 5:
+            scores.append(f"Biases:{bias_score}")
+        if scores:
+            parts.append(f" - Patterns detected ({'/'.join(scores)}/10)")
 
         automation_items = []
         if email_created:
@@ -788,11 +1115,10 @@ Format your response as clean text that will look good on a slide."""
             automation_items.append("calendar")
         if slides_created:
             automation_items.append("slides")
-
         if automation_items:
-            msg += f" - Created: {', '.join(automation_items)}"
+            parts.append(f" - Created: {', '.join(automation_items)}")
 
-        return msg
+        return "".join(parts)
 
     def process_multimodal_input(self, input_data: Any, modality: ModalityType, uid: str, **kwargs) -> Dict[str, Any]:
         """
@@ -811,18 +1137,18 @@ Format your response as clean text that will look good on a slide."""
         if not InputValidator.validate_uid(uid):
             raise ValueError("Invalid uid")
 
-        start_time = time.time()
-        logger.info(f"Processing {modality.value} input for user {uid}")
+        start_time = time.perf_counter()
+        logger.info("Processing %s input for user %s", modality.value, uid)
 
         try:
             # Get the appropriate processor
-            processor = self.processor_registry.get_processor(modality)
+            processor = self._get_processor(modality)
             if not processor:
                 return {
                     "success": False,
                     "error": f"No processor available for modality: {modality.value}",
                     "modality": modality.value,
-                    "processing_time_seconds": time.time() - start_time
+                    "processing_time_seconds": time.perf_counter() - start_time
                 }
 
             # Process the input
@@ -830,22 +1156,22 @@ Format your response as clean text that will look good on a slide."""
 
             # Convert to dictionary format for consistency
             response = result.to_dict()
-            response["processing_time_seconds"] = time.time() - start_time
+            response["processing_time_seconds"] = time.perf_counter() - start_time
 
             if result.success:
-                logger.info(f"Successfully processed {modality.value} input for user {uid}")
+                logger.info("Successfully processed %s input for user %s", modality.value, uid)
             else:
-                logger.warning(f"Failed to process {modality.value} input for user {uid}: {result.error}")
+                logger.warning("Failed to process %s input for user %s: %s", modality.value, uid, result.error)
 
             return response
 
         except Exception as e:
-            logger.error(f"Multimodal processing failed for {modality.value}: {str(e)}")
+            logger.error("Multimodal processing failed for %s: %s", modality.value, e)
             return {
                 "success": False,
                 "error": str(e),
                 "modality": modality.value,
-                "processing_time_seconds": time.time() - start_time
+                "processing_time_seconds": time.perf_counter() - start_time
             }
 
     def process_audio_stream(self, audio_bytes: bytes, sample_rate: int, uid: str) -> Dict[str, Any]:
@@ -865,7 +1191,7 @@ Format your response as clean text that will look good on a slide."""
             raise ValueError("Invalid uid")
         if not isinstance(audio_bytes, bytes):
             raise ValueError("audio_bytes must be bytes")
-        if len(audio_bytes) > 10 * 1024 * 1024:  # 10MB limit
+        if len(audio_bytes) > MAX_AUDIO_CHUNK_BYTES:
             raise ValueError("Audio data too large")
 
         try:
@@ -873,7 +1199,7 @@ Format your response as clean text that will look good on a slide."""
         except ValueError:
             raise
 
-        logger.info(f"Processing audio stream for user {uid}, {len(audio_bytes)} bytes at {sample_rate}Hz")
+        logger.info("Processing audio stream for user %s, %d bytes at %sHz", uid, len(audio_bytes), sample_rate)
 
         # Use the new multimodal processing system
         return self.process_multimodal_input(
@@ -884,18 +1210,45 @@ Format your response as clean text that will look good on a slide."""
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get current performance statistics"""
         stats = self.processing_stats.copy()
-
-        # Calculate averages for step performance
-        if "performance_profile" in stats:
-            for step_name, times in stats["performance_profile"].items():
-                if times:
-                    stats[f"avg_{step_name}"] = sum(times) / len(times)
-                    stats[f"max_{step_name}"] = max(times)
-                    stats[f"min_{step_name}"] = min(times)
+        step_history = stats["performance_profile"]
+        stats["performance_profile"] = {}
+
+        # Aggregates cover the same window as the returned history
+        for step_name, timings in step_history.items():
+            recent = timings.recent
+            stats["performance_profile"][step_name] = list(recent)
+            if recent:
+                stats[f"avg_{step_name}"] = timings.total / len(recent)
+                stats[f"max_{step_name}"] = max(recent)
+                stats[f"min_{step_name}"] = min(recent)
 
         return stats
 
+    def _spawn_bg(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Schedule a background coroutine and keep a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_bg_task_done)
+        return task
+
+    def _on_bg_task_done(self, task: asyncio.Task):
+        """Drop a finished background task and log any exception it raised"""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background task failed", exc_info=task.exception())
+
+    async def aclose(self):
+        """Wait for in-flight background tasks and queued notifications to finish"""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
+        if self._notify_task is not None and not self._notify_task.done():
+            await self._notify_queue.join()
+            self._notify_task.cancel()
+            self._notify_task = None
+
     async def close(self):
         """Cleanup resources"""
+        await self.aclose()
         self.omi_client.close()
         logger.info("Orchestrator closed")
@@ -3,6 +3,7 @@ Example custom processor plugin
 This demonstrates how to extend the system with custom modality processors
 """
 import logging
+import time
 from modules.modality_processor import TextProcessor, ProcessingResult
 from config.settings import AppSettings
 
@@ -22,8 +23,7 @@ class CustomTextProcessor(TextProcessor):
 
     def process(self, input_data: str, **kwargs) -> ProcessingResult:
         """Process text with custom logic"""
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Add custom processing logic here
@@ -49,7 +49,7 @@ class CustomTextProcessor(TextProcessor):
                     "original_length": len(input_data),
                     "processed_length": len(processed_text)
                 },
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 model_used="custom_processor_v1.0"
             )
 
@@ -59,7 +59,7 @@ class CustomTextProcessor(TextProcessor):
                 success=False,
                 modality=self.modality_type,
                 error=str(e),
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
 
     def get_supported_formats(self) -> list[str]:
@@ -2,13 +2,14 @@
 Registry for modality processors
 """
 import logging
-import importlib.util
-import inspect
-from pathlib import Path
-from typing import Dict, Optional, List, Any
+import importlib
+import os
+import pkgutil
+from typing import Dict, Optional, List, Tuple, Any
 
 from config.settings import AppSettings, MultimodalConfig
 from .modality_processor import BaseModalityProcessor, ModalityType, TextProcessor, AudioProcessor, ImageProcessor
+from . import plugins
 
 # Setup logging if not already configured
 if not logging.getLogger().hasHandlers():
@@ -16,6 +17,53 @@ if not logging.getLogger().hasHandlers():
 
 logger = logging.getLogger(__name__)
 
+# Processor classes importable by plugins, never registered as plugins themselves
+_BUILTIN_PROCESSOR_CLASSES = (BaseModalityProcessor, TextProcessor, AudioProcessor, ImageProcessor)
+
+# Modality of each built-in processor base, matched against a plugin class's MRO
+_MODALITY_BASES: Dict[type, ModalityType] = {
+    TextProcessor: ModalityType.TEXT,
+    AudioProcessor: ModalityType.AUDIO,
+    ImageProcessor: ModalityType.IMAGE,
+}
+
+# Plugin classes found per (plugin dir, dir mtime), so later registries skip the rescan
+_plugin_scan_cache: Dict[Tuple[str, int], List[type]] = {}
+
+
+def _scan_plugins() -> List[type]:
+    """Import every module in the plugins package and return its processor classes"""
+    plugin_dir = plugins.__path__[0]
+    try:
+        cache_key = (plugin_dir, os.stat(plugin_dir).st_mtime_ns)
+    except OSError:
+        return []
+
+    cached = _plugin_scan_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    found: List[type] = []
+    for module_info in pkgutil.iter_modules(plugins.__path__):
+        if module_info.name.startswith("_"):
+            continue
+
+        try:
+            module = importlib.import_module(f"{plugins.__name__}.{module_info.name}")
+        except Exception as e:
+            logger.warning(f"Failed to load plugin {module_info.name}: {str(e)}")
+            continue
+
+        for obj in vars(module).values():
+            if (isinstance(obj, type) and
+                issubclass(obj, BaseModalityProcessor) and
+                obj not in _BUILTIN_PROCESSOR_CLASSES):
+                found.append(obj)
+
+    _plugin_scan_cache[cache_key] = found
+    return found
+
+
 class ProcessorRegistry:
     """Registry for modality processors with plugin support"""
 
@@ -48,61 +96,29 @@ class ProcessorRegistry:
     def _load_plugins(self):
         """Load processors from plugins directory"""
         try:
-            plugins_dir = Path(__file__).parent / "plugins"
-            if not plugins_dir.exists():
-                return
-
-            for plugin_file in plugins_dir.glob("*.py"):
-                if plugin_file.name.startswith("_"):
-                    continue
-
-                try:
-                    self._load_plugin_file(plugin_file)
-                except Exception as e:
-                    logger.warning(f"Failed to load plugin {plugin_file.name}: {str(e)}")
-
+            for cls in _scan_plugins():
+                self._register_plugin_class(cls)
         except Exception as e:
             logger.warning(f"Plugin loading failed: {str(e)}")
 
-    def _load_plugin_file(self, plugin_file: Path):
-        """Load a single plugin file"""
+    def _register_plugin_class(self, cls: type):
+        """Instantiate a plugin processor class and register it"""
         try:
-            module_name = f"modules.plugins.{plugin_file.stem}"
-            spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Find processor classes
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) and
-                        issubclass(obj, BaseModalityProcessor) and
-                        obj != BaseModalityProcessor):
-
-                        # Create instance and register
-                        try:
-                            processor_instance = obj()  # type: ignore
-                            # Determine modality from class hierarchy
-                            modality = self._determine_modality_from_class(obj)
-                            if modality:
-                                self.register_processor(modality, processor_instance)
-                                logger.info(f"Loaded plugin processor: {name} for {modality.value}")
-                        except Exception as e:
-                            logger.warning(f"Failed to instantiate plugin processor {name}: {str(e)}")
-
+            processor_instance = cls()  # type: ignore
+            # Determine modality from class hierarchy
+            modality = self._determine_modality_from_class(cls)
+            if modality:
+                self.register_processor(modality, processor_instance)
+                logger.info(f"Loaded plugin processor: {cls.__name__} for {modality.value}")
         except Exception as e:
-            logger.error(f"Error loading plugin {plugin_file}: {str(e)}")
-            raise
+            logger.warning(f"Failed to instantiate plugin processor {cls.__name__}: {str(e)}")
 
     def _determine_modality_from_class(self, cls) -> Optional[ModalityType]:
         """Determine modality from class inheritance"""
-        if issubclass(cls, TextProcessor):
-            return ModalityType.TEXT
-        elif issubclass(cls, AudioProcessor):
-            return ModalityType.AUDIO
-        elif issubclass(cls, ImageProcessor):
-            return ModalityType.IMAGE
+        for base in cls.__mro__:
+            modality = _MODALITY_BASES.get(base)
+            if modality:
+                return modality
         return None
 
     def register_processor(self, modality: ModalityType, processor: BaseModalityProcessor):
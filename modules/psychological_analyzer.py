@@ -5,14 +5,17 @@ Analyzes transcripts for ADHD indicators, anxiety patterns, and emotional tone
 
 from google import genai
 from google.genai import types
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Hashable, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from config.settings import GeminiConfig, AppSettings
-from modules.api_utils import with_gemini_rate_limit_and_retry
+from modules.api_utils import get_gemini_client, with_gemini_rate_limit_and_retry
 import logging
-import json
-import re
+import orjson
 import hashlib
-from functools import lru_cache
+import threading
+import time
+from functools import lru_cache, partial
 
 # Setup logging if not already configured
 if not logging.getLogger().hasHandlers():
@@ -20,13 +23,166 @@ if not logging.getLogger().hasHandlers():
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of cached analyses, and how long each stays valid
+ANALYSIS_CACHE_SIZE = 1024
+ANALYSIS_CACHE_TTL_SECONDS = 3600
+
+# Transcripts up to this length are their own cache key; longer ones are hashed
+CACHE_KEY_INLINE_CHARS = 1000
+
+# Analysis instructions and response format; {details_instruction} is filled per variant below
+ANALYSIS_INSTRUCTIONS = """You are a clinical psychologist assistant analyzing conversational patterns.
+Analyze this transcript for psychological indicators. Be objective and evidence-based.
+
+IMPORTANT DISCLAIMERS:
+- This is a preliminary screening tool, NOT a diagnostic instrument
+- Patterns may be contextual and not indicative of disorders
+- Professional evaluation is required for any diagnosis
+
+Analyze for:
+
+1. **ADHD Indicators** (score 0-10):
+   - Rapid topic changes without completion
+   - Impulsive verbal patterns
+   - Difficulty maintaining focus on single subject
+   - Tangential thinking
+   - High-energy, scattered communication style
+
+2. **Anxiety Patterns** (score 0-10):
+   - Repetitive worries or concerns
+   - Catastrophic thinking
+   - Rumination on specific topics
+   - Excessive detail on worries
+   - Uncertainty and reassurance-seeking
+
+3. **Cognitive Biases** (score 0-10):
+   - Black-and-white/all-or-nothing thinking
+   - Catastrophizing or fortune-telling
+   - Overgeneralization from limited evidence
+   - Personalization (taking things personally)
+   - Emotional reasoning (believing something because it feels true)
+   - Confirmation bias (seeking information that confirms existing beliefs)
+
+4. **Emotional Tone**:
+   - Overall emotional state (e.g., neutral, anxious, excited, melancholic)
+   - Emotional stability vs. volatility
+   - Dominant emotions present
+
+{details_instruction}
+
+Respond with ONLY valid JSON in this exact format:
+{{
+    "adhd_indicators": {{
+        "score": <0-10>,
+        "evidence": [<list of specific quotes or patterns>],
+        "confidence": "<low|medium|high>"
+    }},
+    "anxiety_patterns": {{
+        "score": <0-10>,
+        "themes": [<list of recurring anxiety themes>],
+        "confidence": "<low|medium|high>"
+    }},
+    "cognitive_biases": {{
+        "score": <0-10>,
+        "identified_biases": [<list of specific cognitive biases detected>],
+        "confidence": "<low|medium|high>"
+    }},
+    "emotional_tone": {{
+        "primary_emotion": "<emotion name>",
+        "stability": "<stable|variable|volatile>",
+        "description": "<brief description>"
+    }},
+    "overall_assessment": "<brief 1-2 sentence summary>",
+    "recommendations": [<optional list of suggestions, e.g., 'Consider mindfulness practices', 'May benefit from structured task management'>]
+}}
+"""
+
+# Replaces the single "Transcript:" label when several transcripts share one request
+BATCH_INSTRUCTIONS = """
+The transcripts below are independent conversations. Analyze each one separately and respond with ONLY valid JSON of the form {"results": [<one object in the format above per transcript, in the order given>]}
+"""
+
+_DETAILS_INSTRUCTIONS = {
+    True: """
+        For each indicator found, provide specific evidence from the transcript.
+        """,
+    False: """
+        Provide scores and themes only, without detailed evidence.
+        """,
+}
+
+# Prompt heads with and without detailed evidence, built once
+_ANALYSIS_PROMPT_HEADS = {
+    include_details: ANALYSIS_INSTRUCTIONS.format(details_instruction=instruction) + "\nTranscript:\n"
+    for include_details, instruction in _DETAILS_INSTRUCTIONS.items()
+}
+_BATCH_PROMPT_HEADS = {
+    include_details: ANALYSIS_INSTRUCTIONS.format(details_instruction=instruction) + BATCH_INSTRUCTIONS
+    for include_details, instruction in _DETAILS_INSTRUCTIONS.items()
+}
+
+# Text after the transcript; truncation is noted here instead of appended to the transcript
+_ANALYSIS_PROMPT_TAIL = "\n\nJSON Response:"
+_TRUNCATED_PROMPT_TAIL = "...[truncated for analysis]" + _ANALYSIS_PROMPT_TAIL
+
+# Transcripts longer than the limit are cut to their first ANALYSIS_TRUNCATED_CHARS
+ANALYSIS_MAX_TRANSCRIPT_CHARS = 50000
+ANALYSIS_TRUNCATED_CHARS = 25000
+
+# Keys every analysis must have; missing ones are filled with empty sections
+REQUIRED_ANALYSIS_KEYS = ("adhd_indicators", "anxiety_patterns", "cognitive_biases", "emotional_tone")
+
+# JSON mode makes Gemini return the bare object, so parsing rarely needs the slice fallback
+ANALYSIS_GENERATION_CONFIG = types.GenerateContentConfig(
+    temperature=0.4,
+    top_p=0.9,
+    top_k=40,
+    max_output_tokens=2048,
+    response_mime_type="application/json",
+)
+
+# Shared by all analyzers for model calls; room for every model of each concurrent analysis
+ANALYSIS_EXECUTOR_WORKERS = 24
+_analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_EXECUTOR_WORKERS, thread_name_prefix="analysis")
+
+# Runs analyze() for transcripts a batch could not cover; kept apart from
+# _analysis_executor, whose model calls these analyses wait on
+MAX_CONCURRENT_FALLBACK_ANALYSES = 8
+_fallback_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_FALLBACK_ANALYSES, thread_name_prefix="analysis-fallback"
+)
+
+# Transcripts sent per batched request, and the longest transcript that may share one
+ANALYSIS_BATCH_SIZE = 5
+BATCH_TRANSCRIPT_MAX_CHARS = 8000
+
+# Same settings with room for one analysis per batched transcript
+ANALYSIS_BATCH_GENERATION_CONFIG = ANALYSIS_GENERATION_CONFIG.model_copy(
+    update={"max_output_tokens": 2048 * ANALYSIS_BATCH_SIZE}
+)
+
+# Default for analysis sections the model left out; only ever read
+_EMPTY_SECTION: Dict[str, Any] = {}
+
+# Score interpretation by integer score 0-10
+_SCORE_LABELS = (
+    "Minimal", "Minimal", "Minimal", "Low", "Low", "Moderate",
+    "Moderate", "Elevated", "Elevated", "High", "High"
+)
+
+def _mark_sent(sent: Future):
+    """Complete a hedge clock future; retries of the same call may report again"""
+    if not sent.done():
+        sent.set_result(None)
+
+
 class PsychologicalAnalyzer:
     """Analyze transcripts for psychological patterns using Gemini AI"""
 
     def __init__(self):
         try:
             GeminiConfig.validate()
-            self.client = genai.Client(api_key=GeminiConfig.API_KEY)
+            self.client = get_gemini_client(GeminiConfig.API_KEY)
             logger.debug("Gemini client initialized for psychological analysis")
         except Exception as e:
             logger.error("Failed to initialize Gemini client for psychological analysis", exc_info=True, extra={
@@ -42,32 +198,28 @@ class PsychologicalAnalyzer:
             GeminiConfig.LITE_MODEL        # gemini-2.5-flash-lite
         ]
 
-        # Simple in-memory cache for analysis results (LRU cache with 100 entries)
-        self._analysis_cache = {}
+        # In-memory LRU cache of (expiry, analysis) keyed by transcript hash
+        self._analysis_cache: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
 
         logger.info("PsychologicalAnalyzer initialized successfully", extra={
             "models": self.models
         })
 
     @with_gemini_rate_limit_and_retry
-    def _call_gemini_api(self, model_name: str, prompt: str) -> Any:
+    def _call_gemini_api(self, model_name: str, prompt: str,
+                         config: types.GenerateContentConfig = ANALYSIS_GENERATION_CONFIG) -> Any:
         """
         Call Gemini API with rate limiting and retry logic
 
         Args:
             model_name: Gemini model identifier
             prompt: Prompt text
+            config: Generation settings
 
         Returns:
             API response object
         """
-        config = types.GenerateContentConfig(
-            temperature=0.4,
-            top_p=0.9,
-            top_k=40,
-            max_output_tokens=2048,
-        )
-
         response = self.client.models.generate_content(
             model=model_name,
             contents=prompt,
@@ -106,173 +258,304 @@ class PsychologicalAnalyzer:
 
         # Check cache first
         cache_key = self._get_cache_key(transcript, include_details)
-        if cache_key in self._analysis_cache:
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
             logger.debug("Returning cached analysis result")
-            return self._analysis_cache[cache_key]
+            return cached
 
-        # Check reasonable length limits
-        if len(transcript) > 50000:  # Rough limit for analysis
+        # Check reasonable length limits; the prompt builder truncates
+        if len(transcript) > ANALYSIS_MAX_TRANSCRIPT_CHARS:
             logger.warning(f"Transcript too long for analysis: {len(transcript)} characters")
-            transcript = transcript[:25000] + "...[truncated for analysis]"
 
         prompt = self._build_analysis_prompt(transcript, include_details)
 
-        # Try models in fallback chain with rate limiting and retry
-        last_error = None
-        for model_name in self.models:
-            try:
-                logger.info(f"Attempting psychological analysis with model: {model_name}")
+        analysis_result, model_name, last_error = self._run_model_chain(prompt, self._parse_analysis_response)
+        if analysis_result is None:
+            # All models failed
+            logger.error(f"All models in fallback chain failed. Last error: {last_error}")
+            return self._empty_analysis(error=f"All models failed: {last_error}")
 
-                # Use the decorated method for API calls
-                response = self._call_gemini_api(model_name, prompt)
+        logger.info(f"Psychological analysis completed with {model_name} - "
+                   f"ADHD: {analysis_result.get('adhd_indicators', {}).get('score', 0)}/10, "
+                   f"Anxiety: {analysis_result.get('anxiety_patterns', {}).get('score', 0)}/10, "
+                   f"Biases: {analysis_result.get('cognitive_biases', {}).get('score', 0)}/10")
 
-                if not response or not response.text:
-                    logger.warning(f"Empty response from {model_name}, trying next model")
-                    last_error = f"Empty response from {model_name}"
-                    continue
+        # Cache the result
+        self._cache_result(cache_key, analysis_result)
 
-                # Parse JSON response
-                analysis_result = self._parse_analysis_response(response.text)
+        return analysis_result
 
-                logger.info(f"Psychological analysis completed with {model_name} - "
-                           f"ADHD: {analysis_result.get('adhd_indicators', {}).get('score', 0)}/10, "
-                           f"Anxiety: {analysis_result.get('anxiety_patterns', {}).get('score', 0)}/10, "
-                           f"Biases: {analysis_result.get('cognitive_biases', {}).get('score', 0)}/10")
+    def analyze_batch(self, transcripts: List[str], include_details: bool = True) -> List[Dict[str, Any]]:
+        """
+        Analyze several transcripts, sending uncached ones to Gemini in shared requests
 
-                # Cache the result
-                self._cache_result(cache_key, analysis_result)
+        Up to ANALYSIS_BATCH_SIZE transcripts go out in one request, so the
+        instructions are sent once per batch rather than once per transcript.
+        Empty, short and long transcripts, and any batch the models cannot
+        answer, fall back to analyze().
 
-                return analysis_result
+        Args:
+            transcripts: Cleaned transcript texts
+            include_details: Include detailed evidence in responses
 
-            except Exception as e:
-                logger.warning(f"Model {model_name} failed after retries: {str(e)}, trying next model")
-                last_error = f"{model_name}: {str(e)}"
-                continue
+        Returns:
+            Analysis results in the order of transcripts
+        """
+        if not isinstance(transcripts, list) or not all(isinstance(t, str) for t in transcripts):
+            raise ValueError("transcripts must be a list of strings")
 
-        # All models failed
-        logger.error(f"All models in fallback chain failed. Last error: {last_error}")
-        return self._empty_analysis(error=f"All models failed: {last_error}")
+        if not isinstance(include_details, bool):
+            raise ValueError("include_details must be a boolean")
 
-    def _build_analysis_prompt(self, transcript: str, include_details: bool) -> str:
-        """Build prompt for psychological analysis"""
+        results: List[Optional[Dict[str, Any]]] = [None] * len(transcripts)
 
-        details_instruction = """
-        For each indicator found, provide specific evidence from the transcript.
-        """ if include_details else """
-        Provide scores and themes only, without detailed evidence.
-        """
+        # Uncached transcripts by cache key, with every position they answer
+        pending: Dict[Hashable, Tuple[str, List[int]]] = {}
+        # Transcripts analyzed on their own, with every position they answer
+        individual: List[Tuple[str, List[int]]] = []
+        for position, transcript in enumerate(transcripts):
+            transcript = transcript.strip()
+            if not 50 <= len(transcript) <= BATCH_TRANSCRIPT_MAX_CHARS:
+                individual.append((transcript, [position]))
+                continue
 
-        prompt = f"""You are a clinical psychologist assistant analyzing conversational patterns.
-Analyze this transcript for psychological indicators. Be objective and evidence-based.
+            cache_key = self._get_cache_key(transcript, include_details)
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                results[position] = cached
+            elif cache_key in pending:
+                pending[cache_key][1].append(position)
+            else:
+                pending[cache_key] = (transcript, [position])
 
-IMPORTANT DISCLAIMERS:
-- This is a preliminary screening tool, NOT a diagnostic instrument
-- Patterns may be contextual and not indicative of disorders
-- Professional evaluation is required for any diagnosis
+        items = list(pending.items())
+        for start in range(0, len(items), ANALYSIS_BATCH_SIZE):
+            batch = items[start:start + ANALYSIS_BATCH_SIZE]
+            analyses = self._analyze_batch_request([transcript for _, (transcript, _) in batch], include_details)
 
-Analyze for:
+            if analyses is None:
+                individual.extend(item for _, item in batch)
+                continue
 
-1. **ADHD Indicators** (score 0-10):
-   - Rapid topic changes without completion
-   - Impulsive verbal patterns
-   - Difficulty maintaining focus on single subject
-   - Tangential thinking
-   - High-energy, scattered communication style
+            for (cache_key, (_, positions)), analysis in zip(batch, analyses):
+                self._cache_result(cache_key, analysis)
+                for position in positions:
+                    results[position] = analysis
 
-2. **Anxiety Patterns** (score 0-10):
-   - Repetitive worries or concerns
-   - Catastrophic thinking
-   - Rumination on specific topics
-   - Excessive detail on worries
-   - Uncertainty and reassurance-seeking
+        # Individual analyses run side by side instead of one after another
+        analyses = _fallback_executor.map(
+            lambda item: self.analyze(item[0], include_details), individual
+        )
+        for (_, positions), analysis in zip(individual, analyses):
+            for position in positions:
+                results[position] = analysis
 
-3. **Cognitive Biases** (score 0-10):
-   - Black-and-white/all-or-nothing thinking
-   - Catastrophizing or fortune-telling
-   - Overgeneralization from limited evidence
-   - Personalization (taking things personally)
-   - Emotional reasoning (believing something because it feels true)
-   - Confirmation bias (seeking information that confirms existing beliefs)
+        return results  # type: ignore[return-value]
 
-4. **Emotional Tone**:
-   - Overall emotional state (e.g., neutral, anxious, excited, melancholic)
-   - Emotional stability vs. volatility
-   - Dominant emotions present
+    def _analyze_batch_request(self, transcripts: List[str], include_details: bool) -> Optional[List[Dict[str, Any]]]:
+        """Analyze transcripts in one Gemini request, or return None if it cannot be used"""
+        if len(transcripts) < 2:
+            return None
 
-{details_instruction}
+        prompt = self._build_batch_prompt(transcripts, include_details)
+        count = len(transcripts)
+        analyses, model_name, last_error = self._run_model_chain(
+            prompt, lambda text: self._parse_batch_response(text, count), ANALYSIS_BATCH_GENERATION_CONFIG
+        )
+        if analyses is None:
+            logger.warning(f"Batch analysis of {count} transcripts failed, analyzing individually. Last error: {last_error}")
+            return None
 
-Respond with ONLY valid JSON in this exact format:
-{{
-    "adhd_indicators": {{
-        "score": <0-10>,
-        "evidence": [<list of specific quotes or patterns>],
-        "confidence": "<low|medium|high>"
-    }},
-    "anxiety_patterns": {{
-        "score": <0-10>,
-        "themes": [<list of recurring anxiety themes>],
-        "confidence": "<low|medium|high>"
-    }},
-    "cognitive_biases": {{
-        "score": <0-10>,
-        "identified_biases": [<list of specific cognitive biases detected>],
-        "confidence": "<low|medium|high>"
-    }},
-    "emotional_tone": {{
-        "primary_emotion": "<emotion name>",
-        "stability": "<stable|variable|volatile>",
-        "description": "<brief description>"
-    }},
-    "overall_assessment": "<brief 1-2 sentence summary>",
-    "recommendations": [<optional list of suggestions, e.g., 'Consider mindfulness practices', 'May benefit from structured task management'>]
-}}
+        logger.info(f"Batch psychological analysis of {count} transcripts completed with {model_name}")
+        return analyses
+
+    def _run_model_chain(self, prompt: str, parse: Callable[[str], Any],
+                         config: types.GenerateContentConfig = ANALYSIS_GENERATION_CONFIG
+                         ) -> Tuple[Any, Optional[str], Optional[str]]:
+        """
+        Run a prompt through the model fallback chain
+
+        Returns (parsed result, model name, None) for the first response that
+        parse accepts (anything but None), or (None, None, last error).
+        """
+        # Try models in fallback chain with rate limiting and retry; a model whose
+        # request has been in flight past the hedge delay gets the next one started alongside it
+        last_error = None
+        remaining = iter(self.models)
+        pending: Dict[Future, str] = {}
+        # Set once the chain has its answer, so losing hedged calls stop retrying
+        # and give up any rate limit token they are still waiting for
+        cancelled = threading.Event()
+        # Completes once the newest call holds a token; the hedge clock starts only then,
+        # so calls queued for a worker or held back by the limiter are never duplicated
+        sent: Optional[Future] = None
+        hedge_at: Optional[float] = None
+
+        def start_next_model() -> bool:
+            nonlocal sent, hedge_at
+            sent = hedge_at = None
+            model_name = next(remaining, None)
+            if model_name is None:
+                return False
+            logger.info(f"Attempting psychological analysis with model: {model_name}")
+            sent = Future()
+            # Use the decorated method for API calls
+            pending[_analysis_executor.submit(
+                self._call_gemini_api, model_name, prompt, config,
+                cancel_event=cancelled, on_acquire=partial(_mark_sent, sent)
+            )] = model_name
+            return True
 
-Transcript:
-{transcript}
+        try:
+            start_next_model()
+            while pending:
+                if hedge_at is None:
+                    waitables = [*pending, sent] if sent is not None else list(pending)
+                    timeout = None
+                else:
+                    waitables = list(pending)
+                    timeout = max(0.0, hedge_at - time.monotonic())
+
+                done, _ = wait(waitables, timeout=timeout, return_when=FIRST_COMPLETED)
+                if sent is not None and sent in done:
+                    done.discard(sent)
+                    sent = None
+                    hedge_at = time.monotonic() + GeminiConfig.ANALYSIS_HEDGE_DELAY
+
+                if not done:
+                    if hedge_at is not None and time.monotonic() >= hedge_at and start_next_model():
+                        logger.warning(f"Analysis exceeded {GeminiConfig.ANALYSIS_HEDGE_DELAY}s, hedging with next model")
+                    continue
 
-JSON Response:"""
+                for future in done:
+                    model_name = pending.pop(future)
+                    try:
+                        response = future.result()
+
+                        if not response or not response.text:
+                            logger.warning(f"Empty response from {model_name}, trying next model")
+                            last_error = f"Empty response from {model_name}"
+                            continue
+
+                        # Parse JSON response
+                        result = parse(response.text)
+                    except Exception as e:
+                        logger.warning(f"Model {model_name} failed after retries: {str(e)}, trying next model")
+                        last_error = f"{model_name}: {str(e)}"
+                        continue
+
+                    if result is None:
+                        logger.warning(f"Unusable response from {model_name}, trying next model")
+                        last_error = f"Unusable response from {model_name}"
+                        continue
+
+                    return result, model_name, None
+
+                # Fall back right away once nothing is left in flight
+                if not pending:
+                    start_next_model()
+        finally:
+            # Queued calls never start; running ones make no further attempts
+            cancelled.set()
+            for future in pending:
+                future.cancel()
+
+        return None, None, last_error
 
-        return prompt
+    def _build_analysis_prompt(self, transcript: str, include_details: bool) -> str:
+        """Build prompt for psychological analysis, truncating overly long transcripts"""
+        head = _ANALYSIS_PROMPT_HEADS[include_details]
+        if len(transcript) > ANALYSIS_MAX_TRANSCRIPT_CHARS:
+            return "".join((head, transcript[:ANALYSIS_TRUNCATED_CHARS], _TRUNCATED_PROMPT_TAIL))
+        return head + transcript + _ANALYSIS_PROMPT_TAIL
+
+    def _build_batch_prompt(self, transcripts: List[str], include_details: bool) -> str:
+        """Build prompt analyzing several numbered transcripts at once"""
+        parts = [_BATCH_PROMPT_HEADS[include_details]]
+        for number, transcript in enumerate(transcripts, 1):
+            parts.append(f"\nTranscript {number}:\n{transcript}\n")
+        parts.append("\nJSON Response:")
+        return "".join(parts)
 
     def _parse_analysis_response(self, response_text: str) -> Dict[str, Any]:
         """Parse JSON response from Gemini"""
         try:
-            # Try to extract JSON from markdown code blocks if present
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-            if json_match:
-                json_text = json_match.group(1)
-            else:
-                json_text = response_text.strip()
-
-            analysis = json.loads(json_text)
+            try:
+                analysis = orjson.loads(response_text)
+            except orjson.JSONDecodeError:
+                # Response wrapped in a markdown code block or prose: parse the outermost object
+                start = response_text.find("{")
+                end = response_text.rfind("}")
+                if start == -1 or end < start:
+                    raise
+                analysis = orjson.loads(response_text[start:end + 1])
 
             # Validate structure
-            required_keys = ["adhd_indicators", "anxiety_patterns", "cognitive_biases", "emotional_tone"]
-            for key in required_keys:
-                if key not in analysis:
-                    logger.warning(f"Missing key in analysis: {key}")
-                    analysis[key] = {}
+            self._fill_required_keys(analysis)
 
             return analysis
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             logger.debug(f"Raw response: {response_text}")
             return self._empty_analysis(error=f"JSON parse error: {str(e)}")
 
-    def _get_cache_key(self, transcript: str, include_details: bool) -> str:
+    def _parse_batch_response(self, response_text: str, count: int) -> Optional[List[Dict[str, Any]]]:
+        """Parse a batched JSON response, or return None unless it holds count analyses"""
+        try:
+            data = orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Failed to parse batch JSON response: {e}")
+            return None
+
+        analyses = data.get("results") if isinstance(data, dict) else None
+        if (not isinstance(analyses, list) or len(analyses) != count
+                or not all(isinstance(analysis, dict) for analysis in analyses)):
+            logger.warning(f"Batch response does not hold {count} analyses")
+            return None
+
+        for analysis in analyses:
+            self._fill_required_keys(analysis)
+        return analyses
+
+    def _fill_required_keys(self, analysis: Dict[str, Any]):
+        """Add an empty section for each required key the model left out"""
+        for key in REQUIRED_ANALYSIS_KEYS:
+            if key not in analysis:
+                logger.warning(f"Missing key in analysis: {key}")
+                analysis[key] = {}
+
+    def _get_cache_key(self, transcript: str, include_details: bool) -> Hashable:
         """Generate cache key for transcript analysis"""
-        # Create hash of transcript and settings
-        content = f"{transcript[:1000]}|{include_details}"  # Limit to first 1000 chars for key
-        return hashlib.md5(content.encode()).hexdigest()
-
-    def _cache_result(self, key: str, result: Dict[str, Any]):
-        """Cache analysis result (simple LRU with max 50 entries)"""
-        if len(self._analysis_cache) >= 50:
-            # Remove oldest entry (simple FIFO)
-            oldest_key = next(iter(self._analysis_cache))
-            del self._analysis_cache[oldest_key]
-        self._analysis_cache[key] = result
+        # Short transcripts key on their own text: str hashing is cheaper than
+        # BLAKE2b and equality checks rule out collisions
+        if len(transcript) <= CACHE_KEY_INLINE_CHARS:
+            return (include_details, transcript)
+
+        # Hash the whole transcript so transcripts sharing a prefix don't collide
+        digest = hashlib.blake2b(transcript.encode("utf-8"), digest_size=16)
+        digest.update(b"\x01" if include_details else b"\x00")
+        return digest.hexdigest()
+
+    def _get_cached_result(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return a cached analysis that has not expired, or None"""
+        with self._analysis_cache_lock:
+            entry = self._analysis_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._analysis_cache[key]
+                return None
+            self._analysis_cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_result(self, key: Hashable, result: Dict[str, Any]):
+        """Cache analysis result (LRU with ANALYSIS_CACHE_SIZE entries)"""
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = (time.monotonic() + ANALYSIS_CACHE_TTL_SECONDS, result)
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
 
     def _minimal_analysis(self) -> Dict[str, Any]:
         """Return minimal analysis for short transcripts"""
@@ -340,13 +623,15 @@ JSON Response:"""
         Returns:
             Formatted summary string
         """
-        adhd_score = analysis.get("adhd_indicators", {}).get("score", 0)
-        anxiety_score = analysis.get("anxiety_patterns", {}).get("score", 0)
-        bias_score = analysis.get("cognitive_biases", {}).get("score", 0)
-        emotion = analysis.get("emotional_tone", {}).get("primary_emotion", "unknown")
+        # Each section is looked up once; missing ones share the empty default
+        cognitive_biases = analysis.get("cognitive_biases") or _EMPTY_SECTION
+        adhd_score = (analysis.get("adhd_indicators") or _EMPTY_SECTION).get("score", 0)
+        anxiety_score = (analysis.get("anxiety_patterns") or _EMPTY_SECTION).get("score", 0)
+        bias_score = cognitive_biases.get("score", 0)
+        emotion = (analysis.get("emotional_tone") or _EMPTY_SECTION).get("primary_emotion", "unknown")
         assessment = analysis.get("overall_assessment", "No assessment available")
 
-        summary = f"""Psychological Analysis Summary:
+        parts = [f"""Psychological Analysis Summary:
 
 ADHD Indicators: {adhd_score}/10 ({self._score_interpretation(adhd_score)})
 Anxiety Patterns: {anxiety_score}/10 ({self._score_interpretation(anxiety_score)})
@@ -354,23 +639,24 @@ Cognitive Biases: {bias_score}/10 ({self._score_interpretation(bias_score)})
 Primary Emotion: {emotion.capitalize()}
 
 Assessment: {assessment}
-"""
+"""]
 
         # Add cognitive biases details if present
-        biases = analysis.get("cognitive_biases", {}).get("identified_biases", [])
+        biases = cognitive_biases.get("identified_biases")
         if biases:
-            summary += f"\nIdentified Biases: {', '.join(biases)}\n"
+            parts.append(f"\nIdentified Biases: {', '.join(biases)}\n")
 
-        recommendations = analysis.get("recommendations", [])
+        recommendations = analysis.get("recommendations")
         if recommendations:
-            summary += "\nRecommendations:\n"
-            for rec in recommendations:
-                summary += f"- {rec}\n"
+            parts.append("\nRecommendations:\n")
+            parts.extend(f"- {rec}\n" for rec in recommendations)
 
-        return summary
+        return "".join(parts)
 
     def _score_interpretation(self, score: int) -> str:
         """Interpret numerical score"""
+        if type(score) is int and 0 <= score <= 10:
+            return _SCORE_LABELS[score]
         if score <= 2:
             return "Minimal"
         elif score <= 4:
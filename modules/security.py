@@ -5,9 +5,9 @@ import hashlib
 import hmac
 import time
 import re
-from typing import Optional, Any, Dict, List, Union
+from collections import OrderedDict
+from typing import Optional, Any, Dict, List, Tuple, Union
 from functools import wraps
-from collections import defaultdict
 import logging
 from config.settings import AppSettings
 
@@ -37,18 +37,14 @@ class WebhookValidator:
             True if signature is valid
         """
         try:
-            # Construct signed message
+            # Compute expected signature over "<timestamp>.<payload>", feeding the
+            # body to the HMAC separately so it is never copied into a new buffer
             if timestamp:
-                signed_payload = f"{timestamp}.".encode() + payload
+                mac = hmac.new(self.secret, f"{timestamp}.".encode(), hashlib.sha256)
+                mac.update(payload)
+                expected_signature = mac.hexdigest()
             else:
-                signed_payload = payload
-            
-            # Compute expected signature
-            expected_signature = hmac.new(
-                self.secret,
-                signed_payload,
-                hashlib.sha256
-            ).hexdigest()
+                expected_signature = hmac.digest(self.secret, payload, "sha256").hex()
             
             # Constant-time comparison
             is_valid = hmac.compare_digest(signature, expected_signature)
@@ -95,7 +91,9 @@ class RateLimiter:
     
     def __init__(self, requests_per_minute: int = 60):
         self.requests_per_minute = requests_per_minute
-        self.requests: Dict[str, List[float]] = defaultdict(list)
+        # Token bucket per client: (tokens left, time of last refill), least recently seen first
+        self.buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+        self.refill_per_second = requests_per_minute / 60.0
         self.cleanup_interval = 60  # Clean old entries every 60 seconds
         self.last_cleanup = time.time()
     
@@ -115,38 +113,37 @@ class RateLimiter:
         if current_time - self.last_cleanup > self.cleanup_interval:
             self._cleanup()
         
-        # Get recent requests for this client
-        client_requests = self.requests[client_id]
-        
-        # Remove requests older than 1 minute
-        cutoff_time = current_time - 60
-        client_requests[:] = [t for t in client_requests if t > cutoff_time]
+        # Refill the client's bucket for the time since its last request
+        capacity = self.requests_per_minute
+        tokens, last_refill = self.buckets.get(client_id, (capacity, current_time))
+        tokens = min(capacity, tokens + (current_time - last_refill) * self.refill_per_second)
         
         # Check limit
-        if len(client_requests) >= self.requests_per_minute:
+        allowed = tokens >= 1
+        if allowed:
+            # Spend a token on this request
+            tokens -= 1
+        else:
             logger.warning(f"Rate limit exceeded for client: {client_id}")
-            return False
         
-        # Add current request
-        client_requests.append(current_time)
-        return True
+        self.buckets[client_id] = (tokens, current_time)
+        self.buckets.move_to_end(client_id)
+        return allowed
     
     def _cleanup(self):
-        """Remove old client entries"""
+        """Remove buckets idle for a minute, which have refilled to full anyway"""
         current_time = time.time()
-        cutoff_time = current_time - 120  # Keep last 2 minutes
-        
-        clients_to_remove = []
-        for client_id, requests in self.requests.items():
-            requests[:] = [t for t in requests if t > cutoff_time]
-            if not requests:
-                clients_to_remove.append(client_id)
+        cutoff_time = current_time - 60
         
-        for client_id in clients_to_remove:
-            del self.requests[client_id]
+        # Buckets are kept in last-seen order, so only the idle ones at the front are visited
+        while self.buckets:
+            client_id, (_, last_seen) = next(iter(self.buckets.items()))
+            if last_seen > cutoff_time:
+                break
+            del self.buckets[client_id]
         
         self.last_cleanup = current_time
-        logger.debug(f"Cleaned up rate limiter, {len(self.requests)} active clients")
+        logger.debug(f"Cleaned up rate limiter, {len(self.buckets)} active clients")
 
 
 class InputValidator:
@@ -155,19 +152,15 @@ class InputValidator:
     # Patterns for validation
     UUID_PATTERN = re.compile(r'^[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$', re.IGNORECASE)
     ALPHA_NUMERIC_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+    # Length limit folded into the pattern so validate_uid is a single fullmatch
+    UID_PATTERN = re.compile(r'[a-zA-Z0-9_-]{1,100}')
     SAFE_TEXT_PATTERN = re.compile(r'^[a-zA-Z0-9\s\.,!?\-_:;\'\"()]+$')
     EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
     @staticmethod
     def validate_uid(uid: str) -> bool:
         """Validate user ID format"""
-        if not isinstance(uid, str):
-            return False
-        if not uid.strip():
-            return False
-        if len(uid) > 100:  # Reasonable length limit
-            return False
-        return InputValidator.ALPHA_NUMERIC_PATTERN.match(uid) is not None
+        return isinstance(uid, str) and InputValidator.UID_PATTERN.fullmatch(uid) is not None
 
     @staticmethod
     def validate_session_id(session_id: str) -> bool:
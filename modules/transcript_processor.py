@@ -5,9 +5,12 @@ Handles transcript cleaning and structuring with fallback chain
 from google import genai
 from google.genai import types
 from typing import Optional, Dict, Any
+from collections import OrderedDict
 from config.settings import GeminiConfig, AppSettings
-from modules.api_utils import with_gemini_rate_limit_and_retry
+from modules.api_utils import get_gemini_client, with_gemini_rate_limit_and_retry
+import hashlib
 import logging
+import threading
 import time
 
 # Setup logging if not already configured
@@ -16,13 +19,24 @@ if not logging.getLogger().hasHandlers():
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of cleaned transcripts kept for re-delivered webhooks
+CLEAN_CACHE_SIZE = 2048
+
+# Generation parameters for cleaning, built once rather than per call
+CLEANING_GENERATION_CONFIG = types.GenerateContentConfig(
+    temperature=0.3,  # Lower temperature for more consistent cleaning
+    top_p=0.8,
+    top_k=40,
+    max_output_tokens=4096,
+)
+
 class TranscriptProcessor:
     """Process and clean transcripts using Gemini AI with fallback chain"""
 
     def __init__(self):
         try:
             GeminiConfig.validate()
-            self.client = genai.Client(api_key=GeminiConfig.API_KEY)
+            self.client = get_gemini_client(GeminiConfig.API_KEY)
             logger.debug("Gemini client initialized for transcript processing")
         except Exception as e:
             logger.error("Failed to initialize Gemini client for transcript processing", exc_info=True, extra={
@@ -35,6 +49,10 @@ class TranscriptProcessor:
         self.fallback_model = GeminiConfig.FALLBACK_MODEL
         self.lite_model = GeminiConfig.LITE_MODEL
 
+        # Successful cleanings keyed by content hash, least recently used first
+        self._clean_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._clean_cache_lock = threading.Lock()
+
         logger.info("TranscriptProcessor initialized successfully", extra={
             "models": [self.primary_model, self.fallback_model, self.lite_model]
         })
@@ -77,6 +95,33 @@ class TranscriptProcessor:
                 "model_used": None
             }
 
+        # Re-delivered or duplicate transcripts skip the Gemini round-trip
+        cache_key = self._get_cache_key(transcript_raw, context)
+        with self._clean_cache_lock:
+            cached = self._clean_cache.get(cache_key)
+            if cached is not None:
+                self._clean_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.debug("Returning cached transcript cleaning result")
+            return dict(cached)
+
+        result = self._clean_with_fallbacks(transcript_raw, context)
+        if result["success"]:
+            with self._clean_cache_lock:
+                self._clean_cache[cache_key] = dict(result)
+                if len(self._clean_cache) > CLEAN_CACHE_SIZE:
+                    self._clean_cache.popitem(last=False)
+        return result
+
+    def _get_cache_key(self, transcript: str, context: Optional[str]) -> bytes:
+        """Hash the transcript and context into a cleaning cache key"""
+        digest = hashlib.blake2b(transcript.encode("utf-8"), digest_size=16)
+        if context:
+            digest.update(b"\0" + context.encode("utf-8"))
+        return digest.digest()
+
+    def _clean_with_fallbacks(self, transcript_raw: str, context: Optional[str]) -> Dict[str, Any]:
+        """Clean transcript with the primary model, falling back to the flash and lite models"""
         try:
             # Try primary model first
             result = self._clean_with_gemini(transcript_raw, self.primary_model, context)
@@ -129,19 +174,11 @@ class TranscriptProcessor:
         Returns:
             API response object
         """
-        # Configure generation parameters
-        config = types.GenerateContentConfig(
-            temperature=0.3,  # Lower temperature for more consistent cleaning
-            top_p=0.8,
-            top_k=40,
-            max_output_tokens=4096,
-        )
-
         start_time = time.time()
         response = self.client.models.generate_content(
             model=model_name,
             contents=prompt,
-            config=config
+            config=CLEANING_GENERATION_CONFIG
         )
         elapsed = time.time() - start_time
 
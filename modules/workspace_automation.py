@@ -18,8 +18,8 @@ from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
 from googleapiclient.discovery import build  # type: ignore
 from googleapiclient.errors import HttpError  # type: ignore
 
-from google import genai
 from config.settings import GoogleWorkspaceConfig, GeminiConfig, AppSettings
+from modules.api_utils import get_gemini_client
 import logging
 
 # Setup logging if not already configured
@@ -39,7 +39,7 @@ class WorkspaceAutomation:
 
         # Initialize Gemini for decision-making
         GeminiConfig.validate()
-        self.client = genai.Client(api_key=GeminiConfig.API_KEY)
+        self.client = get_gemini_client(GeminiConfig.API_KEY)
         self.gemini_model_name = GeminiConfig.PRIMARY_MODEL
 
         logger.info("Initialized WorkspaceAutomation")
@@ -11,6 +11,15 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from modules.api_utils import get_gemini_client
+
+@pytest.fixture(autouse=True)
+def reset_gemini_client():
+    """Drop the shared Gemini client so each test sees its own patched genai.Client"""
+    get_gemini_client.cache_clear()
+    yield
+    get_gemini_client.cache_clear()
+
 @pytest.fixture
 def temp_db_path():
     """Create a temporary database file path"""
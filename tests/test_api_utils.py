@@ -9,9 +9,10 @@ from unittest.mock import patch, MagicMock, call
 from freezegun import freeze_time
 
 from modules.api_utils import (
-    RateLimiter, ExponentialBackoff, HTTPRetry,
+    RateLimiter, ExponentialBackoff, HTTPRetry, RetryCancelled, RateLimitTimeout,
     with_gemini_rate_limit, with_gemini_retry, with_gemini_rate_limit_and_retry,
-    wait_for_gemini_rate_limit, retry_gemini_call, with_omi_retry
+    wait_for_gemini_rate_limit, retry_gemini_call, with_omi_retry, get_gemini_client,
+    GEMINI_KEEPALIVE_EXPIRY_SECONDS, GEMINI_QUOTA_PAUSE_SECONDS
 )
 
 
@@ -31,6 +32,16 @@ class TestRateLimiter:
         assert rate_limiter.hour_tokens == 50
         assert isinstance(rate_limiter.lock, threading.Lock)
 
+    def test_pause_blocks_tokens(self):
+        """Test no tokens are handed out until a pause has passed"""
+        with freeze_time("2024-01-01 00:00:00") as frozen_time:
+            rate_limiter = RateLimiter(requests_per_minute=10, requests_per_hour=50)
+            rate_limiter.pause(10)
+            assert rate_limiter.acquire() is False
+
+            frozen_time.move_to("2024-01-01 00:00:11")
+            assert rate_limiter.acquire() is True
+
     def test_refill_tokens(self, rate_limiter):
         """Test token refilling over time"""
         # Use some tokens
@@ -191,6 +202,32 @@ class TestExponentialBackoff:
             delay = call_args[0][0]
             assert delay <= backoff.max_delay
 
+    def test_rate_limit_timeout_is_not_retried(self, backoff):
+        """Test a limiter timeout is raised at once instead of waiting out the limiter again"""
+        mock_func = MagicMock(side_effect=RateLimitTimeout("Rate limit timeout exceeded"))
+
+        with patch('time.sleep') as mock_sleep:
+            with pytest.raises(RateLimitTimeout):
+                backoff.retry(mock_func)
+
+        assert mock_func.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_retry_stops_when_cancelled(self, backoff):
+        """Test no further attempt is made once the cancel event is set"""
+        cancel_event = threading.Event()
+
+        def failing_func():
+            cancel_event.set()
+            raise ValueError("Temporary failure")
+
+        mock_func = MagicMock(side_effect=failing_func)
+
+        with pytest.raises(RetryCancelled):
+            backoff.retry(mock_func, cancel_event=cancel_event)
+
+        assert mock_func.call_count == 1
+
 
 class TestHTTPRetry:
     """Test HTTP retry logic"""
@@ -264,6 +301,46 @@ class TestHTTPRetry:
         assert result == mock_response
         assert mock_sleep.call_count == 2  # 2 retries
 
+    def test_retry_honors_retry_after(self, http_retry):
+        """Test a numeric Retry-After header sets the delay"""
+        responses = [MagicMock(status_code=429, headers={"Retry-After": "3"}),
+                     MagicMock(status_code=200)]
+
+        with patch('time.sleep') as mock_sleep:
+            result = http_retry.retry(lambda: responses.pop(0))
+
+        assert result.status_code == 200
+        mock_sleep.assert_called_once_with(3.0)
+
+    def test_backoff_delay_is_jittered_within_window(self, http_retry):
+        """Test backoff delays stay inside the capped exponential window"""
+        for attempt in range(5):
+            delay = http_retry._get_delay(attempt)
+            assert 0 <= delay <= min(0.1 * 2 ** attempt, http_retry.max_delay)
+
+    def test_retry_budget_stops_retries(self):
+        """Test retries stop once the shared budget is spent"""
+        http_retry = HTTPRetry(max_retries=5, initial_delay=0.1, retry_budget_per_minute=2)
+        mock_response = MagicMock(status_code=503, headers={})
+
+        with patch('time.sleep') as mock_sleep:
+            result = http_retry.retry(lambda: mock_response)
+
+        assert result == mock_response
+        assert mock_sleep.call_count == 2
+
+    def test_retry_budget_exhausted_on_exception(self, caplog):
+        """Test an exception with no budget left is logged as budget exhaustion"""
+        http_retry = HTTPRetry(max_retries=5, initial_delay=0.1, retry_budget_per_minute=0)
+
+        with patch('time.sleep') as mock_sleep, caplog.at_level("ERROR", logger="modules.api_utils"):
+            with pytest.raises(ConnectionError):
+                http_retry.retry(MagicMock(side_effect=ConnectionError("reset")))
+
+        mock_sleep.assert_not_called()
+        assert "retry budget exhausted" in caplog.records[-1].getMessage()
+        assert "All 6 HTTP attempts failed" not in caplog.text
+
 
 class TestDecorators:
     """Test API utility decorators"""
@@ -279,7 +356,7 @@ class TestDecorators:
 
             result = test_func()
             assert result == "success"
-            mock_limiter.wait_for_tokens.assert_called_once_with(tokens=1, timeout=300.0)
+            mock_limiter.wait_for_tokens.assert_called_once_with(tokens=1, timeout=300.0, cancel_event=None)
 
     def test_with_gemini_rate_limit_timeout(self):
         """Test rate limit decorator timeout"""
@@ -290,7 +367,7 @@ class TestDecorators:
             def test_func():
                 return "should not reach here"
 
-            with pytest.raises(Exception, match="Rate limit timeout exceeded"):
+            with pytest.raises(RateLimitTimeout, match="Rate limit timeout exceeded"):
                 test_func()
 
     def test_with_gemini_retry_success(self):
@@ -307,21 +384,71 @@ class TestDecorators:
             mock_backoff.retry.assert_called_once()
 
     def test_with_gemini_rate_limit_and_retry(self):
-        """Test combined rate limit and retry decorator"""
+        """Test combined rate limit and retry decorator takes a token per attempt"""
         with patch('modules.api_utils._gemini_rate_limiter') as mock_limiter, \
-             patch('modules.api_utils._gemini_backoff') as mock_backoff:
+             patch('modules.api_utils._gemini_backoff', ExponentialBackoff(max_retries=1, initial_delay=0)):
 
             mock_limiter.wait_for_tokens.return_value = True
-            mock_backoff.retry.return_value = "success"
+            attempts = iter([Exception("fail"), "success"])
 
             @with_gemini_rate_limit_and_retry
             def test_func():
-                return "success"
+                outcome = next(attempts)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
 
             result = test_func()
             assert result == "success"
-            mock_limiter.wait_for_tokens.assert_called_once()
-            mock_backoff.retry.assert_called_once()
+            assert mock_limiter.wait_for_tokens.call_count == 2
+            mock_limiter.pause.assert_not_called()
+
+    def test_limiter_timeout_is_not_retried(self):
+        """Test the combined decorator gives up after one limiter timeout"""
+        with patch('modules.api_utils._gemini_rate_limiter') as mock_limiter, \
+             patch('modules.api_utils._gemini_backoff', ExponentialBackoff(max_retries=3, initial_delay=0)):
+
+            mock_limiter.wait_for_tokens.return_value = False
+            mock_func = MagicMock(return_value="should not reach here")
+
+            with pytest.raises(RateLimitTimeout):
+                with_gemini_rate_limit_and_retry(mock_func)()
+
+            assert mock_limiter.wait_for_tokens.call_count == 1
+            mock_func.assert_not_called()
+
+    def test_cancelled_wait_sends_no_request(self):
+        """Test a call cancelled while the limiter is paused gives up without a token or request"""
+        limiter = RateLimiter(requests_per_minute=10, requests_per_hour=50)
+        limiter.pause(60)
+        cancel_event = threading.Event()
+        threading.Timer(0.05, cancel_event.set).start()
+        mock_func = MagicMock()
+        on_acquire = MagicMock()
+
+        with patch('modules.api_utils._gemini_rate_limiter', limiter):
+            with pytest.raises(RetryCancelled):
+                with_gemini_rate_limit_and_retry(mock_func)(cancel_event=cancel_event, on_acquire=on_acquire)
+
+        mock_func.assert_not_called()
+        on_acquire.assert_not_called()
+        assert limiter.minute_tokens == 10
+
+    def test_quota_error_pauses_shared_limiter(self):
+        """Test a 429 from Gemini pauses the process-wide limiter"""
+        quota_error = Exception("RESOURCE_EXHAUSTED")
+        quota_error.code = 429
+
+        with patch('modules.api_utils._gemini_rate_limiter') as mock_limiter:
+            mock_limiter.wait_for_tokens.return_value = True
+
+            @with_gemini_rate_limit
+            def test_func():
+                raise quota_error
+
+            with pytest.raises(Exception, match="RESOURCE_EXHAUSTED"):
+                test_func()
+            mock_limiter.pause.assert_called_once_with(GEMINI_QUOTA_PAUSE_SECONDS)
 
     def test_with_omi_retry_success(self):
         """Test OMI retry decorator success"""
@@ -370,6 +497,20 @@ class TestUtilityFunctions:
             assert result == "success"
             mock_backoff.retry.assert_called_once()
 
+    @patch('google.genai.Client')
+    def test_get_gemini_client_is_shared(self, mock_genai_client):
+        """Test one client is created and reused per API key"""
+        first = get_gemini_client("key1")
+
+        assert get_gemini_client("key1") is first
+        assert mock_genai_client.call_count == 1
+
+        http_options = mock_genai_client.call_args.kwargs["http_options"]
+        assert http_options.client_args["limits"].keepalive_expiry == GEMINI_KEEPALIVE_EXPIRY_SECONDS
+
+        get_gemini_client("key2")
+        assert mock_genai_client.call_count == 2
+
 
 class TestGlobalInstances:
     """Test global rate limiter and backoff instances"""
@@ -0,0 +1,311 @@
+"""
+Unit tests for monitoring.py module
+Tests metrics collection, alert management and health checks
+"""
+import asyncio
+import pytest
+import time
+from unittest.mock import MagicMock, patch
+
+from modules.monitoring import (
+    Alert, AlertLevel, AlertType, AlertManager, MetricsCollector, HealthChecker,
+    MonitoringSystem, format_timestamp_ns, NS_PER_MINUTE
+)
+
+
+def make_alert(alert_id: str) -> Alert:
+    """Build a simple warning alert"""
+    return Alert(
+        id=alert_id,
+        type=AlertType.PERFORMANCE,
+        level=AlertLevel.WARNING,
+        message=f"Alert {alert_id}",
+        details={},
+        timestamp=time.time_ns()
+    )
+
+
+class TestAlert:
+    """Test alert serialization"""
+
+    def test_to_dict(self):
+        """Test enums and timestamps are serialized and details are shared"""
+        alert = make_alert("a1")
+        alert.details = {"value": 3}
+
+        data = alert.to_dict()
+
+        assert data["type"] == "performance"
+        assert data["level"] == "warning"
+        # Formatting must give the value, not AlertType.PERFORMANCE, on every Python version
+        assert f"{data['type']}/{data['level']}" == "performance/warning"
+        assert data["timestamp"] == format_timestamp_ns(alert.timestamp)
+        assert data["timestamp"].endswith("+00:00")
+        assert data["resolved_at"] is None
+        assert data["details"] is alert.details
+
+
+class TestMetricsCollector:
+    """Test metric recording and windowed aggregation"""
+
+    def test_request_metrics_window(self):
+        """Test only requests inside the time window are aggregated"""
+        collector = MetricsCollector()
+        collector.record_request("GET", "/health", 200, 0.1)
+        collector.record_request("POST", "/webhook", 500, 0.3)
+
+        # Age the first request out of the 5 minute window
+        collector.metrics['requests_total'][0]['timestamp'] -= 10 * NS_PER_MINUTE
+
+        metrics = collector.get_request_metrics()
+
+        assert metrics['total_requests'] == 1
+        assert metrics['error_rate'] == 1.0
+        assert metrics['max_response_time'] == 0.3
+
+    def test_request_metric_keys_are_reused(self):
+        """Test per-endpoint and status keys are built once and reused"""
+        collector = MetricsCollector()
+        collector.record_request("GET", "/health", 200, 0.1)
+        collector.record_request("GET", "/health", 200, 0.2)
+
+        assert list(collector.metrics['response_time_/health']) == [0.1, 0.2]
+        assert len(collector.metrics['status_200']) == 2
+        assert collector._rt_key_cache == {"/health": "response_time_/health"}
+
+    def test_system_metrics_are_cached(self):
+        """Test burst calls share one blocking psutil sample"""
+        collector = MetricsCollector()
+
+        with patch('modules.monitoring.psutil.cpu_percent', return_value=12.5) as mock_cpu:
+            first = collector.get_system_metrics()
+            second = collector.get_system_metrics()
+
+        assert mock_cpu.call_count == 1
+        assert first is second
+        assert first['cpu_percent'] == 12.5
+
+    def test_explicit_window_bypasses_cache(self):
+        """Test a non-default window is always computed fresh"""
+        collector = MetricsCollector()
+        assert collector.get_request_metrics()['total_requests'] == 0
+
+        collector.record_request("GET", "/health", 200, 0.1)
+
+        assert collector.get_request_metrics(time_window_minutes=5)['total_requests'] == 1
+
+    def test_error_metrics(self):
+        """Test errors are counted by type"""
+        collector = MetricsCollector()
+        collector.record_error("ValueError", "bad input")
+        collector.record_error("ValueError", "bad input")
+        collector.record_error("KeyError", "missing")
+
+        metrics = collector.get_error_metrics()
+
+        assert metrics['total_errors'] == 3
+        assert metrics['error_types'] == {"ValueError": 2, "KeyError": 1}
+        assert collector.get_error_metrics(time_window_minutes=10)['error_types'] == metrics['error_types']
+
+    def test_processing_running_sums_match_scan(self):
+        """Test the rolling default window agrees with a full history scan"""
+        collector = MetricsCollector()
+        collector.record_processing_metrics({
+            'success': True, 'processing_time_seconds': 1.0,
+            'steps_completed': ['a', 'b'], 'errors': [], 'warnings': ['w']
+        })
+        collector.record_processing_metrics({
+            'success': False, 'processing_time_seconds': 3.0,
+            'steps_completed': ['a'], 'errors': ['e'], 'critical_errors': ['c']
+        })
+
+        rolling = collector.get_processing_metrics()
+        scanned = collector.get_processing_metrics(time_window_minutes=6)
+
+        assert rolling == scanned
+        assert rolling['success_rate'] == 0.5
+        assert rolling['avg_processing_time'] == 2.0
+        assert rolling['total_critical_errors'] == 1
+
+    def test_running_sums_expire_old_samples(self):
+        """Test samples older than the window leave the running sums"""
+        collector = MetricsCollector()
+        collector.record_processing_metrics({'success': True, 'processing_time_seconds': 1.0})
+        collector.record_error("ValueError", "bad input")
+
+        # Age both samples out of the 5 minute window
+        collector._proc_window[0] = (collector._proc_window[0][0] - 10 * NS_PER_MINUTE,) + collector._proc_window[0][1:]
+        collector._error_window[0] = (collector._error_window[0][0] - 10 * NS_PER_MINUTE, "ValueError")
+
+        assert collector.get_processing_metrics()['total_processed'] == 0
+        assert collector.get_error_metrics() == {
+            'total_errors': 0, 'errors_per_minute': 0.0, 'error_types': {}
+        }
+
+
+class TestAlertManager:
+    """Test alert storage and resolution"""
+
+    @pytest.fixture
+    def alert_manager(self):
+        """Create alert manager with a mocked metrics collector"""
+        return AlertManager(MagicMock(spec=MetricsCollector))
+
+    def test_store_and_resolve_alert(self, alert_manager):
+        """Test resolving an alert removes it from the active set"""
+        alert_manager._store_alert(make_alert("a1"))
+        alert_manager._store_alert(make_alert("a2"))
+
+        assert [a.id for a in alert_manager.get_active_alerts()] == ["a1", "a2"]
+
+        alert_manager.resolve_alert("a1")
+
+        assert [a.id for a in alert_manager.get_active_alerts()] == ["a2"]
+        assert alert_manager.alerts[0].resolved is True
+        assert alert_manager.alerts[0].resolved_at is not None
+
+    def test_resolve_unknown_alert_is_noop(self, alert_manager):
+        """Test resolving a missing id does nothing"""
+        alert_manager._store_alert(make_alert("a1"))
+        alert_manager.resolve_alert("missing")
+
+        assert len(alert_manager.get_active_alerts()) == 1
+
+    def test_history_is_bounded(self, alert_manager):
+        """Test evicted alerts also leave the active index"""
+        for i in range(1005):
+            alert_manager._store_alert(make_alert(f"a{i}"))
+
+        assert len(alert_manager.alerts) == 1000
+        active_ids = {a.id for a in alert_manager.get_active_alerts()}
+        assert len(active_ids) == 1000
+        assert "a0" not in active_ids
+        assert "a1004" in active_ids
+
+
+class TestAlertChecks:
+    """Test alert condition evaluation"""
+
+    @pytest.fixture
+    def metrics(self):
+        """Metrics collector reporting a sustained high error rate"""
+        metrics = MagicMock(spec=MetricsCollector)
+        metrics.get_request_metrics.return_value = {
+            'total_requests': 10, 'p95_response_time': 0.1,
+            'avg_response_time': 0.1, 'error_rate': 0.5
+        }
+        metrics.get_processing_metrics.return_value = {
+            'total_processed': 0, 'success_rate': 0
+        }
+        metrics.get_system_metrics.return_value = {
+            'memory_percent': 10.0, 'cpu_percent': 10.0
+        }
+        return metrics
+
+    def test_cooldown_suppresses_duplicate_alerts(self, metrics):
+        """Test a sustained condition fires once per cooldown window"""
+        alert_manager = AlertManager(metrics)
+
+        first = alert_manager.check_alerts()
+        second = alert_manager.check_alerts()
+
+        assert [a.type for a in first] == [AlertType.ERROR_RATE]
+        assert second == []
+
+        alert_manager.cooldown_seconds = 0
+        assert len(alert_manager.check_alerts()) == 1
+
+    def test_alert_payload_keys(self, metrics):
+        """Test alert ids and details keep the metric names /alerts consumers read"""
+        metrics.get_request_metrics.return_value['p95_response_time'] = 9.0
+        metrics.get_system_metrics.return_value = {'memory_percent': 95.0, 'cpu_percent': 99.0}
+        alert_manager = AlertManager(metrics)
+
+        alerts = {alert.id.rsplit('_', 1)[0]: alert for alert in alert_manager.check_alerts()}
+
+        assert set(alerts) == {'response_time', 'error_rate', 'memory_usage', 'cpu_usage'}
+        assert set(alerts['response_time'].details) == {'p95_response_time', 'avg_response_time', 'threshold'}
+        assert alerts['memory_usage'].details['memory_percent'] == 95.0
+        assert alerts['cpu_usage'].details['cpu_percent'] == 99.0
+        assert alerts['error_rate'].details == {'error_rate': 0.5, 'threshold': alert_manager.alert_thresholds['error_rate']}
+
+    def test_empty_windows_do_not_alert(self, metrics):
+        """Test no processing samples does not count as a low success rate"""
+        metrics.get_request_metrics.return_value['total_requests'] = 0
+        alert_manager = AlertManager(metrics)
+
+        assert alert_manager.check_alerts() == []
+
+
+class TestHealthChecker:
+    """Test health check collection and caching"""
+
+    @pytest.mark.asyncio
+    async def test_check_health_is_cached(self):
+        """Test burst health checks reuse one sample"""
+        checker = HealthChecker()
+
+        with patch.object(checker, '_collect_sync', wraps=checker._collect_sync) as mock_collect:
+            first = await checker.check_health()
+            second = await checker.check_health()
+
+        assert mock_collect.call_count == 1
+        assert first is second
+        assert first['checks']['orchestrator']['status'] == 'error'
+        assert first['overall_status'] == 'error'
+
+    @pytest.mark.asyncio
+    async def test_check_health_refreshes_after_ttl(self):
+        """Test an expired cache triggers a new sample"""
+        checker = HealthChecker()
+        checker.cache_ttl = 0
+
+        with patch.object(checker, '_collect_sync', wraps=checker._collect_sync) as mock_collect:
+            await checker.check_health()
+            await checker.check_health()
+
+        assert mock_collect.call_count == 2
+
+
+class TestMonitoringLoop:
+    """Test background monitoring scheduling"""
+
+    @pytest.mark.asyncio
+    async def test_loop_runs_at_fixed_rate(self):
+        """Test check duration is subtracted from the next sleep and overruns skip ahead"""
+        system = MonitoringSystem()
+        system.alert_manager.check_interval = 60
+        system.alert_manager.check_alerts = MagicMock(return_value=[])
+
+        # start, after check 1 (10s), after check 2 (70s overrun), after check 3
+        clock = iter([0.0, 10.0, 140.0, 150.0])
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 3:
+                raise asyncio.CancelledError
+
+        with patch('modules.monitoring.time.monotonic', side_effect=lambda: next(clock)), \
+             patch('modules.monitoring.asyncio.sleep', side_effect=fake_sleep):
+            with pytest.raises(asyncio.CancelledError):
+                await system._monitoring_loop()
+
+        assert sleeps == [50.0, 60, 50.0]
+
+    @pytest.mark.asyncio
+    async def test_loop_logs_structured_alerts(self, caplog):
+        """Test triggered alerts are logged with their structured fields"""
+        system = MonitoringSystem()
+        system.alert_manager.check_alerts = MagicMock(return_value=[make_alert("a1")])
+
+        with patch('modules.monitoring.asyncio.sleep', side_effect=asyncio.CancelledError), \
+             caplog.at_level("WARNING", logger="modules.monitoring"):
+            with pytest.raises(asyncio.CancelledError):
+                await system._monitoring_loop()
+
+        record = caplog.records[-1]
+        assert record.getMessage() == "Alert triggered: Alert a1"
+        assert record.alert_id == "a1"
+        assert record.alert_type == "performance"
+        assert record.alert_level == "warning"
@@ -3,9 +3,10 @@ Unit tests for omi_client.py module
 Tests OMI API client functionality
 """
 import pytest
+import socket
 from unittest.mock import patch, MagicMock
 
-from modules.omi_client import OMIClient
+from modules.omi_client import OMIClient, MAX_POOL_CONNECTIONS, MAX_MEMORIES_PER_REQUEST
 
 
 class TestOMIClient:
@@ -46,6 +47,16 @@ class TestOMIClient:
 
         assert result == True
 
+    def test_send_notification_http_error(self):
+        """Test an HTTP error status returns False"""
+        client = OMIClient()
+
+        with patch.object(client.session, 'post', return_value=MagicMock(status_code=404)) as mock_post:
+            result = client.send_notification("test message", "user123")
+
+        assert result is False
+        mock_post.assert_called_once()
+
     @patch('modules.omi_client.requests.get')
     def test_read_conversations(self, mock_get):
         """Test conversation reading"""
@@ -57,4 +68,128 @@ class TestOMIClient:
         result = client.read_conversations(limit=5)
 
         assert len(result) > 0
-        assert result[0]["id"] == "conv1"
\ No newline at end of file
+        assert result[0]["id"] == "conv1"
+
+    def test_read_all_conversations_pages_concurrently(self):
+        """Test paginated read issues one request per page and keeps offset order"""
+        client = OMIClient()
+
+        def fake_page(limit, offset, include_discarded=False):
+            return [{"id": f"conv{i}"} for i in range(offset, offset + limit)]
+
+        with patch.object(client, 'read_conversations', side_effect=fake_page) as mock_read:
+            result = client.read_all_conversations(total=2500, page_size=1000)
+
+        assert mock_read.call_count == 3
+        assert len(result) == 2500
+        assert result[0]["id"] == "conv0"
+        assert result[-1]["id"] == "conv2499"
+
+    def test_read_all_memories_skips_failed_pages(self):
+        """Test a failing page is skipped instead of failing the whole read"""
+        client = OMIClient()
+
+        def fake_page(limit, offset):
+            if offset == 100:
+                raise RuntimeError("boom")
+            return [{"id": f"mem{i}"} for i in range(offset, offset + limit)]
+
+        with patch.object(client, 'read_memories', side_effect=fake_page):
+            result = client.read_all_memories(total=250, page_size=100)
+
+        assert len(result) == 150
+        assert result[-1]["id"] == "mem249"
+
+    def test_read_user_bundle(self):
+        """Test conversations and memories are read together"""
+        client = OMIClient()
+
+        with patch.object(client, 'read_conversations', return_value=[{"id": "conv1"}]) as mock_conv, \
+             patch.object(client, 'read_memories', return_value=[{"id": "mem1"}]) as mock_mem:
+            bundle = client.read_user_bundle(limit=5)
+
+        mock_conv.assert_called_once_with(limit=5)
+        mock_mem.assert_called_once_with(limit=5)
+        assert bundle == {"conversations": [{"id": "conv1"}], "memories": [{"id": "mem1"}]}
+
+    def test_session_uses_bounded_connection_pool(self):
+        """Test the session reuses a bounded, blocking connection pool"""
+        client = OMIClient()
+
+        adapter = client.session.get_adapter("https://api.omi.me")
+
+        assert adapter._pool_maxsize == MAX_POOL_CONNECTIONS
+        assert adapter._pool_block is True
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+    def test_read_memories_revalidates_with_etag(self):
+        """Test a repeated read sends If-None-Match and reuses the body on 304"""
+        client = OMIClient()
+        first = MagicMock(status_code=200, content=b'{"memories": [{"id": "mem1"}]}',
+                          headers={"ETag": '"v1"'})
+        not_modified = MagicMock(status_code=304, headers={})
+
+        with patch.object(client.session, 'get', side_effect=[first, not_modified]) as mock_get:
+            initial = client.read_memories(limit=10)
+            repeat = client.read_memories(limit=10)
+
+        assert mock_get.call_args_list[0].kwargs["headers"] is None
+        assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert repeat == initial == [{"id": "mem1"}]
+
+    def test_cached_body_is_not_shared(self):
+        """Test mutating a result does not change what a later 304 returns"""
+        client = OMIClient()
+        first = MagicMock(status_code=200, content=b'{"memories": [{"id": "mem1"}]}',
+                          headers={"ETag": '"v1"'})
+        not_modified = MagicMock(status_code=304, headers={})
+
+        with patch.object(client.session, 'get', side_effect=[first, not_modified, not_modified]):
+            client.read_memories(limit=10).append({"id": "injected"})
+            repeat = client.read_memories(limit=10)
+            repeat[0]["id"] = "changed"
+
+            assert client.read_memories(limit=10) == [{"id": "mem1"}]
+
+    def test_create_memories_requires_text(self):
+        """Test missing text is rejected before any request is made"""
+        client = OMIClient()
+
+        with patch.object(client.session, 'post') as mock_post:
+            with pytest.raises(ValueError):
+                client.create_memories(memories=[{"content": "test"}])
+
+        mock_post.assert_not_called()
+
+    def test_create_memories_chunks_large_batches(self):
+        """Test memory lists over the request limit are split and results merged"""
+        client = OMIClient()
+        memories = [{"content": f"m{i}"} for i in range(MAX_MEMORIES_PER_REQUEST + 1)]
+        responses = [
+            MagicMock(status_code=200, content=b'{"memories": [{"id": "a"}]}'),
+            MagicMock(status_code=200, content=b'{"memories": [{"id": "b"}]}'),
+        ]
+
+        with patch.object(client.session, 'post', side_effect=responses) as mock_post:
+            result = client.create_memories(text="batch", memories=memories)
+
+        assert mock_post.call_count == 2
+        assert b'"content":"m100"' in mock_post.call_args.kwargs["data"]
+        assert result["memories"] == [{"id": "a"}, {"id": "b"}]
+
+    def test_create_memories_encodes_body_with_orjson(self):
+        """Test request body is sent pre-encoded and response parsed from raw bytes"""
+        client = OMIClient()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"memories": [{"id": "mem1"}]}'
+
+        with patch.object(client.session, 'post', return_value=mock_response) as mock_post:
+            result = client.create_memories(text="test content", memories=[{"content": "test"}])
+
+        sent = mock_post.call_args.kwargs["data"]
+        assert mock_post.call_args.kwargs["timeout"] == client.timeout
+        assert isinstance(sent, bytes)
+        assert b'"text":"test content"' in sent
+        assert result["memories"][0]["id"] == "mem1"
@@ -0,0 +1,474 @@
+"""
+Unit tests for orchestrator.py module
+Tests transcript helpers and the processing pipeline
+"""
+import asyncio
+import threading
+import time
+import pytest
+import psutil
+from collections import defaultdict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import modules.orchestrator as orchestrator_module
+from modules.orchestrator import (
+    OMIGeminiOrchestrator, FOLLOW_UP_KEYWORD, PROFESSIONAL_KEYWORD, MAX_CONCURRENT_SLIDE_CALLS,
+    analysis_scores,
+    cached_timestamps, classify_transcript_keywords, is_short_transcript, join_segment_text,
+    StepTimings, STEP_HISTORY_SIZE, profile_step, read_rss_mb
+)
+
+
+class TestProfileStep:
+    """Test step profiling"""
+
+    def test_time_only_by_default(self):
+        """Test memory is not sampled unless enabled"""
+        profile = {}
+        with profile_step("step", profile, sample_memory=False):
+            pass
+
+        assert set(profile) == {"step_time"}
+
+    def test_memory_sampling(self):
+        """Test memory delta is recorded when sampling is enabled"""
+        profile = {}
+        with profile_step("step", profile, sample_memory=True):
+            pass
+
+        assert set(profile) == {"step_time", "step_memory_mb"}
+
+    def test_time_log(self):
+        """Test step timings are also appended to a supplied log"""
+        profile = {}
+        time_log = []
+        with profile_step("step", profile, sample_memory=True, time_log=time_log):
+            pass
+
+        assert time_log == [("step_time", profile["step_time"])]
+
+    def test_read_rss_matches_psutil(self):
+        """Test the procfs reading agrees with psutil"""
+        expected = psutil.Process().memory_info().rss / 1048576
+        assert abs(read_rss_mb() - expected) < 50
+
+    def test_psutil_fallback_reuses_handle(self):
+        """Test the fallback path creates one psutil handle per process"""
+        with patch('modules.orchestrator.os.pread', side_effect=OSError), \
+             patch.object(orchestrator_module, '_psutil_process', None), \
+             patch('modules.orchestrator.psutil.Process', wraps=psutil.Process) as mock_process:
+            read_rss_mb()
+            read_rss_mb()
+
+        assert mock_process.call_count == 1
+
+
+class TestCachedTimestamps:
+    """Test per-second timestamp caching"""
+
+    def test_rebuilt_once_per_second(self):
+        """Test stamps are reused within a second and refreshed after"""
+        with patch('modules.orchestrator.time.time', side_effect=[1000.1, 1000.9, 1001.0]):
+            iso, local = cached_timestamps()
+            first_cache = orchestrator_module._timestamp_cache
+            cached_timestamps()
+            assert orchestrator_module._timestamp_cache is first_cache
+            cached_timestamps()
+
+        assert first_cache[0] == 1000
+        assert orchestrator_module._timestamp_cache[0] == 1001
+        assert iso.endswith("+00:00")
+        assert len(local) == len("2024-01-01 00:00")
+
+
+class TestJoinSegmentText:
+    """Test transcript segment joining"""
+
+    def test_skips_empty_segments(self):
+        """Test empty text does not produce doubled separators"""
+        segments = [{"text": "hello"}, {"text": ""}, {"text": "world"}]
+        assert join_segment_text(segments) == "hello world"
+
+    def test_segments_without_text(self):
+        """Test segments missing a text key are skipped"""
+        segments = [{"text": "hello"}, {"speaker": "SPEAKER_1"}, {"text": "world"}]
+        assert join_segment_text(segments) == "hello world"
+
+
+class TestShortTranscript:
+    """Test the short transcript fast path check"""
+
+    def test_matches_stripped_length(self):
+        """Test the check agrees with measuring the stripped transcript"""
+        for transcript in ["hi", "a" * 19, "a" * 20, "  " + "a" * 18 + "  ", " " * 40, "\n" + "a" * 25]:
+            assert is_short_transcript(transcript) == (len(transcript.strip()) < 20)
+
+
+class TestAutomationHeuristics:
+    """Test keyword heuristics for calendar and presentation automation"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """Orchestrator without initialized components"""
+        return OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+
+    def test_schedule_on_follow_up_keyword(self, orchestrator):
+        """Test follow-up mentions schedule a meeting regardless of case"""
+        assert orchestrator._should_schedule_meeting(1, 1, "Let's FOLLOW-UP tomorrow")
+        assert orchestrator._should_schedule_meeting(1, 1, "we should follow up")
+        assert not orchestrator._should_schedule_meeting(1, 1, "nice weather today")
+        assert orchestrator._should_schedule_meeting(6, 1, "nice weather today")
+
+    def test_presentation_needs_scores_and_keyword(self, orchestrator):
+        """Test presentations require both a professional keyword and a score"""
+        assert orchestrator._should_create_presentation(5, 1, "The Project deadline")
+        assert not orchestrator._should_create_presentation(1, 1, "The Project deadline")
+        assert not orchestrator._should_create_presentation(5, 1, "nice weather today")
+
+    def test_classify_transcript_keywords(self):
+        """Test one scan reports every keyword category found"""
+        assert classify_transcript_keywords("nice weather today") == 0
+        assert classify_transcript_keywords("Discuss later") == FOLLOW_UP_KEYWORD
+        assert classify_transcript_keywords("a BUSINESS plan") == PROFESSIONAL_KEYWORD
+        assert classify_transcript_keywords("team Meeting") == FOLLOW_UP_KEYWORD | PROFESSIONAL_KEYWORD
+
+    def test_precomputed_mask_skips_scan(self, orchestrator):
+        """Test a supplied keyword mask is used instead of rescanning"""
+        assert orchestrator._should_schedule_meeting(5, 1, "nice weather", FOLLOW_UP_KEYWORD)
+        assert not orchestrator._should_create_presentation(5, 1, "project work", FOLLOW_UP_KEYWORD)
+
+    def test_analysis_scores(self):
+        """Test scores are read once with missing sections defaulting to zero"""
+        assert analysis_scores({"adhd_indicators": {"score": 7}, "anxiety_patterns": {}}) == (7, 0)
+        assert analysis_scores({}) == (0, 0)
+
+
+class TestProcessMemoryWebhook:
+    """Test the memory webhook pipeline with mocked components"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """Orchestrator with mocked processors and clients"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        orchestrator.transcript_processor = MagicMock()
+        orchestrator.transcript_processor.process_transcript.return_value = {
+            "success": True, "cleaned_text": "We scheduled a project meeting for next week", "model_used": "model"
+        }
+        orchestrator.psychological_analyzer = MagicMock()
+        orchestrator.psychological_analyzer.analyze.return_value = {
+            "adhd_indicators": {"score": 7}, "anxiety_patterns": {"score": 2},
+            "cognitive_biases": {"score": 1}, "emotional_tone": {"primary_emotion": "focused"}
+        }
+        orchestrator.psychological_analyzer.generate_summary.return_value = "summary"
+        orchestrator.workspace_automation = MagicMock()
+        orchestrator.omi_client = MagicMock()
+        orchestrator.processing_stats = {
+            "total_processed": 0, "average_processing_time": 0, "success_rate": 0,
+            "performance_profile": defaultdict(list)
+        }
+        orchestrator._spawn_bg = MagicMock(side_effect=lambda coro: coro.close())
+        orchestrator._enqueue_notification = MagicMock()
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_memory_save_overlaps_email_decision(self, orchestrator):
+        """Test the OMI memory save and the Gemini email decision run concurrently"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def save(**kwargs):
+            barrier.wait()
+            return {"memories": [{"id": "m"}]}
+
+        def decide(analysis, transcript):
+            barrier.wait()
+            return True
+
+        orchestrator.omi_client.create_memories.side_effect = save
+        orchestrator.workspace_automation.should_create_email.side_effect = decide
+
+        result = await orchestrator.process_memory_webhook(
+            {"id": "mem1", "text": "We scheduled a project meeting for next week"}, "user1"
+        )
+
+        assert result["success"] is True
+        assert "memory_saved" in result["steps_completed"]
+        assert result["email_queued"] and result["calendar_queued"] and result["presentation_queued"]
+        orchestrator._spawn_bg.assert_called_once()
+
+
+class TestManualConversationAnalysis:
+    """Test batched analysis of recent conversations"""
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_skips_only_its_conversations(self):
+        """Test conversations are analyzed in batch-sized chunks and a failing chunk is skipped alone"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        orchestrator.omi_client = MagicMock()
+        orchestrator.omi_client.read_conversations.return_value = [
+            {"id": f"c{i}", "text": f"conversation {i}"} for i in range(7)
+        ]
+        orchestrator.transcript_processor = MagicMock()
+        orchestrator.transcript_processor.process_transcript.side_effect = lambda text: {
+            "success": True, "cleaned_text": text, "model_used": "model"
+        }
+
+        def analyze_batch(texts):
+            if "conversation 0" in texts:
+                raise RuntimeError("batch failed")
+            return [{"text": text} for text in texts]
+
+        orchestrator.psychological_analyzer = MagicMock()
+        orchestrator.psychological_analyzer.analyze_batch.side_effect = analyze_batch
+
+        with patch('modules.orchestrator.ANALYSIS_BATCH_SIZE', 5):
+            results = await orchestrator.manual_conversation_analysis(limit=7)
+
+        assert orchestrator.psychological_analyzer.analyze_batch.call_count == 2
+        assert [r["conversation_id"] for r in results] == ["c5", "c6"]
+        assert results[0]["analysis"] == {"text": "conversation 5"}
+
+
+class TestWorkspaceAutomationBackground:
+    """Test background Google Workspace automation"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """Orchestrator with mocked workspace automation"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        orchestrator.workspace_automation = MagicMock()
+        orchestrator._workspace_locks = defaultdict(asyncio.Lock)
+        orchestrator._enqueue_notification = MagicMock()
+        orchestrator._generate_slides_content = AsyncMock(return_value=[])
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_services_run_concurrently(self, orchestrator):
+        """Test Gmail, Calendar and Slides calls overlap"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def created(result):
+            def call(**kwargs):
+                # Only returns once all three services are in flight at the same time
+                barrier.wait()
+                return result
+            return call
+
+        orchestrator.workspace_automation.create_email_draft.side_effect = created("draft1")
+        orchestrator.workspace_automation.create_calendar_event.side_effect = created("event1")
+        orchestrator.workspace_automation.create_presentation.side_effect = created("pres1")
+
+        await orchestrator._run_workspace_automation_background(
+            {}, "transcript", "m1", "user1", "summary", True, True, True
+        )
+
+        orchestrator._enqueue_notification.assert_called_once_with(
+            "Workspace automation completed - Email: True, Calendar: True, Slides: True", "user1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_cancel_other_services(self, orchestrator):
+        """Test one failing service still reports the others and the error"""
+        orchestrator.workspace_automation.create_email_draft.side_effect = RuntimeError("gmail down")
+        orchestrator.workspace_automation.create_calendar_event.return_value = "event1"
+
+        await orchestrator._run_workspace_automation_background(
+            {}, "transcript", "m1", "user1", "summary", True, True, False
+        )
+
+        messages = [c.args[0] for c in orchestrator._enqueue_notification.call_args_list]
+        assert messages == [
+            "Workspace automation completed - Email: False, Calendar: True, Slides: False",
+            "Workspace automation failed: gmail down"
+        ]
+
+
+class TestSlidesContent:
+    """Test presentation slide generation"""
+
+    @pytest.mark.asyncio
+    async def test_sections_generated_concurrently_in_order(self):
+        """Test section calls overlap and slides keep their fixed order"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_section(section_type, analysis, transcript, instruction, summary):
+            # Only returns once all four sections are in flight at the same time
+            barrier.wait()
+            return f"{section_type} content"
+
+        orchestrator._generate_slide_content = fake_section
+        orchestrator._slide_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SLIDE_CALLS)
+        slides = await orchestrator._generate_slides_content({}, "transcript", "summary")
+
+        assert [s["title"] for s in slides] == [
+            "Meeting Analysis & Insights", "Key Points", "Action Items",
+            "Psychological Insights", "Conclusions"
+        ]
+        assert slides[1]["body"] == "key_points content"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_presentations_share_call_limit(self):
+        """Test section calls from several presentations stay within MAX_CONCURRENT_SLIDE_CALLS"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        orchestrator._slide_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SLIDE_CALLS)
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def fake_section(section_type, analysis, transcript, instruction, summary):
+            with lock:
+                in_flight.append(section_type)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(section_type)
+            return section_type
+
+        orchestrator._generate_slide_content = fake_section
+        await asyncio.gather(*(
+            orchestrator._generate_slides_content({}, "transcript", "summary") for _ in range(3)
+        ))
+
+        assert len(peak) == 12
+        assert max(peak) <= MAX_CONCURRENT_SLIDE_CALLS
+
+    def test_slide_prompt_marks_only_truncated_transcripts(self):
+        """Test the truncation note is added only when the transcript is cut"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        orchestrator.workspace_automation = MagicMock()
+        orchestrator.workspace_automation.client.models.generate_content.return_value.text = "x" * 600
+        generate = orchestrator.workspace_automation.client.models.generate_content
+
+        content = orchestrator._generate_slide_content("key_points", {}, "short transcript", "Summarize", "summary")
+        short_prompt = generate.call_args.kwargs["contents"]
+        orchestrator._generate_slide_content("key_points", {}, "a" * 3000, "Summarize", "summary")
+        long_prompt = generate.call_args.kwargs["contents"]
+
+        assert "truncated" not in short_prompt
+        assert "a" * 2000 + "... (truncated for brevity)" in long_prompt
+        assert "a" * 2001 not in long_prompt
+        assert len(content) == 500 and content.endswith("...")
+
+
+class TestPerformanceStats:
+    """Test step timing aggregation"""
+
+    def test_step_aggregates_cover_history_window(self):
+        """Test aggregates cover the same recent samples as the returned history"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        orchestrator.processing_stats = {
+            "total_processed": 0, "average_processing_time": 0, "success_rate": 0,
+            "performance_profile": defaultdict(StepTimings)
+        }
+        timings = orchestrator.processing_stats["performance_profile"]["analysis_time"]
+        for duration in [5.0] + [1.0] * (STEP_HISTORY_SIZE - 1) + [3.0]:
+            timings.append(duration)
+
+        stats = orchestrator.get_performance_stats()
+
+        assert stats["performance_profile"]["analysis_time"] == [1.0] * (STEP_HISTORY_SIZE - 1) + [3.0]
+        assert stats["max_analysis_time"] == 3.0
+        assert stats["min_analysis_time"] == 1.0
+        assert stats["avg_analysis_time"] == pytest.approx((STEP_HISTORY_SIZE + 2) / STEP_HISTORY_SIZE)
+
+
+class TestNotificationMessage:
+    """Test the OMI notification text"""
+
+    def test_message_lists_patterns_and_automations(self):
+        """Test elevated scores and created items are appended in order"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        analysis = {
+            "adhd_indicators": {"score": 7}, "anxiety_patterns": {"score": 2},
+            "cognitive_biases": {"score": 5}
+        }
+
+        message = orchestrator._build_notification_message(analysis, True, False, True, 4)
+
+        assert message == (
+            "Gemini analysis complete (4 steps) - Patterns detected (ADHD:7/Biases:5/10)"
+            " - Created: email, slides"
+        )
+
+    def test_message_without_patterns(self):
+        """Test low scores and no automations give the bare completion message"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+
+        assert orchestrator._build_notification_message({}, False, False, False, 2) == (
+            "Gemini analysis complete (2 steps)"
+        )
+
+
+class TestResultTemplate:
+    """Test the shared ProcessingResult defaults"""
+
+    def test_template_is_read_only(self):
+        """Test the shared template cannot be mutated and copies are plain dicts"""
+        with pytest.raises(TypeError):
+            OMIGeminiOrchestrator._RESULT_TEMPLATE["success"] = True
+
+        result = OMIGeminiOrchestrator._RESULT_TEMPLATE.copy()
+        result["success"] = True
+
+        assert type(result) is dict
+        assert OMIGeminiOrchestrator._RESULT_TEMPLATE["success"] is False
+
+
+class TestBackgroundTasks:
+    """Test background task tracking"""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """Orchestrator with only background task state"""
+        orchestrator = OMIGeminiOrchestrator.__new__(OMIGeminiOrchestrator)
+        orchestrator._bg_tasks = set()
+        orchestrator._notify_queue = None
+        orchestrator._notify_task = None
+        orchestrator.omi_client = MagicMock()
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_tasks_are_tracked_until_done(self, orchestrator):
+        """Test spawned tasks are referenced while running and dropped after"""
+        event = asyncio.Event()
+        task = orchestrator._spawn_bg(event.wait())
+
+        assert orchestrator._bg_tasks == {task}
+
+        event.set()
+        await orchestrator.aclose()
+        await asyncio.sleep(0)
+
+        assert task.done()
+        assert orchestrator._bg_tasks == set()
+
+    @pytest.mark.asyncio
+    async def test_aclose_drains_failing_tasks(self, orchestrator):
+        """Test draining waits for all tasks and does not raise their errors"""
+        async def fail():
+            raise ValueError("boom")
+
+        results = []
+
+        async def succeed():
+            await asyncio.sleep(0)
+            results.append("done")
+
+        orchestrator._spawn_bg(fail())
+        orchestrator._spawn_bg(succeed())
+        await orchestrator.aclose()
+
+        assert results == ["done"]
+
+    @pytest.mark.asyncio
+    async def test_notifications_are_coalesced_per_user(self, orchestrator):
+        """Test queued notifications for one user are merged into one request"""
+        orchestrator._enqueue_notification("first", "user1")
+        orchestrator._enqueue_notification("other", "user2")
+        orchestrator._enqueue_notification("second", "user1")
+
+        await orchestrator.aclose()
+
+        calls = sorted(c.args for c in orchestrator.omi_client.send_notification.call_args_list)
+        assert calls == [("first\n\nsecond", "user1"), ("other", "user2")]
+        assert orchestrator._notify_task is None
@@ -0,0 +1,60 @@
+"""
+Unit tests for processor_registry.py module
+Tests processor registration, lookup and plugin discovery
+"""
+from modules.modality_processor import ModalityType
+from modules.plugins.example_custom_processor import CustomTextProcessor
+from modules.processor_registry import ProcessorRegistry, _plugin_scan_cache, _scan_plugins
+
+
+class TestProcessorRegistry:
+    """Test processor registration and lookup"""
+
+    def test_register_and_get_processor(self):
+        """Test a registered processor is returned for its modality"""
+        registry = ProcessorRegistry()
+        processor = CustomTextProcessor()
+
+        registry.register_processor(ModalityType.TEXT, processor)
+
+        assert registry.get_processor(ModalityType.TEXT) is processor
+        assert ModalityType.TEXT in registry.list_modalities()
+
+    def test_get_unregistered_processor(self):
+        """Test an unregistered modality returns None"""
+        registry = ProcessorRegistry()
+        registry._processors.pop(ModalityType.VIDEO, None)
+
+        assert registry.get_processor(ModalityType.VIDEO) is None
+        assert registry.get_processor("not-a-modality") is None
+
+
+class TestPluginDiscovery:
+    """Test plugin package scanning"""
+
+    def test_scan_finds_only_plugin_classes(self):
+        """Test imported built-in processor classes are not treated as plugins"""
+        assert _scan_plugins() == [CustomTextProcessor]
+
+    def test_scan_is_cached(self):
+        """Test a second scan of an unchanged directory reuses the first result"""
+        first = _scan_plugins()
+
+        assert len(_plugin_scan_cache) == 1
+        assert _scan_plugins() is first
+
+    def test_plugin_processor_is_registered(self):
+        """Test the plugin processor is registered for its modality"""
+        registry = ProcessorRegistry()
+
+        assert isinstance(registry.get_processor(ModalityType.TEXT), CustomTextProcessor)
+
+    def test_determine_modality_from_class(self):
+        """Test the nearest built-in base in the MRO decides the modality"""
+        registry = ProcessorRegistry()
+
+        class Unrelated:
+            pass
+
+        assert registry._determine_modality_from_class(CustomTextProcessor) is ModalityType.TEXT
+        assert registry._determine_modality_from_class(Unrelated) is None
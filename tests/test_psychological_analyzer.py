@@ -3,8 +3,11 @@ Unit tests for psychological_analyzer.py module
 Tests psychological analysis using Gemini AI
 """
 import pytest
+import threading
+import time
 from unittest.mock import patch, MagicMock
 
+from modules.api_utils import RateLimiter
 from modules.psychological_analyzer import PsychologicalAnalyzer
 
 
@@ -100,6 +103,9 @@ class TestPsychologicalAnalyzerAnalyze:
         assert result["emotional_tone"]["primary_emotion"] == "anxious"
         assert "mindfulness" in result["recommendations"][0]
 
+        config = analyzer.client.models.generate_content.call_args.kwargs["config"]
+        assert config.response_mime_type == "application/json"
+
     @patch('modules.psychological_analyzer.genai.Client')
     def test_analyze_fallback_to_secondary_model(self, mock_genai_client):
         """Test fallback to secondary model when primary fails"""
@@ -276,6 +282,28 @@ class TestPsychologicalAnalyzerInternal:
 
         assert "without detailed evidence" in prompt
 
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_build_analysis_prompt_truncates_long_transcript(self, mock_genai_client):
+        """Test an overly long transcript is cut and the truncation noted after it"""
+        analyzer = PsychologicalAnalyzer()
+        transcript = "a" * 25000 + "b" * 30000
+
+        prompt = analyzer._build_analysis_prompt(transcript, True)
+
+        assert prompt.endswith("a...[truncated for analysis]\n\nJSON Response:")
+        assert "b" not in prompt.split("Transcript:\n", 1)[1]
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_score_interpretation(self, mock_genai_client):
+        """Test score labels for table and out-of-range scores"""
+        analyzer = PsychologicalAnalyzer()
+
+        assert [analyzer._score_interpretation(s) for s in (0, 3, 6, 7, 10)] == [
+            "Minimal", "Low", "Moderate", "Elevated", "High"
+        ]
+        assert analyzer._score_interpretation(-1) == "Minimal"
+        assert analyzer._score_interpretation(5.5) == "Moderate"
+
     @patch('modules.psychological_analyzer.genai.Client')
     def test_parse_analysis_response_valid_json(self, mock_genai_client):
         """Test parsing valid JSON response"""
@@ -301,6 +329,18 @@ class TestPsychologicalAnalyzerInternal:
 
         assert result["adhd_indicators"]["score"] == 6
 
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_parse_analysis_response_surrounding_prose(self, mock_genai_client):
+        """Test parsing JSON with text before and after the object"""
+        analyzer = PsychologicalAnalyzer()
+
+        response = 'Here is the analysis: {"adhd_indicators": {"score": 4, "evidence": ["{braces}"]}} Hope this helps.'
+
+        result = analyzer._parse_analysis_response(response)
+
+        assert result["adhd_indicators"]["evidence"] == ["{braces}"]
+        assert result["anxiety_patterns"] == {}
+
     @patch('modules.psychological_analyzer.genai.Client')
     def test_parse_analysis_response_invalid_json(self, mock_genai_client):
         """Test parsing invalid JSON response"""
@@ -322,4 +362,174 @@ class TestPsychologicalAnalyzerInternal:
 
         assert key1 != key2  # Different include_details
         assert key1 != key3  # Different transcript
-        assert len(key1) == 32  # MD5 hash length
\ No newline at end of file
+        assert key1 == (True, "Test transcript")  # Short transcripts key on their text
+
+        long_key = analyzer._get_cache_key("a" * 1001, True)
+        assert len(long_key) == 32  # 16-byte digest as hex
+        assert long_key != analyzer._get_cache_key("a" * 1001, False)
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_cache_key_covers_whole_transcript(self, mock_genai_client):
+        """Test transcripts sharing a long prefix get different keys"""
+        analyzer = PsychologicalAnalyzer()
+        prefix = "a" * 2000
+
+        assert analyzer._get_cache_key(prefix + "one", True) != analyzer._get_cache_key(prefix + "two", True)
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_cached_result_expires(self, mock_genai_client):
+        """Test cached analyses are dropped after the TTL"""
+        analyzer = PsychologicalAnalyzer()
+        analyzer._cache_result("key", {"overall_assessment": "cached"})
+
+        assert analyzer._get_cached_result("key") == {"overall_assessment": "cached"}
+
+        with patch('modules.psychological_analyzer.time.monotonic', return_value=time.monotonic() + 3601):
+            assert analyzer._get_cached_result("key") is None
+        assert "key" not in analyzer._analysis_cache
+
+
+ANALYSIS_JSON = '{"adhd_indicators": {"score": 3, "evidence": [], "confidence": "low"}, "anxiety_patterns": {"score": 2, "themes": [], "confidence": "low"}, "cognitive_biases": {"score": 1, "identified_biases": [], "confidence": "low"}, "emotional_tone": {"primary_emotion": "neutral", "stability": "stable", "description": "Neutral"}}'
+LONG_TRANSCRIPT = "We talked through the project plan and the deadlines for next quarter in detail."
+
+
+class TestPsychologicalAnalyzerFallback:
+    """Test the model fallback chain and hedged calls"""
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_empty_primary_falls_back(self, mock_genai_client):
+        """Test an empty primary response moves on to the next model"""
+        analyzer = PsychologicalAnalyzer()
+        analyzer.client.models.generate_content.side_effect = [
+            MagicMock(text=""), MagicMock(text=ANALYSIS_JSON)
+        ]
+
+        result = analyzer.analyze(LONG_TRANSCRIPT)
+
+        assert result["adhd_indicators"]["score"] == 3
+        models = [c.kwargs["model"] for c in analyzer.client.models.generate_content.call_args_list]
+        assert models == analyzer.models[:2]
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_non_object_primary_falls_back(self, mock_genai_client):
+        """Test a JSON reply that is not an object moves on to the next model"""
+        analyzer = PsychologicalAnalyzer()
+        analyzer.client.models.generate_content.side_effect = [
+            MagicMock(text='["not", "an", "analysis"]'), MagicMock(text=ANALYSIS_JSON)
+        ]
+
+        result = analyzer.analyze(LONG_TRANSCRIPT)
+
+        assert result["adhd_indicators"]["score"] == 3
+        assert analyzer.client.models.generate_content.call_count == 2
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_stalled_primary_is_hedged(self, mock_genai_client):
+        """Test a primary call past the hedge delay is overtaken by the next model"""
+        analyzer = PsychologicalAnalyzer()
+        release = threading.Event()
+
+        def generate_content(model, contents, config):
+            if model == analyzer.models[0]:
+                release.wait(5)
+                return MagicMock(text="")
+            return MagicMock(text=ANALYSIS_JSON)
+
+        analyzer.client.models.generate_content.side_effect = generate_content
+
+        try:
+            with patch('modules.psychological_analyzer.GeminiConfig.ANALYSIS_HEDGE_DELAY', 0.05):
+                result = analyzer.analyze(LONG_TRANSCRIPT)
+        finally:
+            release.set()
+
+        assert result["adhd_indicators"]["score"] == 3
+        assert analyzer.client.models.generate_content.call_count == 2
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_losing_hedged_call_is_cancelled(self, mock_genai_client):
+        """Test the overtaken call gets a cancel event that is set once the chain answers"""
+        analyzer = PsychologicalAnalyzer()
+        release = threading.Event()
+        cancel_events = []
+
+        def call_gemini_api(model_name, prompt, config, cancel_event=None, on_acquire=None):
+            cancel_events.append(cancel_event)
+            on_acquire()
+            if model_name == analyzer.models[0]:
+                release.wait(5)
+                return MagicMock(text="")
+            return MagicMock(text=ANALYSIS_JSON)
+
+        try:
+            with patch.object(analyzer, '_call_gemini_api', side_effect=call_gemini_api), \
+                 patch('modules.psychological_analyzer.GeminiConfig.ANALYSIS_HEDGE_DELAY', 0.05):
+                result = analyzer.analyze(LONG_TRANSCRIPT)
+        finally:
+            release.set()
+
+        assert result["adhd_indicators"]["score"] == 3
+        assert len(cancel_events) == 2
+        assert cancel_events[0] is cancel_events[1]
+        assert cancel_events[0].is_set()
+
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_rate_limited_primary_is_not_hedged(self, mock_genai_client):
+        """Test a primary call waiting on a paused limiter does not start the hedge clock"""
+        analyzer = PsychologicalAnalyzer()
+        analyzer.client.models.generate_content.return_value = MagicMock(text=ANALYSIS_JSON)
+        limiter = RateLimiter(requests_per_minute=60, requests_per_hour=1000)
+        limiter.pause(0.3)
+
+        with patch('modules.api_utils._gemini_rate_limiter', limiter), \
+             patch('modules.psychological_analyzer.GeminiConfig.ANALYSIS_HEDGE_DELAY', 0.05), \
+             patch.object(analyzer, '_call_gemini_api', wraps=analyzer._call_gemini_api) as mock_call:
+            result = analyzer.analyze(LONG_TRANSCRIPT)
+
+        assert result["adhd_indicators"]["score"] == 3
+        # Only the primary was ever started, and only it reached Gemini
+        assert [c.args[0] for c in mock_call.call_args_list] == analyzer.models[:1]
+        models = [c.kwargs["model"] for c in analyzer.client.models.generate_content.call_args_list]
+        assert models == analyzer.models[:1]
+
+
+class TestPsychologicalAnalyzerBatch:
+    """Test analyzing several transcripts in shared requests"""
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_batch_uses_one_call(self, mock_genai_client):
+        """Test distinct transcripts share one request and duplicates reuse its result"""
+        analyzer = PsychologicalAnalyzer()
+        analyzer.client.models.generate_content.return_value = MagicMock(
+            text='{"results": [' + ANALYSIS_JSON + ', ' + ANALYSIS_JSON.replace('"score": 3', '"score": 7') + ']}'
+        )
+        other = LONG_TRANSCRIPT + " Then we moved on."
+
+        results = analyzer.analyze_batch([LONG_TRANSCRIPT, other, LONG_TRANSCRIPT])
+
+        assert analyzer.client.models.generate_content.call_count == 1
+        assert [r["adhd_indicators"]["score"] for r in results] == [3, 7, 3]
+        prompt = analyzer.client.models.generate_content.call_args.kwargs["contents"]
+        assert "Transcript 1:\n" + LONG_TRANSCRIPT in prompt
+        assert "Transcript 2:\n" + other in prompt
+
+        # Batch results are cached for single analyses
+        assert analyzer.analyze(other)["adhd_indicators"]["score"] == 7
+        assert analyzer.client.models.generate_content.call_count == 1
+
+    @patch('modules.psychological_analyzer.genai.Client')
+    def test_malformed_batch_falls_back(self, mock_genai_client):
+        """Test a batch response with the wrong count is retried per transcript"""
+        analyzer = PsychologicalAnalyzer()
+        analyzer.models = analyzer.models[:1]
+        analyzer.client.models.generate_content.side_effect = [
+            MagicMock(text='{"results": [' + ANALYSIS_JSON + ']}'),
+            MagicMock(text=ANALYSIS_JSON),
+            MagicMock(text=ANALYSIS_JSON)
+        ]
+
+        results = analyzer.analyze_batch([LONG_TRANSCRIPT, LONG_TRANSCRIPT + " Then we moved on."])
+
+        assert analyzer.client.models.generate_content.call_count == 3
+        assert [r["adhd_indicators"]["score"] for r in results] == [3, 3]
\ No newline at end of file
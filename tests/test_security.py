@@ -106,7 +106,7 @@ class TestRateLimiter:
     def test_init(self, rate_limiter):
         """Test rate limiter initialization"""
         assert rate_limiter.requests_per_minute == 10
-        assert len(rate_limiter.requests) == 0
+        assert len(rate_limiter.buckets) == 0
 
     def test_is_allowed_under_limit(self, rate_limiter):
         """Test allowing requests under rate limit"""
@@ -166,6 +166,48 @@ class TestRateLimiter:
         # Client2 should still work
         assert rate_limiter.is_allowed(client2) == True
 
+    def test_tokens_refill_over_the_minute(self, rate_limiter):
+        """Test spent tokens come back at requests_per_minute per minute"""
+        client_id = "test_client"
+
+        with freeze_time("2024-01-01 00:00:00") as frozen_time:
+            rate_limiter.last_cleanup = time.time()
+            for i in range(10):
+                assert rate_limiter.is_allowed(client_id) == True
+            assert rate_limiter.is_allowed(client_id) == False
+
+            # Half a minute refills half of the 10 tokens
+            frozen_time.move_to("2024-01-01 00:00:30")
+            for i in range(5):
+                assert rate_limiter.is_allowed(client_id) == True
+            assert rate_limiter.is_allowed(client_id) == False
+
+    def test_cleanup_drops_idle_buckets(self, rate_limiter):
+        """Test buckets idle for a minute are removed and active ones kept"""
+        with freeze_time("2024-01-01 00:00:00") as frozen_time:
+            rate_limiter.is_allowed("idle_client")
+            frozen_time.move_to("2024-01-01 00:00:50")
+            rate_limiter.is_allowed("active_client")
+
+            frozen_time.move_to("2024-01-01 00:01:10")
+            rate_limiter._cleanup()
+
+        assert list(rate_limiter.buckets) == ["active_client"]
+
+    def test_cleanup_keeps_recently_seen_buckets(self, rate_limiter):
+        """Test a returning client moves behind idle ones so front-only cleanup keeps it"""
+        with freeze_time("2024-01-01 00:00:00") as frozen_time:
+            rate_limiter.is_allowed("returning_client")
+            frozen_time.move_to("2024-01-01 00:00:10")
+            rate_limiter.is_allowed("idle_client")
+            frozen_time.move_to("2024-01-01 00:00:55")
+            rate_limiter.is_allowed("returning_client")
+
+            frozen_time.move_to("2024-01-01 00:01:15")
+            rate_limiter._cleanup()
+
+        assert list(rate_limiter.buckets) == ["returning_client"]
+
     def test_cleanup_old_entries(self, rate_limiter):
         """Test cleanup of old client entries"""
         client1 = "client1"
@@ -175,7 +217,7 @@ class TestRateLimiter:
         rate_limiter.is_allowed(client1)
         rate_limiter.is_allowed(client2)
 
-        initial_count = len(rate_limiter.requests)
+        initial_count = len(rate_limiter.buckets)
         assert initial_count >= 2
 
         # Advance time past cleanup threshold
@@ -206,6 +248,7 @@ class TestInputValidator:
         assert InputValidator.validate_uid(123) == False
         assert InputValidator.validate_uid("user@domain.com") == False  # Invalid chars
         assert InputValidator.validate_uid("a" * 101) == False  # Too long
+        assert InputValidator.validate_uid("user123\n") == False  # Trailing newline
 
     def test_validate_session_id_valid(self):
         """Test valid session ID validation"""
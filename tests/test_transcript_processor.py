@@ -158,6 +158,48 @@ class TestTranscriptProcessorProcess:
             processor.process_transcript("raw text", context=123)
 
 
+class TestTranscriptProcessorCache:
+    """Test caching of cleaned transcripts"""
+
+    @patch('modules.transcript_processor.genai.Client')
+    def test_repeated_transcript_uses_cache(self, mock_genai_client):
+        """Test a re-delivered transcript does not call Gemini again"""
+        processor = TranscriptProcessor()
+        mock_response = MagicMock()
+        mock_response.text = "Cleaned transcript text"
+        processor.client.models.generate_content.return_value = mock_response
+
+        first = processor.process_transcript("raw transcript text")
+        second = processor.process_transcript("  raw transcript text ")
+
+        assert processor.client.models.generate_content.call_count == 1
+        assert second == first
+        assert second is not first
+
+    @patch('modules.transcript_processor.genai.Client')
+    def test_context_is_part_of_key(self, mock_genai_client):
+        """Test the same transcript with different context is cleaned again"""
+        processor = TranscriptProcessor()
+        mock_response = MagicMock()
+        mock_response.text = "Cleaned transcript text"
+        processor.client.models.generate_content.return_value = mock_response
+
+        processor.process_transcript("raw transcript text")
+        processor.process_transcript("raw transcript text", context="meeting")
+
+        assert processor.client.models.generate_content.call_count == 2
+
+    @patch('modules.transcript_processor.genai.Client')
+    def test_failures_are_not_cached(self, mock_genai_client):
+        """Test failed cleanings are retried on the next delivery"""
+        processor = TranscriptProcessor()
+        processor.client.models.generate_content.side_effect = Exception("API Error")
+
+        processor.process_transcript("raw transcript text")
+
+        assert len(processor._clean_cache) == 0
+
+
 class TestTranscriptProcessorBatch:
     """Test batch processing functionality"""
 
@@ -12,7 +12,7 @@ from modules.workspace_automation import WorkspaceAutomation
 class TestWorkspaceAutomationInit:
     """Test WorkspaceAutomation initialization"""
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     @patch('modules.workspace_automation.GeminiConfig')
     def test_init_success(self, mock_config, mock_genai_client):
         """Test successful initialization"""
@@ -27,7 +27,7 @@ class TestWorkspaceAutomationInit:
         assert automation.gemini_model_name == "models/gemini-2.5-pro"
         mock_genai_client.assert_called_once()
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     @patch('modules.workspace_automation.GeminiConfig.validate')
     def test_init_config_validation(self, mock_validate, mock_genai_client):
         """Test that config validation is called during init"""
@@ -38,7 +38,7 @@ class TestWorkspaceAutomationInit:
 class TestAuthentication:
     """Test Google Workspace authentication"""
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open, read_data=b'fake_creds')
     @patch('pickle.load')
@@ -79,7 +79,7 @@ class TestAuthentication:
             assert automation.calendar_service == mock_calendar
             assert automation.slides_service == mock_slides
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     @patch('os.path.exists')
     def test_authenticate_no_credentials_file(self, mock_exists, mock_genai_client):
         """Test authentication when no credentials file exists"""
@@ -91,7 +91,7 @@ class TestAuthentication:
         assert result == False
         assert automation.credentials is None
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     @patch('os.path.exists')
     @patch('builtins.open', new_callable=mock_open, read_data=b'fake_creds')
     @patch('pickle.load')
@@ -120,7 +120,7 @@ class TestAuthentication:
 class TestOAuthFlow:
     """Test OAuth2 authorization flow"""
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     @patch('os.path.exists')
     def test_get_authorization_url_success(self, mock_exists, mock_genai_client):
         """Test getting authorization URL"""
@@ -132,7 +132,7 @@ class TestOAuthFlow:
 
         assert result is None
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_generate_email_content(self, mock_genai_client):
         """Test email content generation"""
         automation = WorkspaceAutomation()
@@ -150,7 +150,7 @@ class TestOAuthFlow:
 class TestCalendarIntegration:
     """Test calendar automation features"""
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_list_calendar_events_success(self, mock_genai_client):
         """Test listing calendar events"""
         automation = WorkspaceAutomation()
@@ -164,7 +164,7 @@ class TestCalendarIntegration:
         assert len(result) == 1
         assert result[0]["id"] == "event1"
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_list_calendar_events_no_service(self, mock_genai_client):
         """Test listing events without calendar service"""
         automation = WorkspaceAutomation()
@@ -174,7 +174,7 @@ class TestCalendarIntegration:
 
         assert result == []
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_create_calendar_event_success(self, mock_genai_client):
         """Test successful calendar event creation"""
         automation = WorkspaceAutomation()
@@ -189,7 +189,7 @@ class TestCalendarIntegration:
 
         assert result == "event123"
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_create_calendar_event_no_service(self, mock_genai_client):
         """Test calendar event creation without service"""
         automation = WorkspaceAutomation()
@@ -203,7 +203,7 @@ class TestCalendarIntegration:
 
         assert result == []
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_parse_event_times(self, mock_genai_client):
         """Test parsing natural language event times"""
         automation = WorkspaceAutomation()
@@ -225,7 +225,7 @@ class TestCalendarIntegration:
 class TestSlidesIntegration:
     """Test Google Slides automation"""
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_create_presentation_success(self, mock_genai_client):
         """Test successful presentation creation"""
         automation = WorkspaceAutomation()
@@ -246,7 +246,7 @@ class TestSlidesIntegration:
 
         assert result == "pres123"
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_create_presentation_no_service(self, mock_genai_client):
         """Test presentation creation without slides service"""
         automation = WorkspaceAutomation()
@@ -260,7 +260,7 @@ class TestSlidesIntegration:
 class TestTranscriptAnalysis:
     """Test transcript analysis for automation decisions"""
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_read_recent_emails_success(self, mock_genai_client):
         """Test reading recent emails"""
         automation = WorkspaceAutomation()
@@ -291,7 +291,7 @@ class TestTranscriptAnalysis:
         assert result[0]["subject"] == "Test Subject"
         assert result[0]["from"] == "sender@example.com"
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_read_recent_emails_no_service(self, mock_genai_client):
         """Test reading emails without Gmail service"""
         automation = WorkspaceAutomation()
@@ -305,7 +305,7 @@ class TestTranscriptAnalysis:
 class TestErrorHandling:
     """Test error handling in workspace automation"""
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_authenticate_exception_handling(self, mock_genai_client):
         """Test exception handling during authentication"""
         automation = WorkspaceAutomation()
@@ -314,7 +314,7 @@ class TestErrorHandling:
             result = automation.authenticate()
             assert result == False
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_email_creation_gemini_error(self, mock_genai_client):
         """Test handling Gemini API errors in email creation"""
         automation = WorkspaceAutomation()
@@ -324,7 +324,7 @@ class TestErrorHandling:
 
         assert result is None
 
-    @patch('modules.workspace_automation.genai.Client')
+    @patch('google.genai.Client')
     def test_calendar_event_creation_error(self, mock_genai_client):
         """Test handling calendar API errors"""
         automation = WorkspaceAutomation()
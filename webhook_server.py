@@ -3,14 +3,17 @@ FastAPI Webhook Server
 Receives webhooks from OMI app and triggers processing pipeline
 """
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
 import sys
 import json
+import orjson
 from datetime import datetime
 import re
 from typing import Optional
@@ -139,6 +142,11 @@ async def lifespan(app: FastAPI):
         "debug": AppSettings.DEBUG
     })
 
+    # Webhooks run their blocking Gemini and OMI calls in the default executor
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=WebhookConfig.WORKER_THREADS)
+    )
+
     try:
         orchestrator = OMIGeminiOrchestrator()
         monitoring.set_orchestrator(orchestrator)
@@ -249,7 +257,7 @@ async def metrics_endpoint():
     metrics_data = monitoring.get_metrics()
     return metrics_data
 
-@app.get("/alerts")
+@app.get("/alerts", response_class=ORJSONResponse)
 async def alerts_endpoint():
     """Active alerts endpoint"""
     alerts_data = monitoring.get_alerts()
@@ -313,8 +321,8 @@ async def generic_webhook(request: Request):
     Logs the request body for debugging/testing purposes.
     """
     try:
-        body = await request.json()
-        logger.info(f"Received generic webhook (v1.1): {json.dumps(body, indent=2)}")
+        body = orjson.loads(await request.body())
+        logger.info(f"Received generic webhook (v1.1): {orjson.dumps(body, option=orjson.OPT_INDENT_2).decode()}")
         return {"status": "received", "version": "1.1", "body": body}
     except Exception as e:
         logger.error(f"Error processing generic webhook: {e}")
@@ -356,12 +364,10 @@ async def memory_creation_webhook(request: Request):
         # Validate signature (optional, reads body if enabled)
         validated_body = await _validate_webhook_signature(request)
 
-        # Parse memory data (use validated body if available)
+        # Parse memory data (use validated body if available);
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         try:
-            if validated_body:
-                memory_data = json.loads(validated_body)
-            else:
-                memory_data = await request.json()
+            memory_data = orjson.loads(validated_body or await request.body())
         except json.JSONDecodeError as e:
             logger.error("Invalid JSON in webhook body", exc_info=True, extra={
                 "uid": uid,
@@ -481,10 +487,7 @@ async def realtime_transcript_webhook(request: Request):
 
         # Parse segments (use validated body if available)
         try:
-            if validated_body:
-                segments = json.loads(validated_body)
-            else:
-                segments = await request.json()
+            segments = orjson.loads(validated_body or await request.body())
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in realtime webhook body: {str(e)}")
             raise HTTPException(status_code=400, detail="Invalid JSON in request body")